@@ -7,17 +7,27 @@ __version__ = "1.2.0"
 __author__ = "OSINT Security Community"
 
 from .models import SearchResult
+from .columns import ResultColumns
 from .security import CredentialManager
 from .rate_limiter import AdvancedRateLimiter
 from .engine import DorkEngine
 from .bookmarks import BookmarksManager
 from .exporter import ExportManager
+from .session import HttpSessionManager
+from .cache import ResponseCache
+from .key_pool import KeyPool
+from .result_query import ResultQuery
 
 __all__ = [
     "SearchResult",
+    "ResultColumns",
     "CredentialManager",
     "AdvancedRateLimiter",
     "DorkEngine",
     "BookmarksManager",
     "ExportManager",
+    "HttpSessionManager",
+    "ResponseCache",
+    "KeyPool",
+    "ResultQuery",
 ]
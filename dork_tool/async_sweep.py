@@ -0,0 +1,272 @@
+"""
+asyncio-based sweep engine for running generated dorks with bounded concurrency.
+Version 1.2.0
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import SearchResult
+from .search_core import PageResponse, SearchClient
+from .dedup import HashedSeenSet, canonical_url
+from .journal import SweepJournal
+from .local_eval import LocalDorkEvaluator
+from .findings_store import FindingsStore
+from .columns import ResultColumns
+
+
+class AsyncSweepEngine:
+    """
+    Runs (category, query) dorks from a list or any lazy iterable on an asyncio event loop.
+    Up to max_concurrency requests are in flight at once while the rate limiter
+    still spaces out when each one is sent, so throughput is bounded by the rate
+    cap instead of by round-trip latency. Blocking SearchClient requests are handed
+    to a small thread pool; quota checks and send-slot reservation stay on the loop thread.
+
+    Progress is reported through plain callbacks so the engine has no Qt dependency.
+    Dorks are pulled from the iterable only as consumers free up, so generators of
+    arbitrary length are never materialized. With keep_results=False findings are
+    only passed to on_results and not accumulated; kept findings are stored in a
+    columnar ResultColumns. Findings are deduplicated by
+    canonical URL (canonical_url) in a hashed seen-set kept for the whole sweep.
+
+    With a SweepJournal attached, completed units are checkpointed as they finish
+    and units already in the journal are replayed from disk without any request.
+
+    Transient failures (429/5xx/timeouts) are retried per the client's RetryPolicy;
+    a backing-off dork sleeps on the loop without holding a send slot.
+
+    With reuse_results, a LocalDorkEvaluator answers dorks that only narrow a
+    broader dork with complete results. A list of dorks is reordered so broader
+    dorks run first, and a narrower dork waits for a broader one still in flight.
+
+    With a FindingsStore attached, every fetched page is queued for batched
+    writes and the remainder is flushed when the sweep ends.
+    """
+
+    def __init__(self, client: SearchClient, dork_list: Iterable[Tuple[str, str]],
+                 max_per_dork: int = 5, max_concurrency: int = 4,
+                 keep_results: bool = True,
+                 journal: Optional[SweepJournal] = None,
+                 reuse_results: bool = True,
+                 findings_store: Optional[FindingsStore] = None,
+                 on_dork_started: Optional[Callable[[str, str, int, int], None]] = None,
+                 on_results: Optional[Callable[[List[SearchResult]], None]] = None,
+                 on_progress: Optional[Callable[[int, str], None]] = None,
+                 on_error: Optional[Callable[[str], None]] = None):
+        self.client = client
+        self.rate_limiter = client.rate_limiter
+        self.dork_list = dork_list
+        self.keep_results = keep_results
+        self.journal = journal
+        self.findings_store = findings_store
+        self.max_per_dork = max_per_dork
+        self.max_concurrency = max(1, max_concurrency)
+        self.evaluator = (LocalDorkEvaluator(client.cache, client.cse_id, min(max_per_dork, 10))
+                          if reuse_results else None)
+        self.on_dork_started = on_dork_started or (lambda *a: None)
+        self.on_results = on_results or (lambda r: None)
+        self.on_progress = on_progress or (lambda p, m: None)
+        self.on_error = on_error or (lambda m: None)
+
+        self.results = ResultColumns()
+        self.result_count = 0
+        self._seen_links = HashedSeenSet()
+        self._inflight = 0
+        self._running: Dict[str, asyncio.Event] = {}  # query -> set when that dork is done
+        self._completed = 0
+        self._failed = 0
+        self._halted = False       # fatal error: stop scheduling and drop queued sends
+        self._exhausted = False    # quota spoken for: stop scheduling, let in-flight sends finish
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+        self.client.cancel()
+
+    def run(self) -> ResultColumns:
+        """Runs the sweep on a fresh event loop in the calling thread."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> ResultColumns:
+        loop = asyncio.get_running_loop()
+        if self.evaluator is not None and isinstance(self.dork_list, list):
+            self.dork_list = LocalDorkEvaluator.broad_first(self.dork_list)
+        # Lazy iterables have no length; progress then reports counts only.
+        total = len(self.dork_list) if hasattr(self.dork_list, "__len__") else 0
+        dorks = iter(enumerate(self.dork_list, start=1))
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self.client.retry_policy.start()
+        if self._is_cancelled:
+            self.client.cancel()
+
+        async def consumer():
+            # Consumers share one iterator, so at most max_concurrency dorks are active.
+            for idx, (cat_name, query) in dorks:
+                if self._is_cancelled or self._halted or self._exhausted:
+                    break
+                await self._run_dork(loop, executor, idx, total, cat_name, query)
+
+        finished = False
+        try:
+            consumers = self.max_concurrency if not total else min(self.max_concurrency, total)
+            await asyncio.gather(*(consumer() for _ in range(consumers)))
+            finished = not (self._is_cancelled or self._halted or self._exhausted or self._failed)
+        finally:
+            executor.shutdown(wait=False)
+            if self.findings_store is not None:
+                self.findings_store.flush()
+            if self.journal is not None:
+                # Ctrl+C or task cancellation lands here with no flag set; only a
+                # sweep that ran to the end may close its journal for good.
+                if finished:
+                    self.journal.mark_finished()
+                else:
+                    self.journal.close()
+        return self.results
+
+    def _halt(self, message: str):
+        if not self._halted:
+            self._halted = True
+            self.on_error(message)
+
+    async def _run_dork(self, loop, executor, idx: int, total: int, cat_name: str, query: str):
+        done = asyncio.Event()
+        self._running[query] = done
+        try:
+            await self._run_dork_unit(loop, executor, idx, total, cat_name, query)
+        finally:
+            done.set()
+            if self._running.get(query) is done:
+                del self._running[query]
+
+    async def _answer_locally(self, cat_name: str, query: str) -> Optional[PageResponse]:
+        # Broader dorks still in flight may complete the set this one narrows.
+        for other, done in list(self._running.items()):
+            if other != query and self.evaluator.refines(query, other):
+                await done.wait()
+        local = self.evaluator.answer(query, cat_name)
+        if local is None:
+            return None
+        return PageResponse(results=local, total_available=len(local), status_code=200, local=True)
+
+    async def _run_dork_unit(self, loop, executor, idx: int, total: int, cat_name: str, query: str):
+        num = min(self.max_per_dork, 10)
+        response = None
+        replayed = False
+        if self.journal is not None and self.journal.has_unit(query, 1):
+            stored = self.journal.load_unit(query, 1)
+            if stored is not None:
+                response = PageResponse(results=stored, status_code=200, from_cache=True)
+                replayed = True
+        if response is None:
+            response = self.client.cached_page(query, 1, num, category=cat_name)
+        if response is None and self.evaluator is not None:
+            response = await self._answer_locally(cat_name, query)
+
+        if response is None and not await self._quota_left():
+            return
+
+        self.on_dork_started(cat_name, query, idx, total)
+
+        if response is None:
+            response = await self._fetch_with_retry(loop, executor, cat_name, query, num)
+            if response is None:
+                return
+            if not response.ok:
+                self._failed += 1
+                if response.fatal:
+                    self._halt(response.error)
+                else:
+                    self.on_error(response.error)
+                return
+
+        if self.journal is not None and not replayed:
+            self.journal.record_unit(cat_name, query, 1, num, response.results)
+        if self.evaluator is not None:
+            self.evaluator.record(query, response.results, response.total_available, num)
+        if self.findings_store is not None:
+            self.findings_store.queue(response.results)
+
+        self._completed += 1
+        new_results = []
+        for sr in response.results:
+            if sr.link and self._seen_links.add(canonical_url(sr.link)):
+                new_results.append(sr)
+        self.result_count += len(new_results)
+        if self.keep_results:
+            self.results.extend(new_results)
+        self.on_results(new_results)
+        verb = "Answered locally" if response.local else "Completed"
+        if total:
+            self.on_progress(
+                int((self._completed / total) * 100),
+                f"[{self._completed}/{total}] {verb} {cat_name}: {query[:35]}..."
+            )
+        else:
+            self.on_progress(0, f"[{self._completed}] {verb} {cat_name}: {query[:35]}...")
+
+    async def _fetch_with_retry(self, loop, executor, cat_name: str, query: str,
+                                num: int) -> Optional[PageResponse]:
+        policy = self.client.retry_policy
+        attempt = 1
+        while True:
+            response = await self._fetch(loop, executor, cat_name, query, num)
+            if response is None or not policy.is_retryable(response):
+                return response
+            backoff = policy.next_delay(attempt, response.retry_after)
+            if backoff is None:
+                if attempt > 1:
+                    response.error = f"{response.error} (gave up after {attempt} attempts)"
+                return response
+            if not await self._sleep(backoff) or not await self._quota_left():
+                return None
+            attempt += 1
+
+    async def _sleep(self, delay: float) -> bool:
+        """Sleeps in short slices so cancel() takes effect promptly; False if interrupted."""
+        loop = asyncio.get_running_loop()
+        end = loop.time() + delay
+        while not (self._is_cancelled or self._halted):
+            remaining = end - loop.time()
+            if remaining <= 0:
+                return True
+            await asyncio.sleep(min(0.1, remaining))
+        return False
+
+    async def _quota_left(self) -> bool:
+        """
+        True if quota remains after the requests already in flight. In-flight
+        requests may already be counted by the limiter, so when the estimate hits
+        zero this waits for them to land and re-checks before giving up.
+        """
+        while True:
+            can_req, msg = self.rate_limiter.can_request()
+            _, _, remaining = self.rate_limiter.get_stats()
+            if can_req and remaining - self._inflight > 0:
+                return True
+            if self._halted or self._is_cancelled:
+                return False
+            if not can_req or self._inflight == 0 or self._exhausted:
+                break
+            await asyncio.sleep(0.05)
+        if not self._exhausted:
+            self._exhausted = True
+            self.on_error(msg or "Daily quota reached. Quota resets at 00:00 UTC.")
+        return False
+
+    async def _fetch(self, loop, executor, cat_name: str, query: str, num: int) -> Optional[PageResponse]:
+        self._inflight += 1
+        try:
+            delay = self.rate_limiter.acquire()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self._is_cancelled or self._halted:
+                return None
+            return await loop.run_in_executor(
+                executor, functools.partial(self.client.request_page, query, 1, num, cat_name)
+            )
+        finally:
+            self._inflight -= 1
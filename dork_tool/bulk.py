@@ -0,0 +1,58 @@
+"""
+Bulk multi-target sweeps: streams targets from a list file and generates dorks lazily.
+Version 1.2.0
+"""
+
+from typing import Iterable, Iterator, List, Tuple
+
+from .engine import DorkEngine
+from .dedup import HashedSeenSet
+
+
+def iter_targets(filepath: str) -> Iterator[str]:
+    """
+    Yields one target per line from a text file without loading it whole.
+    Blank lines and lines starting with '#' are skipped.
+    """
+    with open(filepath, "r", encoding="utf-8-sig", errors="replace") as f:
+        for line in f:
+            target = line.strip()
+            if target and not target.startswith("#"):
+                yield target
+
+
+def count_targets(filepath: str) -> int:
+    """Counts targets in a list file with a single streaming pass."""
+    return sum(1 for _ in iter_targets(filepath))
+
+
+class BulkDorkGenerator:
+    """
+    Iterable of (category, query) pairs across many targets. Each target is
+    classified with DorkEngine.detect_target_type and its dorks are generated only
+    when the scheduler reaches it. Queries already produced for an earlier target
+    are skipped using a hashed seen-set shared across the whole run.
+    """
+
+    def __init__(self, targets: Iterable[str], selected_categories: List[str],
+                 target_type: str = "AUTO"):
+        self.targets = targets
+        self.selected_categories = selected_categories
+        self.target_type = target_type
+        self.seen_queries = HashedSeenSet()
+        self.targets_processed = 0
+        self.duplicates_skipped = 0
+        self.current_target = ""
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for target in self.targets:
+            self.current_target = target
+            self.targets_processed += 1
+            t_type = self.target_type
+            if t_type == "AUTO":
+                t_type = DorkEngine.detect_target_type(target)
+            for cat_name, query in DorkEngine.generate_dorks(target, self.selected_categories, target_type=t_type):
+                if self.seen_queries.add(" ".join(query.split())):
+                    yield cat_name, query
+                else:
+                    self.duplicates_skipped += 1
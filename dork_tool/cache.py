@@ -0,0 +1,167 @@
+"""
+Persistent Custom Search API response cache with per-entry TTL and LRU eviction.
+Version 1.2.0
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .models import SearchResult
+
+
+class ResponseCache:
+    """
+    On-disk cache of API result pages keyed by (cx, normalized query, start, num).
+    Entries expire after their TTL and the least recently used entries are evicted
+    once max_entries is exceeded. Stored in ~/.google_dorking_tool/response_cache.db
+    """
+
+    _shared: Optional["ResponseCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path: Optional[str] = None, ttl_seconds: int = 24 * 3600,
+                 max_entries: int = 5000):
+        self.db_path = db_path or os.path.join(
+            os.path.expanduser("~"), ".google_dorking_tool", "response_cache.db"
+        )
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._open()
+
+    @classmethod
+    def shared(cls) -> "ResponseCache":
+        """Returns the process-wide cache, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _open(self):
+        try:
+            d = os.path.dirname(self.db_path)
+            if d and not os.path.exists(d):
+                os.makedirs(d, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                " key TEXT PRIMARY KEY,"
+                " payload TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_access ON pages(last_access)")
+            self._conn.commit()
+        except Exception as e:
+            print(f"[ERROR] Response cache unavailable: {e}")
+            self._conn = None
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Collapses whitespace so cosmetic edits to a dork share one entry."""
+        return " ".join(query.split())
+
+    @staticmethod
+    def make_key(cx: str, query: str, start: int, num: int) -> str:
+        raw = "\x1f".join((cx.strip(), ResponseCache.normalize_query(query), str(start), str(num)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, cx: str, query: str, start: int, num: int,
+            category: str = "Manual") -> Optional[Tuple[List[SearchResult], int]]:
+        """
+        Returns (results, total_available) for a fresh entry, or None on a miss.
+        Results are relabelled with the caller's category and query.
+        """
+        if self._conn is None:
+            return None
+        key = self.make_key(cx, query, start, num)
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT payload, expires_at FROM pages WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                if row[1] < now:
+                    self._conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE pages SET last_access = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+                self.hits += 1
+            except Exception:
+                self.misses += 1
+                return None
+
+        data = json.loads(row[0])
+        results = []
+        for item in data.get("results", []):
+            r = SearchResult.from_dict(item)
+            r.category = category
+            r.query = query
+            results.append(r)
+        return results, data.get("total", 0)
+
+    def put(self, cx: str, query: str, start: int, num: int,
+            results: List[SearchResult], total_available: int,
+            ttl_seconds: Optional[int] = None):
+        """Stores a fetched page and evicts expired and least recently used entries."""
+        if self._conn is None:
+            return
+        key = self.make_key(cx, query, start, num)
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        payload = json.dumps({
+            "total": total_available,
+            "results": [r.to_dict() for r in results]
+        }, ensure_ascii=False)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages (key, payload, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, payload, now + ttl, now)
+                )
+                self._conn.execute("DELETE FROM pages WHERE expires_at < ?", (now,))
+                self._conn.execute(
+                    "DELETE FROM pages WHERE key IN ("
+                    " SELECT key FROM pages ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+                self._conn.commit()
+            except Exception as e:
+                print(f"[ERROR] Failed to write response cache: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns hit/miss counters and the number of stored entries."""
+        entries = 0
+        if self._conn is not None:
+            with self._lock:
+                try:
+                    entries = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+                except Exception:
+                    entries = 0
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def clear(self) -> bool:
+        """Deletes every cached page."""
+        if self._conn is None:
+            return False
+        with self._lock:
+            try:
+                self._conn.execute("DELETE FROM pages")
+                self._conn.commit()
+                return True
+            except Exception as e:
+                print(f"[ERROR] Failed to clear response cache: {e}")
+                return False
@@ -0,0 +1,421 @@
+"""
+Headless command-line sweep runner (no Qt required).
+Version 1.2.0
+
+Examples:
+    google-dorking-cli dorks target.com
+    google-dorking-cli sweep target.com --categories files,credentials -o findings.csv
+    google-dorking-cli search 'site:target.com filetype:pdf' -n 30 --format json
+    google-dorking-cli bulk targets.txt --categories basic_info,files --format json
+    google-dorking-cli bulk targets.txt -o findings.ndjson
+    google-dorking-cli merge a.ndjson b.ndjson --where 'filetype:pdf -inurl:blog' -o merged.csv
+    google-dorking-cli merge findings.ndjson -o archive.ndjson.xz
+"""
+
+import os
+import sys
+import json
+import argparse
+from typing import Callable, Iterable, List, Optional
+
+from . import __version__
+from .models import SearchResult
+from .engine import DorkEngine
+from .security import CredentialManager
+from .rate_limiter import AdvancedRateLimiter
+from .key_pool import KeyPool
+from .cache import ResponseCache
+from .findings_store import FindingsStore
+from .exporter import ExportManager, NdjsonReader, NdjsonWriter, NDJSON_EXTENSIONS, COMPRESSORS, format_extension
+from .result_query import ResultQuery
+from .dedup import HashedSeenSet, canonical_url
+from .search_core import SearchClient
+from .async_sweep import AsyncSweepEngine
+from .bulk import BulkDorkGenerator, iter_targets
+from .journal import SweepJournal
+from .retry import RetryPolicy
+
+
+EXPORTERS = {
+    ".csv": ExportManager.export_csv,
+    ".json": ExportManager.export_json,
+    ".ndjson": ExportManager.export_ndjson,
+    ".jsonl": ExportManager.export_ndjson,
+    ".html": ExportManager.export_html,
+    ".htm": ExportManager.export_html,
+    ".md": ExportManager.export_markdown,
+    ".txt": ExportManager.export_txt,
+}
+
+
+def _log(message: str):
+    print(message, file=sys.stderr, flush=True)
+
+
+def _emit(result: SearchResult, fmt: str):
+    if fmt == "json":
+        line = json.dumps(result.to_dict(), ensure_ascii=False)
+    else:
+        line = f"{result.category}\t{result.link}\t{result.title}"
+    print(line, flush=True)
+
+
+def _export(path: str, results: Iterable[SearchResult], query: str) -> bool:
+    ext = format_extension(path)
+    exporter = EXPORTERS.get(ext)
+    if exporter is None:
+        _log(f"[ERROR] Unsupported output extension '{ext}'. Use one of: {', '.join(sorted(EXPORTERS))}, "
+             f"optionally followed by {'/'.join(COMPRESSORS)}")
+        return False
+    if exporter in (ExportManager.export_csv, ExportManager.export_json, ExportManager.export_ndjson):
+        return exporter(path, results)
+    return exporter(path, results, query)
+
+
+def _resolve_categories(spec: Optional[str]) -> List[str]:
+    known = [c[0] for c in DorkEngine.CATEGORIES]
+    if not spec:
+        return [c[0] for c in DorkEngine.CATEGORIES if c[2]]
+    if spec.strip().lower() == "all":
+        return known
+    selected = [c.strip() for c in spec.split(",") if c.strip()]
+    unknown = [c for c in selected if c not in known]
+    if unknown:
+        raise ValueError(f"Unknown categories: {', '.join(unknown)}. Known: {', '.join(known)}")
+    return selected
+
+
+def _build_client(args) -> SearchClient:
+    api_key = args.api_key or ""
+    cse_id = args.cse_id or ""
+    cred_mgr = CredentialManager()
+    if not (api_key and cse_id):
+        stored_key, stored_cse = cred_mgr.load()
+        api_key = api_key or stored_key
+        cse_id = cse_id or stored_cse
+    cache = None if args.no_cache else ResponseCache()
+
+    limiter = AdvancedRateLimiter(daily_limit=args.daily_limit)
+    pooled = [] if args.single_key else cred_mgr.load_pool()
+    if pooled:
+        pool = KeyPool.from_credentials((api_key, cse_id), pooled, daily_limit=args.daily_limit)
+        if len(pool) > 1:
+            limiter.close()
+            limiter = pool
+            if not (api_key and cse_id):
+                api_key, cse_id = pool.keys[0].api_key, pool.keys[0].cse_id
+            _log(f"[*] Rotating across {len(pool)} pooled API keys.")
+        else:
+            pool.close()
+    retry = RetryPolicy(max_attempts=args.max_attempts, sweep_deadline=args.deadline or None)
+    retry.start()
+    return SearchClient(api_key, cse_id, limiter, response_cache=cache, retry_policy=retry)
+
+
+def _open_journal(args, client: SearchClient, label: str, *id_parts: str) -> SweepJournal:
+    journal = SweepJournal(SweepJournal.sweep_id_for(client.cse_id, *id_parts), label=label)
+    if args.fresh or journal.finished:
+        journal.discard()
+    elif journal.is_resumable:
+        _log(f"[*] Resuming interrupted sweep: {journal.completed_units} completed queries will be replayed from the journal.")
+    return journal
+
+
+def _open_store(args) -> Optional[FindingsStore]:
+    return None if args.no_store else FindingsStore()
+
+
+def _open_stream(args) -> Optional[NdjsonWriter]:
+    """
+    For a JSON Lines --output, a writer that appends findings as they arrive
+    instead of exporting them when the sweep ends.
+    """
+    if not args.output or format_extension(args.output) not in NDJSON_EXTENSIONS:
+        return None
+    try:
+        return NdjsonWriter(args.output)
+    except OSError as e:
+        raise ValueError(f"Cannot write {args.output}: {e}")
+
+
+def _sink(args, stream: Optional[NdjsonWriter]) -> Callable[[List[SearchResult]], None]:
+    def on_results(new: List[SearchResult]):
+        for r in new:
+            _emit(r, args.format)
+        if stream is not None:
+            stream.write(new)
+    return on_results
+
+
+def cmd_dorks(args) -> int:
+    categories = _resolve_categories(args.categories)
+    for cat_name, query in DorkEngine.generate_dorks(args.target, categories, target_type=args.type):
+        print(f"{cat_name}\t{query}")
+    return 0
+
+
+def cmd_search(args) -> int:
+    client = _build_client(args)
+    if not client.has_credentials:
+        _log("[ERROR] API Key and CSE ID are required (flags, GOOGLE_API_KEY/GOOGLE_CSE_ID, or saved credentials).")
+        return 2
+
+    results, _ = client.fetch_results(
+        args.query, args.num, category=args.category, concurrency=args.concurrent_pages,
+        on_progress=lambda pct, msg: None if args.quiet else _log(f"[{pct:3d}%] {msg}"),
+        on_error=lambda msg: _log(f"[ERROR] {msg}")
+    )
+    for r in results:
+        _emit(r, args.format)
+
+    store = _open_store(args)
+    if store is not None:
+        store.add(results)
+    if args.output and not _export(args.output, results, args.query):
+        return 1
+    used, limit, rem = client.rate_limiter.get_stats()
+    _log(f"[OK] {len(results)} results. Quota: {used}/{limit} ({rem} remaining)")
+    return 0
+
+
+def cmd_sweep(args) -> int:
+    categories = _resolve_categories(args.categories)
+    dork_list = DorkEngine.generate_dorks(args.target, categories, target_type=args.type)
+    if not dork_list:
+        _log("[ERROR] No queries could be generated for the target.")
+        return 2
+
+    client = _build_client(args)
+    if not client.has_credentials:
+        _log("[ERROR] API Key and CSE ID are required (flags, GOOGLE_API_KEY/GOOGLE_CSE_ID, or saved credentials).")
+        return 2
+
+    journal = _open_journal(
+        args, client, args.target, "target", args.target, args.type,
+        ",".join(sorted(categories)), str(args.max_per_dork)
+    )
+    stream = _open_stream(args)
+    engine = AsyncSweepEngine(
+        client=client,
+        dork_list=dork_list,
+        max_per_dork=args.max_per_dork,
+        max_concurrency=args.concurrency,
+        journal=journal,
+        reuse_results=not args.no_reuse,
+        findings_store=_open_store(args),
+        on_results=_sink(args, stream),
+        on_progress=lambda pct, msg: None if args.quiet else _log(f"[{pct:3d}%] {msg}"),
+        on_error=lambda msg: _log(f"[ERROR] {msg}")
+    )
+    _log(f"[*] Sweeping {len(dork_list)} queries for target: {args.target}")
+    try:
+        results = engine.run()
+    except KeyboardInterrupt:
+        engine.cancel()
+        results = engine.results
+        _log("[!] Sweep interrupted.")
+    finally:
+        if stream is not None:
+            stream.close()
+
+    if args.output and stream is None and not _export(args.output, results, f"Target: {args.target}"):
+        return 1
+    used, limit, rem = client.rate_limiter.get_stats()
+    _log(f"[OK] {len(results)} findings. Quota: {used}/{limit} ({rem} remaining)")
+    return 0
+
+
+def cmd_bulk(args) -> int:
+    categories = _resolve_categories(args.categories)
+    if not os.path.isfile(args.targets_file):
+        _log(f"[ERROR] Target list not found: {args.targets_file}")
+        return 2
+
+    client = _build_client(args)
+    if not client.has_credentials:
+        _log("[ERROR] API Key and CSE ID are required (flags, GOOGLE_API_KEY/GOOGLE_CSE_ID, or saved credentials).")
+        return 2
+
+    journal = _open_journal(
+        args, client, os.path.basename(args.targets_file), "bulk", os.path.abspath(args.targets_file),
+        str(os.path.getmtime(args.targets_file)), ",".join(sorted(categories)), str(args.max_per_dork)
+    )
+    generator = BulkDorkGenerator(iter_targets(args.targets_file), categories, target_type=args.type)
+    # Findings are only held in memory for an export file written at the end;
+    # JSON Lines output is appended as they arrive.
+    stream = _open_stream(args)
+    engine = AsyncSweepEngine(
+        client=client,
+        dork_list=generator,
+        max_per_dork=args.max_per_dork,
+        max_concurrency=args.concurrency,
+        keep_results=bool(args.output) and stream is None,
+        journal=journal,
+        reuse_results=not args.no_reuse,
+        findings_store=_open_store(args),
+        on_results=_sink(args, stream),
+        on_progress=lambda pct, msg: None if args.quiet else _log(
+            f"[target {generator.targets_processed}: {generator.current_target}] {msg}"
+        ),
+        on_error=lambda msg: _log(f"[ERROR] {msg}")
+    )
+    _log(f"[*] Bulk sweep from: {args.targets_file}")
+    try:
+        engine.run()
+    except KeyboardInterrupt:
+        engine.cancel()
+        _log("[!] Sweep interrupted.")
+    finally:
+        if stream is not None:
+            stream.close()
+
+    if args.output and stream is None and not _export(args.output, engine.results, f"Targets: {os.path.basename(args.targets_file)}"):
+        return 1
+    used, limit, rem = client.rate_limiter.get_stats()
+    _log(f"[OK] {generator.targets_processed} targets, {engine.result_count} findings, "
+         f"{generator.duplicates_skipped} duplicate queries skipped. Quota: {used}/{limit} ({rem} remaining)")
+    return 0
+
+
+def cmd_merge(args) -> int:
+    for path in args.inputs:
+        if path != "-" and not os.path.isfile(path):
+            _log(f"[ERROR] Input not found: {path}")
+            return 2
+    query = ResultQuery(args.where) if args.where else None
+    readers = [NdjsonReader(path) for path in args.inputs]
+    seen = HashedSeenSet()
+    counts = {"kept": 0, "dropped": 0}
+
+    def merged():
+        for reader in readers:
+            for r in reader:
+                if query is not None and not query.matches(r):
+                    counts["dropped"] += 1
+                    continue
+                if not args.keep_duplicates and not seen.add(
+                        f"{canonical_url(r.link)}\x1f{r.query}\x1f{r.category}"):
+                    counts["dropped"] += 1
+                    continue
+                counts["kept"] += 1
+                yield r
+
+    if args.output:
+        if not _export(args.output, merged(), f"Merged: {', '.join(map(os.path.basename, args.inputs))}"):
+            return 1
+    else:
+        with NdjsonWriter(sys.stdout) as writer:
+            writer.write(merged())
+
+    skipped = sum(reader.skipped for reader in readers)
+    if skipped:
+        _log(f"[WARN] Skipped {skipped} lines that are not JSON objects.")
+    _log(f"[OK] {counts['kept']} findings merged from {len(readers)} inputs, "
+         f"{counts['dropped']} filtered out or duplicate.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="google-dorking-cli",
+        description="Headless Google dork generation and Custom Search API sweeps."
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_category_args(p):
+        p.add_argument("-c", "--categories", help="Comma-separated category ids, or 'all' (default: recon defaults)")
+        p.add_argument("-t", "--type", default="AUTO", choices=["AUTO", "DOMAIN", "EMAIL", "PERSON", "KEYWORD"],
+                       help="Target type override")
+
+    def add_target_args(p):
+        p.add_argument("target", help="Domain, email, person name, or username")
+        add_category_args(p)
+
+    def add_sweep_args(p):
+        p.add_argument("--max-per-dork", type=int, default=5, help="Results per dork (max 10)")
+        p.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once")
+        p.add_argument("-q", "--quiet", action="store_true", help="Suppress progress lines on stderr")
+        p.add_argument("--fresh", action="store_true",
+                       help="Discard any checkpoint journal instead of resuming an interrupted sweep")
+
+    def add_api_args(p):
+        p.add_argument("--api-key", help="Overrides GOOGLE_API_KEY and saved credentials")
+        p.add_argument("--cse-id", help="Overrides GOOGLE_CSE_ID and saved credentials")
+        p.add_argument("--daily-limit", type=int, default=100, help="Local daily quota ceiling (per key)")
+        p.add_argument("--single-key", action="store_true",
+                       help="Ignore pooled keys (GOOGLE_API_KEYS / saved key pool) and use one key")
+        p.add_argument("--no-cache", action="store_true", help="Bypass the on-disk response cache")
+        p.add_argument("--no-store", action="store_true",
+                       help="Do not save findings to the persistent findings store")
+        p.add_argument("--no-reuse", action="store_true",
+                       help="Always query the API, even for dorks answerable from broader dorks' results")
+        p.add_argument("--max-attempts", type=int, default=4,
+                       help="Sends per page before giving up on 429/5xx/timeouts (1 disables retries)")
+        p.add_argument("--deadline", type=float, default=0,
+                       help="Seconds after which no further retries are scheduled (0: no deadline)")
+        p.add_argument("-o", "--output",
+                       help="Export file (.csv, .json, .html, .md, .txt, or .ndjson/.jsonl, "
+                            "which sweeps append to as findings arrive); add .gz, .xz, or .bz2 to compress")
+        p.add_argument("-f", "--format", default="text", choices=["text", "json"],
+                       help="Stdout stream format: tab-separated text or one JSON object per line")
+
+    p_dorks = sub.add_parser("dorks", help="Print generated dorks without calling the API")
+    add_target_args(p_dorks)
+    p_dorks.set_defaults(func=cmd_dorks)
+
+    p_search = sub.add_parser("search", help="Run a single query")
+    p_search.add_argument("query", help="Dork query")
+    p_search.add_argument("-n", "--num", type=int, default=10, help="Results to fetch (max 100)")
+    p_search.add_argument("--category", default="Manual", help="Category label for results")
+    p_search.add_argument("-p", "--concurrent-pages", type=int, default=1,
+                          help="Pages after the first fetched in parallel (1: one at a time, max 10)")
+    p_search.add_argument("-q", "--quiet", action="store_true", help="Suppress progress lines on stderr")
+    add_api_args(p_search)
+    p_search.set_defaults(func=cmd_search)
+
+    p_sweep = sub.add_parser("sweep", help="Generate dorks for a target and run them all")
+    add_target_args(p_sweep)
+    add_api_args(p_sweep)
+    add_sweep_args(p_sweep)
+    p_sweep.set_defaults(func=cmd_sweep)
+
+    p_bulk = sub.add_parser("bulk", help="Sweep every target in a list file (one per line)")
+    p_bulk.add_argument("targets_file", help="Text file with one domain, email, name, or username per line")
+    add_category_args(p_bulk)
+    add_api_args(p_bulk)
+    add_sweep_args(p_bulk)
+    p_bulk.set_defaults(func=cmd_bulk)
+
+    p_merge = sub.add_parser("merge", help="Merge, filter, and deduplicate JSON Lines findings files")
+    p_merge.add_argument("inputs", nargs="+",
+                         help="Files (.ndjson/.jsonl, optionally .gz/.xz/.bz2) to read in order; '-' reads stdin")
+    p_merge.add_argument("-w", "--where", help="Keep only findings matching this dork-style filter")
+    p_merge.add_argument("--keep-duplicates", action="store_true",
+                         help="Keep repeated findings (same canonical URL, query, and category)")
+    p_merge.add_argument("-o", "--output", help="Export file (any export format); default: JSON Lines on stdout")
+    p_merge.set_defaults(func=cmd_merge)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        _log(f"[ERROR] {e}")
+        return 2
+    except BrokenPipeError:
+        # The reader went away (e.g. "| head"). Point stdout at devnull so the
+        # flush at interpreter exit does not raise again.
+        try:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        except (OSError, ValueError, AttributeError):
+            pass
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+Columnar, dictionary-encoded container for large result sets.
+Version 1.2.0
+"""
+
+import re
+from array import array
+from collections import Counter
+from collections.abc import Sequence as SequenceABC
+from itertools import compress
+from operator import and_
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .models import SearchResult, format_timestamp
+
+Row = Tuple[str, str, str, str, str, str]  # title, link, snippet, category, query, timestamp
+
+# Host part of an absolute URL (what urlsplit().hostname returns, without parsing the rest).
+_HOST = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://(?:[^/?#@]*@)?(?:\[([^\]/?#]*)\]|([^/?#:]*))")
+
+
+def _host_of(link: str) -> str:
+    m = _HOST.match(link)
+    return (m.group(1) or m.group(2) or "").lower() if m else ""
+
+
+class _Dictionary:
+    """Dictionary encoding of a string column: distinct values and their codes."""
+
+    __slots__ = ("values", "codes")
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, wanted: Union[str, Iterable[str]]) -> set:
+        """Codes of one value or a collection of values; unknown values are skipped."""
+        if isinstance(wanted, str):
+            wanted = (wanted,)
+        return {self.codes[v] for v in wanted if v in self.codes}
+
+
+class _ColumnStore:
+    """
+    The columns shared by a ResultColumns and every view taken from it.
+
+    Creation times are kept as stored on the SearchResult: epoch floats go in
+    a flat array and are formatted only when a row is read, while timestamp
+    strings (from the cache, journal, or findings store) are dictionary-encoded.
+    Timestamp code 0 marks a row whose time is in epochs.
+    """
+
+    def __init__(self):
+        self.titles: List[str] = []
+        self.links: List[str] = []
+        self.snippets: List[str] = []
+        self.dicts = {name: _Dictionary() for name in ("category", "query", "host", "timestamp")}
+        self.codes = {name: array("I") for name in self.dicts}
+        self.dicts["timestamp"].encode(None)  # code 0: see epochs
+        self.epochs = array("d")
+        self.category_totals = array("I")  # rows per category code
+
+    def add(self, r: SearchResult):
+        self.titles.append(r.title)
+        self.links.append(r.link)
+        self.snippets.append(r.snippet)
+        dicts, codes = self.dicts, self.codes
+        category = dicts["category"].encode(r.category)
+        codes["category"].append(category)
+        codes["query"].append(dicts["query"].encode(r.query))
+        codes["host"].append(dicts["host"].encode(_host_of(r.link)))
+        stamp = r.stamp
+        if type(stamp) is str:
+            codes["timestamp"].append(dicts["timestamp"].encode(stamp))
+            self.epochs.append(0.0)
+        else:
+            codes["timestamp"].append(0)
+            self.epochs.append(stamp)
+        if category == len(self.category_totals):
+            self.category_totals.append(0)
+        self.category_totals[category] += 1
+
+    def value(self, name: str, i: int) -> str:
+        return self.dicts[name].values[self.codes[name][i]]
+
+    def stamp(self, i: int) -> Union[str, float]:
+        code = self.codes["timestamp"][i]
+        return self.dicts["timestamp"].values[code] if code else self.epochs[i]
+
+    def row(self, i: int) -> Row:
+        return (self.titles[i], self.links[i], self.snippets[i], self.value("category", i),
+                self.value("query", i), format_timestamp(self.stamp(i)))
+
+    def result(self, i: int) -> SearchResult:
+        # The raw stamp keeps the epoch unformatted until the result's timestamp is read.
+        return SearchResult(self.titles[i], self.links[i], self.snippets[i], self.value("category", i),
+                            self.value("query", i), self.stamp(i))
+
+
+class ResultColumns(SequenceABC):
+    """
+    A drop-in for List[SearchResult] that stores results by column instead of
+    as one object each: titles, links, and snippets in flat lists, and the
+    category, query, and host columns dictionary-encoded as arrays of integer
+    codes. Creation times stay epoch floats in a flat array until a row is
+    read. Every result of a dork shares its query and category codes, so a
+    sweep of hundreds of thousands of findings costs a few pointers and 24
+    bytes of codes and epochs per row. SearchResult objects are built only
+    when an item is read or iterated.
+
+    Filters work on the codes: mask() turns the wanted values into a set of
+    codes and tests every row in one C-level pass, where() and take() return
+    views that share the columns, and category_counts() reads per-code totals
+    kept at append time. Slicing also returns a view instead of a copy, so
+    a page of rows costs nothing until it is read. Views are read-only;
+    list(view) or ResultColumns(view) gives an independent copy.
+    """
+
+    def __init__(self, results: Iterable[SearchResult] = ()):
+        self._store = _ColumnStore()
+        self._rows: Optional[Sequence[int]] = None  # positions in the store; None = every row
+        self.extend(results)
+
+    @classmethod
+    def _view(cls, store: _ColumnStore, rows: Sequence[int]) -> "ResultColumns":
+        view = cls.__new__(cls)
+        view._store = store
+        view._rows = rows
+        return view
+
+    def _positions(self) -> Sequence[int]:
+        return range(len(self._store.titles)) if self._rows is None else self._rows
+
+    # Sequence interface
+    def __len__(self) -> int:
+        return len(self._store.titles) if self._rows is None else len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(self._store, self._positions()[index])
+        return self._store.result(self._positions()[index])
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        return map(self._store.result, self._positions())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ResultColumns, list)):
+            return len(self) == len(other) and all(map(SearchResult.__eq__, self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        kind = "ResultColumns" if self._rows is None else "ResultColumns view"
+        return f"<{kind} of {len(self)} results>"
+
+    # Mutation (the owning container only)
+    def _check_writable(self):
+        if self._rows is not None:
+            raise TypeError("ResultColumns views are read-only")
+
+    def append(self, result: SearchResult):
+        self._check_writable()
+        self._store.add(result)
+
+    def extend(self, results: Iterable[SearchResult]):
+        self._check_writable()
+        if isinstance(results, ResultColumns):
+            results = list(results)
+        add = self._store.add
+        for r in results:
+            add(r)
+
+    def clear(self):
+        self._check_writable()
+        self._store = _ColumnStore()
+
+    # Column access
+    def row(self, index: int) -> Row:
+        """(title, link, snippet, category, query, timestamp) of one item, without building a SearchResult."""
+        positions = self._positions()
+        return self._store.row(positions[index])
+
+    def rows(self) -> Iterator[Row]:
+        return map(self._store.row, self._positions())
+
+    def column(self, name: str) -> List[str]:
+        """Values of one column (title, link, snippet, category, query, host, timestamp) in row order."""
+        store = self._store
+        flat = {"title": store.titles, "link": store.links, "snippet": store.snippets}.get(name)
+        if name == "timestamp":
+            return [format_timestamp(store.stamp(i)) for i in self._positions()]
+        if flat is None:
+            values = store.dicts[name].values
+            flat = list(map(values.__getitem__, store.codes[name]))
+        return flat[:] if self._rows is None else list(map(flat.__getitem__, self._rows))
+
+    def category_counts(self) -> Counter:
+        """Rows per category."""
+        store = self._store
+        names = store.dicts["category"].values
+        if self._rows is None:
+            return Counter({names[code]: n for code, n in enumerate(store.category_totals) if n})
+        codes = store.codes["category"]
+        return Counter({names[code]: n for code, n in Counter(map(codes.__getitem__, self._rows)).items()})
+
+    # Filtering
+    def _host_codes(self, host: str) -> set:
+        host = host.lower().strip(".")
+        suffix = "." + host
+        return {code for value, code in self._store.dicts["host"].codes.items()
+                if value == host or value.endswith(suffix)}
+
+    def mask(self, category: Union[str, Iterable[str], None] = None,
+             query: Union[str, Iterable[str], None] = None,
+             host: Optional[str] = None) -> bytes:
+        """
+        One byte per row, 1 where the row has one of the given categories and
+        queries and its host is host or a subdomain of it. Masks of the same
+        rows combine with bytes(map(operator.and_, a, b)).
+        """
+        store = self._store
+        wanted = []
+        if category is not None:
+            wanted.append(("category", store.dicts["category"].lookup(category)))
+        if query is not None:
+            wanted.append(("query", store.dicts["query"].lookup(query)))
+        if host is not None:
+            wanted.append(("host", self._host_codes(host)))
+        mask = None
+        for name, codes in wanted:
+            column = store.codes[name]
+            if self._rows is not None:
+                column = map(column.__getitem__, self._rows)
+            hits = bytes(map(codes.__contains__, column))
+            mask = hits if mask is None else bytes(map(and_, mask, hits))
+        return mask if mask is not None else b"\x01" * len(self)
+
+    def filter(self, mask: Iterable) -> "ResultColumns":
+        """View of the rows whose mask entry is true."""
+        return self._view(self._store, array("I", compress(self._positions(), mask)))
+
+    def where(self, category: Union[str, Iterable[str], None] = None,
+              query: Union[str, Iterable[str], None] = None,
+              host: Optional[str] = None) -> "ResultColumns":
+        """View of the rows matching mask(category, query, host)."""
+        return self.filter(self.mask(category, query, host))
+
+    def take(self, indices: Sequence[int]) -> "ResultColumns":
+        """View of the rows at indices (positions in this container). The indices are not copied."""
+        if self._rows is not None:
+            indices = array("I", map(self._rows.__getitem__, indices))
+        return self._view(self._store, indices)
@@ -0,0 +1,88 @@
+"""
+Compact hash-based seen-sets and URL canonicalization for deduplicating queries and result URLs.
+Version 1.2.0
+"""
+
+import hashlib
+from typing import Iterable
+from urllib.parse import urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ftp": 21}
+# Click-tracking parameters that never change the page served.
+_TRACKING_PARAMS = frozenset({
+    "gclid", "gbraid", "wbraid", "dclid", "fbclid", "msclkid", "yclid", "twclid", "igshid",
+    "srsltid", "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "mkt_tok", "ref_src",
+})
+_TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking(param: str) -> bool:
+    name = param.split("=", 1)[0].lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+def canonical_url(link: str) -> str:
+    """
+    Normalizes a result URL so near-identical links compare equal: lowercases
+    the scheme and host, drops default ports, the fragment, and tracking
+    parameters (utm_*, gclid, fbclid, ...), and removes trailing slashes from
+    non-root paths. Other query parameters keep their order. Text that is not
+    an absolute URL is returned stripped but otherwise unchanged.
+    """
+    link = link.strip()
+    try:
+        parts = urlsplit(link)
+        port = parts.port
+    except ValueError:
+        return link
+    if not parts.scheme or not parts.netloc:
+        return link
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    userinfo = parts.netloc.rpartition("@")[0]
+    if userinfo:
+        netloc = f"{userinfo}@{netloc}"
+    path = parts.path.rstrip("/") or "/"
+    query = parts.query
+    if query:
+        query = "&".join(p for p in query.split("&") if p and not _is_tracking(p))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class HashedSeenSet:
+    """
+    Membership set that stores a 64-bit BLAKE2b digest per key instead of the key
+    itself, so long sweeps keep a small fixed cost per distinct query or URL.
+    A false positive needs a 64-bit collision, which is negligible at sweep scale.
+    """
+
+    __slots__ = ("_hashes",)
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._hashes = set()
+        for key in keys:
+            self.add(key)
+
+    @staticmethod
+    def digest(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, key: str) -> bool:
+        """Adds key; returns True if it was not seen before."""
+        h = self.digest(key)
+        if h in self._hashes:
+            return False
+        self._hashes.add(h)
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return self.digest(key) in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def clear(self):
+        self._hashes.clear()
@@ -1,146 +1,100 @@
 """
-Multi-Format Export Manager: CSV, JSON, HTML, TXT, Markdown.
+Multi-Format Export Manager: CSV, JSON, JSON Lines, HTML, TXT, Markdown,
+optionally gzip/xz/bz2 compressed.
 Professional styling with zero emojis.
 Version 1.2.0
 """
 
-import csv
+import bz2
+import gzip
+import io
 import json
 import html
+import lzma
+import os
+import queue
+import re
+import sys
+import threading
 from datetime import datetime
-from typing import List
+from itertools import chain, islice
+from json.encoder import encode_basestring
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 from .models import SearchResult
+from .columns import ResultColumns
 
+_FIELDS = ("title", "link", "snippet", "category", "query", "timestamp")
 
-class ExportManager:
-    """
-    Exports search results into multiple structured and report formats.
-    """
+WRITE_BUFFER = 1 << 20  # bytes buffered by the file object between disk writes
+CHUNK_ROWS = 1000       # results formatted and written per write() call
 
-    @staticmethod
-    def _safe_csv_cell(value) -> str:
-        """
-        Prevents spreadsheet formula injection when CSVs are opened in Excel or
-        similar spreadsheet tools. Cells beginning with formula-control
-        characters are prefixed with a single quote.
-        """
-        text = "" if value is None else str(value)
-        stripped = text.lstrip()
-        if text.startswith(("\t", "\r", "\n")) or stripped.startswith(("=", "+", "-", "@")):
-            return "'" + text
-        return text
+_SEP = "\0"
+# A cell _safe_csv_cell would change, at the start of a _SEP-joined column.
+_CSV_RISKY = re.compile(r"\0(?:\s*[=+\-@]|[\t\r\n])")
+# Characters that make csv.writer (QUOTE_MINIMAL, "," delimiter) quote a field.
+_CSV_QUOTED = re.compile(r'[",\r\n]')
 
-    @staticmethod
-    def export_csv(filepath: str, results: List[SearchResult]) -> bool:
-        try:
-            with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Title", "URL", "Snippet", "Category", "Query", "Timestamp"])
-                for r in results:
-                    writer.writerow([
-                        ExportManager._safe_csv_cell(r.title),
-                        ExportManager._safe_csv_cell(r.link),
-                        ExportManager._safe_csv_cell(r.snippet),
-                        ExportManager._safe_csv_cell(r.category),
-                        ExportManager._safe_csv_cell(r.query),
-                        ExportManager._safe_csv_cell(r.timestamp),
-                    ])
-            return True
-        except Exception as e:
-            print(f"[ERROR] CSV Export failed: {e}")
-            return False
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
 
-    @staticmethod
-    def export_json(filepath: str, results: List[SearchResult]) -> bool:
-        try:
-            data = {
-                "generated_at": datetime.now().isoformat(),
-                "total_results": len(results),
-                "results": [r.to_dict() for r in results]
-            }
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception as e:
-            print(f"[ERROR] JSON Export failed: {e}")
-            return False
+_CSV_HEADER = ("Title", "URL", "Snippet", "Category", "Query", "Timestamp")
 
-    @staticmethod
-    def export_txt(filepath: str, results: List[SearchResult], query: str = "") -> bool:
-        try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("=" * 80 + "\n")
-                f.write("GOOGLE DORKING TOOL - RECONNAISSANCE REPORT\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Active Query: {query}\n")
-                f.write(f"Total Results: {len(results)}\n")
-                f.write("=" * 80 + "\n\n")
+# Compressed output by suffix after the format extension (findings.csv.gz):
+# the binary opener and its write options. Levels favour throughput, since
+# repeated queries, categories, and hosts compress well at the fast presets.
+COMPRESSORS = {
+    ".gz": (gzip.open, {"compresslevel": 1}),
+    ".xz": (lzma.open, {"preset": 1}),
+    ".bz2": (bz2.open, {"compresslevel": 1}),
+}
+_COMPRESS_QUEUE = 8  # WRITE_BUFFER blocks waiting for the compression thread
 
-                for idx, r in enumerate(results, start=1):
-                    f.write(f"[{idx}] {r.title}\n")
-                    f.write(f"URL:      {r.link}\n")
-                    f.write(f"Category: {r.category}\n")
-                    f.write(f"Snippet:  {r.snippet}\n")
-                    f.write("-" * 80 + "\n")
-            return True
-        except Exception as e:
-            print(f"[ERROR] TXT Export failed: {e}")
-            return False
 
-    @staticmethod
-    def export_markdown(filepath: str, results: List[SearchResult], query: str = "") -> bool:
-        try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write("# Google Dorking Reconnaissance Report\n\n")
-                f.write(f"- **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"- **Query:** `{query}`\n")
-                f.write(f"- **Total Results:** {len(results)}\n\n")
-                f.write("| # | Title | URL | Category | Snippet |\n")
-                f.write("|---|-------|-----|----------|---------|\n")
+def compression_of(filepath: str) -> Optional[str]:
+    """The compression suffix of filepath (".gz", ".xz", ".bz2"), or None."""
+    suffix = os.path.splitext(filepath)[1].lower()
+    return suffix if suffix in COMPRESSORS else None
 
-                for idx, r in enumerate(results, start=1):
-                    clean_title = r.title.replace("|", "-").replace("\n", " ")
-                    clean_snippet = r.snippet.replace("|", "-").replace("\n", " ")
-                    f.write(f"| {idx} | {clean_title} | [{r.link}]({r.link}) | {r.category} | {clean_snippet} |\n")
-            return True
-        except Exception as e:
-            print(f"[ERROR] Markdown Export failed: {e}")
-            return False
 
-    @staticmethod
-    def export_html(filepath: str, results: List[SearchResult], query: str = "") -> bool:
-        try:
-            cards_html = ""
-            for idx, r in enumerate(results, start=1):
-                safe_title = html.escape(r.title)
-                safe_link = html.escape(r.link)
-                safe_snippet = html.escape(r.snippet)
-                safe_cat = html.escape(r.category)
-                safe_time = html.escape(r.timestamp)
-
-                cards_html += f"""
+def _open_compressed(filepath: str, mode: str):
+    opener, options = COMPRESSORS[compression_of(filepath)]
+    return opener(filepath, mode, **options) if "r" not in mode else opener(filepath, mode)
+
+
+def format_extension(filepath: str) -> str:
+    """The lowercase format extension of filepath under any compression suffix (".csv" for "a.csv.gz")."""
+    if compression_of(filepath):
+        filepath = os.path.splitext(filepath)[0]
+    return os.path.splitext(filepath)[1].lower()
+
+
+# One result per line, exactly as json.dumps(result.to_dict(), ensure_ascii=False) writes it.
+_NDJSON_ROW = "{" + ", ".join(f'"{name}": %s' for name in _FIELDS) + "}\n"
+
+# One result inside the "results" array, laid out exactly as json.dump(indent=2) would.
+_JSON_ROW = "    {\n" + ",\n".join(f'      "{name}": %s' for name in _FIELDS) + "\n    }"
+
+_HTML_CARD = """
                 <div class="result-card">
                     <div class="card-header">
-                        <span class="badge category">{safe_cat}</span>
-                        <span class="result-index">#{idx}</span>
+                        <span class="badge category">%s</span>
+                        <span class="result-index">#%d</span>
                     </div>
-                    <h3 class="title"><a href="{safe_link}" target="_blank" rel="noopener noreferrer">{safe_title}</a></h3>
-                    <div class="url-link">{safe_link}</div>
-                    <p class="snippet">{safe_snippet}</p>
+                    <h3 class="title"><a href="%s" target="_blank" rel="noopener noreferrer">%s</a></h3>
+                    <div class="url-link">%s</div>
+                    <p class="snippet">%s</p>
                     <div class="card-footer">
-                        <span class="timestamp">{safe_time}</span>
-                        <a class="open-btn" href="{safe_link}" target="_blank" rel="noopener noreferrer">Open Link &rarr;</a>
+                        <span class="timestamp">%s</span>
+                        <a class="open-btn" href="%s" target="_blank" rel="noopener noreferrer">Open Link &rarr;</a>
                     </div>
                 </div>
                 """
 
-            safe_query = html.escape(query)
-            html_content = f"""<!DOCTYPE html>
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Google Dorking OSINT Report - {datetime.now().strftime('%Y-%m-%d')}</title>
+    <title>Google Dorking OSINT Report - {date}</title>
     <style>
         :root {{
             --bg: #0d1117;
@@ -223,22 +177,426 @@ class ExportManager:
         <header>
             <h1>Google Dorking OSINT Report</h1>
             <div class="meta-bar">
-                <div class="meta-item">Generated: <strong>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</strong></div>
-                <div class="meta-item">Total Findings: <strong>{len(results)}</strong></div>
-                {f'<div class="meta-item">Target Query: <strong>{safe_query}</strong></div>' if safe_query else ''}
+                <div class="meta-item">Generated: <strong>{generated}</strong></div>
+                {total_item}
+                {query_item}
             </div>
         </header>
         <div class="results-container">
-            {cards_html if results else '<p style="text-align:center; padding:40px; color:#8b949e;">No results found.</p>'}
-        </div>
-    </div>
+"""
+
+_HTML_EMPTY = '            <p style="text-align:center; padding:40px; color:#8b949e;">No results found.</p>\n'
+
+_HTML_TAIL = """        </div>
+{total_footer}    </div>
 </body>
 </html>
 """
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(html_content)
+
+
+class _CompressingWriter(io.RawIOBase):
+    """
+    Binary sink that compresses on a background thread. write() only queues
+    the block (the buffered layer above hands over WRITE_BUFFER bytes at a
+    time), so formatting the next chunk overlaps with compressing the last
+    one; zlib, lzma, and bz2 release the GIL while they work. The queue is
+    bounded, so a slow compressor throttles the writer instead of growing
+    memory. An error on the thread is raised by the next write() or close().
+    """
+
+    def __init__(self, filepath: str, mode: str = "w"):
+        super().__init__()
+        self._target = _open_compressed(filepath, mode + "b")
+        self._blocks: "queue.Queue[Optional[bytes]]" = queue.Queue(_COMPRESS_QUEUE)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="export-compressor", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        block = b""
+        try:
+            while block is not None:
+                block = self._blocks.get()
+                if block is not None:
+                    self._target.write(block)
+        except BaseException as e:
+            self._error = e
+            while block is not None:  # keep draining so write() and close() never block
+                block = self._blocks.get()
+        finally:
+            try:
+                self._target.close()
+            except BaseException as e:
+                self._error = self._error or e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise OSError(f"Compression failed: {self._error}")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._raise_error()
+        self._blocks.put(bytes(data))
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._blocks.put(None)
+            self._thread.join()
+            super().close()
+            self._raise_error()
+
+
+class ExportManager:
+    """
+    Exports search results into multiple structured and report formats.
+
+    Every exporter streams: results may be any iterable (a list, a
+    ResultColumns, or a generator reading pages from the FindingsStore)
+    and are formatted CHUNK_ROWS at a time into a file with a large write
+    buffer, so memory use does not grow with the number of findings. The
+    total count goes in the report header when results has a length, and in
+    a footer line (or after the "results" array in JSON) when it is only an
+    iterator. A ResultColumns is read column-wise without building a
+    SearchResult per row. export_ndjson writes one JSON object per line;
+    NdjsonWriter appends to such a file as results arrive and NdjsonReader
+    streams it back.
+
+    A path ending in a COMPRESSORS suffix (findings.csv.gz, findings.ndjson.xz)
+    is written compressed, with compression running on a background thread
+    while the next chunk is formatted.
+    """
+
+    @staticmethod
+    def _field_rows(results: Iterable[SearchResult]) -> Iterator[Tuple[str, ...]]:
+        """(title, link, snippet, category, query, timestamp) for each result."""
+        if isinstance(results, ResultColumns):
+            return results.rows()
+        return ((r.title, r.link, r.snippet, r.category, r.query, r.timestamp) for r in results)
+
+    @staticmethod
+    def _known_total(results: Iterable[SearchResult]) -> Optional[int]:
+        """len(results), or None for iterators whose length is only known at the end."""
+        return len(results) if hasattr(results, "__len__") else None
+
+    @staticmethod
+    def _open(filepath: str, encoding: str = "utf-8", newline: Optional[str] = None, mode: str = "w") -> TextIO:
+        if compression_of(filepath) is None:
+            return open(filepath, mode, encoding=encoding, newline=newline, buffering=WRITE_BUFFER)
+        raw = io.BufferedWriter(_CompressingWriter(filepath, mode), WRITE_BUFFER)
+        return io.TextIOWrapper(raw, encoding=encoding, newline=newline)
+
+    @staticmethod
+    def _chunks(results: Iterable[SearchResult]) -> Iterator[Tuple[int, List[Tuple[str, ...]]]]:
+        """(1-based index of the first row, field rows) for CHUNK_ROWS results at a time."""
+        rows = ExportManager._field_rows(results)
+        start = 1
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                return
+            yield start, ExportManager._as_text(chunk)
+            start += len(chunk)
+
+    @staticmethod
+    def _as_text(chunk: List[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+        """
+        The chunk with every field a str: None becomes "" and other values
+        str(value), as imported files may carry "title": null. The row
+        formatters join and escape fields as strings, so they need this.
+        """
+        try:
+            "".join(chain.from_iterable(chunk))  # one C-level pass; fails on any non-str field
+            return chunk
+        except TypeError:
+            return [tuple(v if type(v) is str else str(v or "") for v in row) for row in chunk]
+
+    @staticmethod
+    def _escape_column(values: Tuple[str, ...]) -> List[str]:
+        """html.escape of every value, done as one call over the NUL-joined column."""
+        escaped = html.escape(_SEP.join(values)).split(_SEP)
+        if len(escaped) != len(values):  # a value contained the separator itself
+            escaped = [html.escape(v) for v in values]
+        return escaped
+
+    @staticmethod
+    def _safe_csv_cell(value) -> str:
+        """
+        Prevents spreadsheet formula injection when CSVs are opened in Excel or
+        similar spreadsheet tools. Cells beginning with formula-control
+        characters are prefixed with a single quote.
+        """
+        text = "" if value is None else str(value)
+        stripped = text.lstrip()
+        if text.startswith(("\t", "\r", "\n")) or stripped.startswith(("=", "+", "-", "@")):
+            return "'" + text
+        return text
+
+    @staticmethod
+    def _csv_field(value: str) -> str:
+        """A field quoted the way csv.writer's QUOTE_MINIMAL would."""
+        return '"' + value.replace('"', '""') + '"' if _CSV_QUOTED.search(value) else value
+
+    @staticmethod
+    def _csv_lines(chunk: List[Tuple[str, ...]]) -> str:
+        """
+        The chunk as CSV text, with _safe_csv_cell applied. Each column is
+        first screened with one regex search over the whole column, so only
+        columns with a possible formula cell or a field needing quotes are
+        handled cell by cell.
+        """
+        columns = list(zip(*chunk))
+        for i, column in enumerate(columns):
+            joined = _SEP + _SEP.join(column)
+            if _CSV_RISKY.search(joined):
+                column = columns[i] = tuple(map(ExportManager._safe_csv_cell, column))
+            if _CSV_QUOTED.search(joined):
+                columns[i] = tuple(map(ExportManager._csv_field, column))
+        return "\r\n".join(map(",".join, zip(*columns))) + "\r\n"
+
+    @staticmethod
+    def export_csv(filepath: str, results: Iterable[SearchResult]) -> bool:
+        try:
+            with ExportManager._open(filepath, encoding="utf-8-sig", newline="") as f:
+                f.write(ExportManager._csv_lines([_CSV_HEADER]))
+                for _, chunk in ExportManager._chunks(results):
+                    f.write(ExportManager._csv_lines(chunk))
+            return True
+        except Exception as e:
+            print(f"[ERROR] CSV Export failed: {e}")
+            return False
+
+    @staticmethod
+    def export_json(filepath: str, results: Iterable[SearchResult]) -> bool:
+        try:
+            total = ExportManager._known_total(results)
+            written = 0
+            with ExportManager._open(filepath) as f:
+                f.write('{\n  "generated_at": ' + encode_basestring(datetime.now().isoformat()) + ",\n")
+                if total is not None:
+                    f.write(f'  "total_results": {total},\n')
+                f.write('  "results": [')
+                for start, chunk in ExportManager._chunks(results):
+                    f.write((",\n" if start > 1 else "\n") + ",\n".join(
+                        _JSON_ROW % tuple(map(encode_basestring, row)) for row in chunk
+                    ))
+                    written = start + len(chunk) - 1
+                f.write("\n  ]" if written else "]")
+                if total is None:
+                    f.write(f',\n  "total_results": {written}')
+                f.write("\n}")
+            return True
+        except Exception as e:
+            print(f"[ERROR] JSON Export failed: {e}")
+            return False
+
+    @staticmethod
+    def export_ndjson(filepath: str, results: Iterable[SearchResult], append: bool = False) -> bool:
+        """
+        Writes one JSON object per line (JSON Lines), the format NdjsonReader
+        streams back. With append, the lines are added to an existing file.
+        """
+        try:
+            with NdjsonWriter(filepath, append=append) as writer:
+                writer.write(results)
+            return True
+        except Exception as e:
+            print(f"[ERROR] NDJSON Export failed: {e}")
+            return False
+
+    @staticmethod
+    def export_txt(filepath: str, results: Iterable[SearchResult], query: str = "") -> bool:
+        try:
+            total = ExportManager._known_total(results)
+            written = 0
+            rule = "-" * 80 + "\n"
+            with ExportManager._open(filepath) as f:
+                f.write("=" * 80 + "\n")
+                f.write("GOOGLE DORKING TOOL - RECONNAISSANCE REPORT\n")
+                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"Active Query: {query}\n")
+                if total is not None:
+                    f.write(f"Total Results: {total}\n")
+                f.write("=" * 80 + "\n\n")
+
+                for start, chunk in ExportManager._chunks(results):
+                    f.write("".join(
+                        f"[{idx}] {title}\nURL:      {link}\nCategory: {category}\nSnippet:  {snippet}\n{rule}"
+                        for idx, (title, link, snippet, category, _, _) in enumerate(chunk, start)
+                    ))
+                    written = start + len(chunk) - 1
+                if total is None:
+                    f.write(f"Total Results: {written}\n")
+            return True
+        except Exception as e:
+            print(f"[ERROR] TXT Export failed: {e}")
+            return False
+
+    @staticmethod
+    def export_markdown(filepath: str, results: Iterable[SearchResult], query: str = "") -> bool:
+        try:
+            total = ExportManager._known_total(results)
+            written = 0
+
+            def clean(text: str) -> str:
+                return text.replace("|", "-").replace("\n", " ")
+
+            with ExportManager._open(filepath) as f:
+                f.write("# Google Dorking Reconnaissance Report\n\n")
+                f.write(f"- **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"- **Query:** `{query}`\n")
+                if total is not None:
+                    f.write(f"- **Total Results:** {total}\n")
+                f.write("\n| # | Title | URL | Category | Snippet |\n")
+                f.write("|---|-------|-----|----------|---------|\n")
+
+                for start, chunk in ExportManager._chunks(results):
+                    f.write("".join(
+                        f"| {idx} | {clean(title)} | [{link}]({link}) | {category} | {clean(snippet)} |\n"
+                        for idx, (title, link, snippet, category, _, _) in enumerate(chunk, start)
+                    ))
+                    written = start + len(chunk) - 1
+                if total is None:
+                    f.write(f"\n- **Total Results:** {written}\n")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Markdown Export failed: {e}")
+            return False
+
+    @staticmethod
+    def export_html(filepath: str, results: Iterable[SearchResult], query: str = "") -> bool:
+        try:
+            total = ExportManager._known_total(results)
+            written = 0
+            now = datetime.now()
+            safe_query = html.escape(query)
+            total_item = f'<div class="meta-item">Total Findings: <strong>{total}</strong></div>' if total is not None else ""
+            query_item = f'<div class="meta-item">Target Query: <strong>{safe_query}</strong></div>' if safe_query else ""
+            escape = ExportManager._escape_column
+            with ExportManager._open(filepath) as f:
+                f.write(_HTML_HEAD.format(date=now.strftime('%Y-%m-%d'), generated=now.strftime('%Y-%m-%d %H:%M:%S'),
+                                          total_item=total_item, query_item=query_item))
+                for start, chunk in ExportManager._chunks(results):
+                    titles, links, snippets, categories, _, timestamps = zip(*chunk)
+                    f.write("".join(
+                        _HTML_CARD % (category, idx, link, title, link, snippet, timestamp, link)
+                        for idx, title, link, snippet, category, timestamp in zip(
+                            range(start, start + len(chunk)), escape(titles), escape(links),
+                            escape(snippets), escape(categories), escape(timestamps))
+                    ))
+                    written = start + len(chunk) - 1
+                if not written:
+                    f.write(_HTML_EMPTY)
+                footer = ""
+                if total is None:
+                    footer = (f'        <div class="meta-bar"><div class="meta-item">Total Findings: '
+                              f'<strong>{written}</strong></div></div>\n')
+                f.write(_HTML_TAIL.format(total_footer=footer))
             return True
         except Exception as e:
             print(f"[ERROR] HTML Export failed: {e}")
             return False
 
+
+class NdjsonWriter:
+    """
+    Append-only JSON Lines writer for findings that arrive over time, e.g.
+    during a sweep. write() appends a batch of results and flushes, so an
+    interrupted sweep leaves every batch written so far on disk and at most
+    one torn line, which NdjsonReader skips. Opening with append=True on a
+    file whose last line is torn starts on a fresh line. Compressed files
+    only reach the disk in full when the writer is closed; appending adds a
+    new compressed stream, which every reader of the format concatenates.
+
+    target is a file path or an open text stream such as sys.stdout.
+    """
+
+    def __init__(self, target: Union[str, TextIO], append: bool = False):
+        self.written = 0
+        if not isinstance(target, str):
+            self._file, self._owned = target, False
+            return
+        torn = False
+        if append and compression_of(target) is None:
+            try:
+                with open(target, "rb") as f:
+                    f.seek(0, 2)
+                    if f.tell():
+                        f.seek(-1, 2)
+                        torn = f.read(1) != b"\n"
+            except FileNotFoundError:
+                pass
+        self._file = ExportManager._open(target, mode="a" if append else "w")
+        self._owned = True
+        if torn:
+            self._file.write("\n")
+
+    def write(self, results: Iterable[SearchResult]) -> int:
+        """Appends results, one line each, and returns how many were written."""
+        count = 0
+        for _, chunk in ExportManager._chunks(results):
+            self._file.write("".join(_NDJSON_ROW % tuple(map(encode_basestring, row)) for row in chunk))
+            count += len(chunk)
+        self._file.flush()
+        self.written += count
+        return count
+
+    def close(self):
+        if self._owned and not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class NdjsonReader:
+    """
+    Streams SearchResults back from a JSON Lines file (a path, "-" for
+    stdin, or an open text stream) one line at a time, so archives of any
+    size are read in constant memory. Blank lines are ignored; lines that
+    are not JSON objects, such as a torn final line, are skipped and counted
+    in skipped. Paths with a COMPRESSORS suffix are decompressed as they are
+    read; a compressed file cut off mid-write is read up to the cut, which
+    counts as one skipped line. The file is opened when iteration starts and
+    closed when it ends.
+    """
+
+    def __init__(self, source: Union[str, TextIO]):
+        self.source = source
+        self.read = 0
+        self.skipped = 0
+
+    def __iter__(self) -> Iterator[SearchResult]:
+        if not isinstance(self.source, str):
+            yield from self._parse(self.source)
+        elif self.source == "-":
+            yield from self._parse(sys.stdin)
+        elif compression_of(self.source) is None:
+            with open(self.source, "r", encoding="utf-8", buffering=WRITE_BUFFER) as f:
+                yield from self._parse(f)
+        else:
+            with io.TextIOWrapper(_open_compressed(self.source, "rb"), encoding="utf-8") as f:
+                try:
+                    yield from self._parse(f)
+                except EOFError:
+                    self.skipped += 1
+
+    def _parse(self, lines: Iterable[str]) -> Iterator[SearchResult]:
+        loads, from_dict = json.loads, SearchResult.from_dict
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                data = loads(line)
+            except ValueError:
+                data = None
+            if not isinstance(data, dict):
+                self.skipped += 1
+                continue
+            self.read += 1
+            yield from_dict(data)
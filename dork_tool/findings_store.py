@@ -0,0 +1,330 @@
+"""
+Persistent SQLite store of every finding across sessions, with indexed paged reads.
+Version 1.2.0
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .models import SearchResult
+from .result_query import ResultQuery
+
+_COLUMNS = "title, link, snippet, category, query, timestamp"
+
+
+class FindingsStore:
+    """
+    On-disk store of SearchResult rows, deduplicated by (link, query, category)
+    like the Results Explorer. Stored in ~/.google_dorking_tool/findings.db
+
+    Rows are indexed by link, host, category, query, and timestamp, so reads of
+    months of findings stay index lookups. Hosts are stored with their labels
+    reversed ("com.example.www"), which makes a domain and all of its
+    subdomains one index range. Reads are paged by row id (keyset pagination),
+    so each page costs the same however deep into the store it is.
+
+    Writers call queue() with each batch of new findings; rows are buffered and
+    written in one transaction per batch_size rows, and flush() writes the rest.
+
+    Titles and snippets are also indexed by an FTS5 table kept in sync by
+    triggers; search() ranks its matches with BM25, titles weighing more than
+    snippets. Without FTS5 in the sqlite3 build, search() scans instead.
+    """
+
+    TITLE_WEIGHT = 10.0
+    SNIPPET_WEIGHT = 1.0
+
+    _shared: Optional["FindingsStore"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path: Optional[str] = None, batch_size: int = 200):
+        self.db_path = db_path or os.path.join(
+            os.path.expanduser("~"), ".google_dorking_tool", "findings.db"
+        )
+        self.batch_size = max(1, batch_size)
+        self._pending: List[SearchResult] = []
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.fts_enabled = False
+        self._open()
+
+    @classmethod
+    def shared(cls) -> "FindingsStore":
+        """Returns the process-wide store, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _open(self):
+        try:
+            d = os.path.dirname(self.db_path)
+            if d and not os.path.exists(d):
+                os.makedirs(d, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS findings ("
+                " id INTEGER PRIMARY KEY,"
+                " title TEXT NOT NULL,"
+                " link TEXT NOT NULL,"
+                " snippet TEXT NOT NULL,"
+                " category TEXT NOT NULL,"
+                " query TEXT NOT NULL,"
+                " timestamp TEXT NOT NULL,"
+                " rhost TEXT NOT NULL)"
+            )
+            # The unique index doubles as the link index.
+            self._conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_findings_key ON findings(link, query, category)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_findings_rhost ON findings(rhost)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_findings_category ON findings(category)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_findings_query ON findings(query)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_findings_timestamp ON findings(timestamp)")
+            self._conn.commit()
+        except Exception as e:
+            print(f"[ERROR] Findings store unavailable: {e}")
+            self._conn = None
+            return
+        try:
+            self._open_fts()
+        except sqlite3.Error as e:
+            print(f"[ERROR] Full-text search unavailable, falling back to scans: {e}")
+
+    def _open_fts(self):
+        existed = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'findings_fts'"
+        ).fetchone()
+        with self._conn:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5("
+                " title, snippet, content='findings', content_rowid='id',"
+                " tokenize='unicode61 remove_diacritics 2')"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS findings_fts_insert AFTER INSERT ON findings BEGIN"
+                " INSERT INTO findings_fts(rowid, title, snippet) VALUES (new.id, new.title, new.snippet);"
+                " END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS findings_fts_delete AFTER DELETE ON findings BEGIN"
+                " INSERT INTO findings_fts(findings_fts, rowid, title, snippet)"
+                " VALUES ('delete', old.id, old.title, old.snippet);"
+                " END"
+            )
+            self._conn.execute(
+                "INSERT INTO findings_fts(findings_fts, rank) VALUES ('rank', ?)",
+                (f"bm25({self.TITLE_WEIGHT}, {self.SNIPPET_WEIGHT})",)
+            )
+            if not existed:
+                # Stores written before full-text search existed are indexed once.
+                self._conn.execute("INSERT INTO findings_fts(findings_fts) VALUES ('rebuild')")
+        self.fts_enabled = True
+
+    @property
+    def available(self) -> bool:
+        return self._conn is not None
+
+    @staticmethod
+    def reverse_host(link_or_host: str) -> str:
+        """'https://www.Example.com/x' or 'www.example.com' -> 'com.example.www'."""
+        text = link_or_host.strip()
+        host = urlsplit(text).hostname if "//" in text else text.split("/", 1)[0].split(":", 1)[0]
+        return ".".join(reversed((host or "").lower().strip(".").split(".")))
+
+    # Writing
+    def add(self, results: Sequence[SearchResult]) -> int:
+        """Writes results in one transaction; returns how many were new."""
+        if self._conn is None or not results:
+            return 0
+        rows = [
+            (r.title, r.link, r.snippet, r.category, r.query, r.timestamp, self.reverse_host(r.link))
+            for r in results
+        ]
+        with self._lock:
+            try:
+                before = self._conn.total_changes
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT OR IGNORE INTO findings ({_COLUMNS}, rhost) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+                return self._conn.total_changes - before
+            except Exception as e:
+                print(f"[ERROR] Failed to write findings: {e}")
+                return 0
+
+    def queue(self, results: Sequence[SearchResult]):
+        """Buffers results and writes them once batch_size rows are pending."""
+        if self._conn is None or not results:
+            return
+        with self._lock:
+            self._pending.extend(results)
+            if len(self._pending) < self.batch_size:
+                return
+            pending, self._pending = self._pending, []
+        self.add(pending)
+
+    def flush(self) -> int:
+        """Writes every buffered result now."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return self.add(pending)
+
+    # Reading
+    @classmethod
+    def _where(cls, category: Optional[str], host: Optional[str], query: Optional[str],
+               link: Optional[str], since: Optional[str], until: Optional[str]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if host:
+            # The host itself or any subdomain: rhost equal to it or starting with it plus ".".
+            rhost = cls.reverse_host(host)
+            clauses.append("(rhost = ? OR (rhost >= ? AND rhost < ?))")
+            params.extend((rhost, rhost + ".", rhost + "/"))
+        if query is not None:
+            clauses.append("query = ?")
+            params.append(query)
+        if link is not None:
+            clauses.append("link = ?")
+            params.append(link)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        return " AND ".join(clauses), params
+
+    def page(self, after_id: int = 0, limit: int = 500, category: Optional[str] = None,
+             host: Optional[str] = None, query: Optional[str] = None, link: Optional[str] = None,
+             since: Optional[str] = None, until: Optional[str] = None) -> List[Tuple[int, SearchResult]]:
+        """
+        Up to limit (id, result) pairs with id > after_id in storage order.
+        host matches the host and its subdomains; since/until bound the
+        "YYYY-MM-DD HH:MM:SS" timestamp (until is exclusive).
+        """
+        if self._conn is None:
+            return []
+        where, params = self._where(category, host, query, link, since, until)
+        sql = f"SELECT id, {_COLUMNS} FROM findings WHERE id > ?{' AND ' + where if where else ''} ORDER BY id LIMIT ?"
+        with self._lock:
+            try:
+                rows = self._conn.execute(sql, [after_id] + params + [limit]).fetchall()
+            except Exception as e:
+                print(f"[ERROR] Failed to read findings: {e}")
+                return []
+        return [
+            (row[0], SearchResult(title=row[1], link=row[2], snippet=row[3],
+                                  category=row[4], query=row[5], timestamp=row[6]))
+            for row in rows
+        ]
+
+    def iter_pages(self, limit: int = 500, **filters) -> Iterator[List[SearchResult]]:
+        """Yields every matching result page by page; no cursor stays open between pages."""
+        after_id = 0
+        while True:
+            rows = self.page(after_id, limit, **filters)
+            if not rows:
+                return
+            after_id = rows[-1][0]
+            yield [r for _, r in rows]
+            if len(rows) < limit:
+                return
+
+    def search(self, text: str, limit: int = 1000, category: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None) -> List[SearchResult]:
+        """
+        Up to limit findings matching text, best first. text uses the Results
+        Explorer's language: words, "phrases", word* prefixes, intitle:,
+        intext:, -exclusions, and OR are answered by the FTS5 index over titles
+        and snippets; other operators (site:, inurl:, filetype:) are checked on
+        its matches, a positive site: also narrowing by host in SQL.
+        """
+        parsed = ResultQuery(text)
+        if self._conn is None or parsed.is_empty:
+            return []
+        expr, rest = parsed.fts() if self.fts_enabled else (None, [n for _, _, n in parsed.conjuncts])
+        sites = [n.value.split("/", 1)[0] for n in rest if getattr(n, "op", "") == "site"]
+        host = sites[0][2:] if sites and sites[0].startswith("*.") else sites[0] if sites else None
+        where, params = self._where(category, host, None, None, since, until)
+        columns = ", ".join(f"findings.{c}" for c in _COLUMNS.split(", "))
+        if expr is not None:
+            sql = (f"SELECT {columns} FROM findings_fts JOIN findings ON findings.id = findings_fts.rowid"
+                   f" WHERE findings_fts MATCH ?{' AND ' + where if where else ''} ORDER BY rank")
+            params = [expr] + params
+        else:
+            sql = f"SELECT {columns} FROM findings{' WHERE ' + where if where else ''} ORDER BY id DESC"
+        if not rest:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        found = []
+        with self._lock:
+            try:
+                for row in self._conn.execute(sql, params):
+                    r = SearchResult(title=row[0], link=row[1], snippet=row[2],
+                                     category=row[3], query=row[4], timestamp=row[5])
+                    if rest and not parsed.matches_terms(r, rest):
+                        continue
+                    found.append(r)
+                    if len(found) >= limit:
+                        break
+            except Exception as e:
+                print(f"[ERROR] Failed to search findings: {e}")
+        return found
+
+    def count(self, category: Optional[str] = None, host: Optional[str] = None,
+              query: Optional[str] = None, link: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None) -> int:
+        if self._conn is None:
+            return 0
+        where, params = self._where(category, host, query, link, since, until)
+        with self._lock:
+            try:
+                return self._conn.execute(
+                    f"SELECT COUNT(*) FROM findings{' WHERE ' + where if where else ''}", params
+                ).fetchone()[0]
+            except Exception:
+                return 0
+
+    def category_counts(self) -> Dict[str, int]:
+        """Number of stored findings per category."""
+        if self._conn is None:
+            return {}
+        with self._lock:
+            try:
+                return dict(self._conn.execute(
+                    "SELECT category, COUNT(*) FROM findings GROUP BY category"
+                ).fetchall())
+            except Exception:
+                return {}
+
+    def close(self):
+        """Writes buffered results and closes the database."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def clear(self) -> bool:
+        """Deletes every stored finding."""
+        if self._conn is None:
+            return False
+        with self._lock:
+            self._pending = []
+            try:
+                self._conn.execute("DELETE FROM findings")
+                self._conn.commit()
+                return True
+            except Exception as e:
+                print(f"[ERROR] Failed to clear findings store: {e}")
+                return False
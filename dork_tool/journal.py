@@ -0,0 +1,176 @@
+"""
+Append-only checkpoint journal for resumable batch sweeps.
+Version 1.2.0
+"""
+
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .models import SearchResult
+
+
+class SweepJournal:
+    """
+    Records every completed (dork, page) unit of a sweep together with its results
+    as one JSON line in ~/.google_dorking_tool/journals/<sweep_id>.jsonl.
+
+    Reopening the journal for the same sweep indexes the completed units by file
+    offset, so an interrupted sweep (closed app, quota exhaustion, cancel) replays
+    stored results instead of paying for those requests again. Units that failed
+    are never written and are retried on resume.
+    """
+
+    def __init__(self, sweep_id: str, label: str = "", journal_dir: Optional[str] = None):
+        self.sweep_id = sweep_id
+        self.label = label
+        self.journal_dir = journal_dir or os.path.join(
+            os.path.expanduser("~"), ".google_dorking_tool", "journals"
+        )
+        self.filepath = os.path.join(self.journal_dir, f"{sweep_id}.jsonl")
+        self.finished = False
+        self._offsets: Dict[str, int] = {}
+        self._size = 0
+        self._file = None
+        self._ensure_dir()
+        self._load()
+
+    @staticmethod
+    def sweep_id_for(*parts: str) -> str:
+        """Derives a stable sweep id from whatever identifies the sweep (cx, target, categories...)."""
+        raw = "\x1f".join(str(p) for p in parts)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def unit_key(query: str, start: int = 1) -> str:
+        return f"{start}\x1f{' '.join(query.split())}"
+
+    def _ensure_dir(self):
+        try:
+            if not os.path.exists(self.journal_dir):
+                os.makedirs(self.journal_dir, exist_ok=True)
+        except Exception as e:
+            print(f"[ERROR] Could not create journal dir: {e}")
+
+    def _load(self):
+        if not os.path.exists(self.filepath):
+            return
+        try:
+            offset = 0
+            with open(self.filepath, "rb") as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete line")
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash; everything before it is intact.
+                        break
+                    kind = record.get("type")
+                    if kind == "unit":
+                        self._offsets[self.unit_key(record.get("query", ""), record.get("start", 1))] = offset
+                    elif kind == "done":
+                        self.finished = True
+                    offset += len(line)
+            self._size = offset
+            if os.path.getsize(self.filepath) > offset:
+                with open(self.filepath, "r+b") as f:
+                    f.truncate(offset)
+        except Exception as e:
+            print(f"[ERROR] Failed to read sweep journal: {e}")
+
+    def _append(self, record: Dict) -> int:
+        """Writes one record line and returns its byte offset."""
+        if self._file is None:
+            self._file = open(self.filepath, "ab")
+            if self._size == 0:
+                self._write_line({
+                    "type": "sweep",
+                    "id": self.sweep_id,
+                    "label": self.label,
+                    "created_at": datetime.now().isoformat()
+                })
+        offset = self._write_line(record)
+        self._file.flush()
+        return offset
+
+    def _write_line(self, record: Dict) -> int:
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        offset = self._size
+        self._file.write(data)
+        self._size += len(data)
+        return offset
+
+    @property
+    def completed_units(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def is_resumable(self) -> bool:
+        return bool(self._offsets) and not self.finished
+
+    def has_unit(self, query: str, start: int = 1) -> bool:
+        return self.unit_key(query, start) in self._offsets
+
+    def load_unit(self, query: str, start: int = 1) -> Optional[List[SearchResult]]:
+        """Reads the stored results of a completed unit from disk."""
+        offset = self._offsets.get(self.unit_key(query, start))
+        if offset is None:
+            return None
+        try:
+            with open(self.filepath, "rb") as f:
+                f.seek(offset)
+                record = json.loads(f.readline())
+            return [SearchResult.from_dict(d) for d in record.get("results", [])]
+        except Exception as e:
+            print(f"[ERROR] Failed to replay journal unit: {e}")
+            return None
+
+    def record_unit(self, category: str, query: str, start: int, num: int,
+                    results: List[SearchResult]):
+        """Appends a completed unit. Call only after the page was fetched successfully."""
+        key = self.unit_key(query, start)
+        if key in self._offsets:
+            return
+        try:
+            self._offsets[key] = self._append({
+                "type": "unit",
+                "category": category,
+                "query": query,
+                "start": start,
+                "num": num,
+                "results": [r.to_dict() for r in results]
+            })
+        except Exception as e:
+            print(f"[ERROR] Failed to write sweep journal: {e}")
+
+    def mark_finished(self):
+        """Marks the sweep as fully completed so it is not offered for resume."""
+        try:
+            self._append({"type": "done", "finished_at": datetime.now().isoformat()})
+            self.finished = True
+        except Exception as e:
+            print(f"[ERROR] Failed to finish sweep journal: {e}")
+        self.close()
+
+    def discard(self):
+        """Deletes the journal to start the sweep from scratch."""
+        self.close()
+        try:
+            if os.path.exists(self.filepath):
+                os.remove(self.filepath)
+        except Exception as e:
+            print(f"[ERROR] Failed to delete sweep journal: {e}")
+        self._offsets.clear()
+        self._size = 0
+        self.finished = False
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
@@ -0,0 +1,225 @@
+"""
+Multi-credential API key pool with per-key quota tracking and rotation.
+Version 1.2.0
+"""
+
+import os
+import time
+import hashlib
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from .rate_limiter import AdvancedRateLimiter, TokenBucket
+
+
+class PooledKey:
+    """One API key/CSE pair with its own daily quota counter."""
+
+    def __init__(self, api_key: str, cse_id: str, label: str, limiter: AdvancedRateLimiter):
+        self.api_key = api_key
+        self.cse_id = cse_id
+        self.label = label or f"key ...{api_key[-4:]}"
+        self.limiter = limiter
+        self.benched_until: float = 0.0
+        self.last_error = ""
+        self.inflight = 0
+
+    @staticmethod
+    def fingerprint(api_key: str) -> str:
+        return hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:12]
+
+    @property
+    def is_benched(self) -> bool:
+        return time.time() < self.benched_until
+
+    @property
+    def remaining(self) -> int:
+        """Daily quota left, minus requests already checked out but not yet answered."""
+        return self.limiter.get_stats()[2] - self.inflight
+
+
+class KeyPool:
+    """
+    Spreads requests across several API keys so their daily quotas add up.
+
+    Drop-in replacement for AdvancedRateLimiter: can_request/throttle/acquire/
+    record_request/get_stats/reset work on the pool as a whole, so the workers,
+    the async engine, and the quota displays need no changes. SearchClient
+    recognises a pool and asks it for a key on every request via checkout(),
+    which returns the key with the most remaining quota. The pool's rate windows
+    are the per-key windows scaled by the number of keys.
+
+    A key answering HTTP 403 (quota exceeded / API disabled) is benched until the
+    next 00:00 UTC reset; HTTP 429 benches it for rate_limit_cooldown seconds.
+    Each key's counter lives in ~/.google_dorking_tool/quota_<fingerprint>.json
+    """
+
+    def __init__(self, keys: List[Tuple[str, str, str]], daily_limit: int = 100,
+                 rate_limit_cooldown: float = 60.0, quota_dir: Optional[str] = None,
+                 per_second: float = 5.0, burst: int = 5, per_minute: int = 100):
+        self.daily_limit = daily_limit
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.per_second = per_second
+        self.burst = burst
+        self.per_minute = per_minute
+        self.quota_dir = quota_dir or os.path.join(os.path.expanduser("~"), ".google_dorking_tool")
+        self.keys: List[PooledKey] = []
+        self._lock = threading.Lock()
+
+        seen = set()
+        for api_key, cse_id, label in keys:
+            api_key = api_key.strip()
+            if not api_key or api_key in seen:
+                continue
+            seen.add(api_key)
+            quota_file = os.path.join(self.quota_dir, f"quota_{PooledKey.fingerprint(api_key)}.json")
+            self.keys.append(PooledKey(api_key, cse_id.strip(), label.strip(), self._key_limiter(quota_file)))
+
+        n = max(1, len(self.keys))
+        self._windows: List[TokenBucket] = [
+            TokenBucket(per_second * n, burst * n),
+            TokenBucket(per_minute * n / 60.0, per_minute * n)
+        ]
+
+    def _key_limiter(self, quota_file: Optional[str] = None) -> AdvancedRateLimiter:
+        return AdvancedRateLimiter(self.daily_limit, quota_file=quota_file, per_second=self.per_second,
+                                   burst=self.burst, per_minute=self.per_minute)
+
+    @classmethod
+    def from_credentials(cls, primary: Tuple[str, str], extra: List[Tuple[str, str, str]],
+                         daily_limit: int = 100) -> "KeyPool":
+        """Builds a pool from the primary credentials plus pooled keys; blank CSE IDs inherit the primary one."""
+        api_key, cse_id = primary
+        entries = [(api_key, cse_id, "primary")] if api_key else []
+        entries.extend((k, c or cse_id, label) for k, c, label in extra)
+        pool = cls([e for e in entries if e[1]], daily_limit=daily_limit)
+        if api_key and cse_id and pool.keys:
+            # The primary key keeps counting in quota.json, shared with single-key mode.
+            pool.keys[0].limiter.close()
+            pool.keys[0].limiter = pool._key_limiter()
+        return pool
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _available(self) -> List[PooledKey]:
+        return [k for k in self.keys if not k.is_benched and k.remaining > 0]
+
+    def checkout(self) -> Optional[PooledKey]:
+        """
+        Returns the usable key with the most remaining daily quota, or None.
+        The key counts one request in flight until release() is called.
+        """
+        with self._lock:
+            available = self._available()
+            if not available:
+                return None
+            key = max(available, key=lambda k: k.remaining)
+            key.inflight += 1
+            return key
+
+    def release(self, key: PooledKey):
+        """Ends a checkout once the request has been answered (or failed)."""
+        with self._lock:
+            key.inflight = max(0, key.inflight - 1)
+
+    def report_failure(self, key: PooledKey, status_code: int, message: str = ""):
+        """Takes a key out of rotation after a quota (403) or rate-limit (429) response."""
+        with self._lock:
+            key.last_error = message
+            if status_code == 403:
+                now = datetime.now(timezone.utc)
+                reset = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+                key.benched_until = reset.timestamp()
+            elif status_code == 429:
+                key.benched_until = time.time() + self.rate_limit_cooldown
+            else:
+                return
+        print(f"[WARN] API key '{key.label}' taken out of rotation: HTTP {status_code}")
+
+    def can_request(self) -> Tuple[bool, str]:
+        """Checks whether any pooled key still has quota and is not benched."""
+        with self._lock:
+            if self._available():
+                return True, ""
+            benched = [k for k in self.keys if k.is_benched]
+        if benched and len(benched) == len(self.keys):
+            return False, f"All {len(self.keys)} pooled API keys are rate limited or out of quota."
+        used, limit, _ = self.get_stats()
+        return False, f"Daily quota reached on all pooled keys ({used}/{limit}). Quota resets at 00:00 UTC."
+
+    def try_acquire(self) -> bool:
+        """Non-blocking: takes a pool-wide send slot only if one is free right now."""
+        if not self.can_request()[0]:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if not all(w.available(now) for w in self._windows):
+                return False
+            for w in self._windows:
+                w.take(now)
+            return True
+
+    def acquire(self) -> float:
+        """Claims the next pool-wide send slot and returns the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            return max(w.take(now) for w in self._windows)
+
+    def throttle(self):
+        """Blocks until the next pool-wide send slot."""
+        delay = self.acquire()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_request(self, key: Optional[PooledKey] = None):
+        """Counts a request against the key that sent it (the key with most headroom if unknown)."""
+        if key is None:
+            with self._lock:
+                available = self._available() or self.keys
+                if not available:
+                    return
+                key = max(available, key=lambda k: k.remaining)
+        key.limiter.record_request()
+
+    def get_stats(self) -> Tuple[int, int, int]:
+        """Returns combined (used, limit, remaining); benched keys contribute no remaining quota."""
+        used = limit = remaining = 0
+        with self._lock:
+            for k in self.keys:
+                k_used, k_limit, k_rem = k.limiter.get_stats()
+                used += k_used
+                limit += k_limit
+                if not k.is_benched:
+                    remaining += k_rem
+        return used, limit, remaining
+
+    def get_key_stats(self) -> List[Dict]:
+        """Per-key usage rows for display."""
+        rows = []
+        with self._lock:
+            for k in self.keys:
+                used, limit, rem = k.limiter.get_stats()
+                rows.append({
+                    "label": k.label,
+                    "used": used,
+                    "limit": limit,
+                    "remaining": rem,
+                    "benched": k.is_benched,
+                    "last_error": k.last_error
+                })
+        return rows
+
+    def close(self):
+        """Closes every key's limiter; call when the pool is replaced or discarded."""
+        for k in self.keys:
+            k.limiter.close()
+
+    def reset(self):
+        """Resets every key's daily counter and puts benched keys back into rotation."""
+        with self._lock:
+            for k in self.keys:
+                k.limiter.reset()
+                k.benched_until = 0.0
+                k.last_error = ""
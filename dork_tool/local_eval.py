@@ -0,0 +1,136 @@
+"""
+Local dork evaluator: answers narrower dorks from complete result sets of broader ones.
+Version 1.2.0
+"""
+
+import threading
+from itertools import combinations
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .models import SearchResult
+from .cache import ResponseCache
+from .result_query import ResultQuery
+
+
+class LocalDorkEvaluator:
+    """
+    Many generated dorks only narrow a broader one: "site:x filetype:pdf" is
+    "site:x" plus one more condition. When the broader dork's results are known
+    to be complete (page 1 came back short of a full page, or totalResults fits
+    in it), the narrower dork's results are exactly the broad results that also
+    satisfy the extra conditions, so no API call is needed.
+
+    Dorks are parsed with ResultQuery into top-level AND terms; a dork refines a
+    broader one when its terms are a strict superset. The extra terms are judged
+    per result with three-valued logic (ResultQuery.decide): site:, inurl: and
+    filetype: are decided from the URL and intitle: from untruncated titles,
+    while bare words and intext: are only decided when present in the snippet.
+    If any broad result stays undecided the dork is sent to the API as usual.
+
+    Complete sets come from record() (fetched, cached, or replayed pages seen
+    during the sweep) and from the response cache, which is probed for the
+    broader forms of a dork made of subsets of its terms.
+    """
+
+    MAX_PROBED_TERMS = 4  # up to 2^4 - 2 cache probes per dork
+
+    def __init__(self, cache: Optional[ResponseCache] = None, cx: str = "", num: int = 10):
+        self.cache = cache
+        self.cx = cx
+        self.num = num
+        self.answered = 0
+        self._complete: Dict[FrozenSet[str], List[SearchResult]] = {}
+        self._parsed: Dict[str, ResultQuery] = {}
+        self._lock = threading.Lock()
+
+    def _parse(self, query: str) -> ResultQuery:
+        with self._lock:
+            parsed = self._parsed.get(query)
+            if parsed is None:
+                parsed = self._parsed[query] = ResultQuery(query)
+            return parsed
+
+    def _keys(self, query: str) -> FrozenSet[str]:
+        return frozenset(key for key, _, _ in self._parse(query).conjuncts)
+
+    @staticmethod
+    def is_complete(results: Sequence[SearchResult], total_available: int, num: int) -> bool:
+        """True when page 1 holds every result Google has for the dork."""
+        return len(results) < num or 0 < total_available <= len(results)
+
+    def refines(self, narrow: str, broad: str) -> bool:
+        """True when narrow is broad plus at least one more top-level term."""
+        broad_keys = self._keys(broad)
+        return bool(broad_keys) and broad_keys < self._keys(narrow)
+
+    def record(self, query: str, results: Sequence[SearchResult], total_available: int = 0,
+               num: Optional[int] = None):
+        """Remembers page 1 of a dork if it is the dork's complete result set."""
+        if not self.is_complete(results, total_available, num or self.num):
+            return
+        keys = self._keys(query)
+        if keys:
+            with self._lock:
+                self._complete[keys] = list(results)
+
+    def _cached_sets(self, query: str) -> List[Tuple[FrozenSet[str], List[SearchResult]]]:
+        """Complete result sets of broader forms of query found in the response cache."""
+        conjuncts = self._parse(query).conjuncts
+        if self.cache is None or not 1 < len(conjuncts) <= self.MAX_PROBED_TERMS:
+            return []
+        found = []
+        for size in range(len(conjuncts) - 1, 0, -1):
+            for subset in combinations(conjuncts, size):
+                if not all(src for _, src, _ in subset):
+                    continue
+                broad = " ".join(src for _, src, _ in subset)
+                cached = self.cache.get(self.cx, broad, 1, self.num)
+                if cached is not None and self.is_complete(cached[0], cached[1], self.num):
+                    keys = frozenset(key for key, _, _ in subset)
+                    with self._lock:
+                        self._complete[keys] = cached[0]
+                    found.append((keys, cached[0]))
+        return found
+
+    def answer(self, query: str, category: str = "Manual") -> Optional[List[SearchResult]]:
+        """
+        The results of query derived from a complete broader result set, or None
+        when no broader set is known or some of its results cannot be decided.
+        """
+        parsed = self._parse(query)
+        keys = self._keys(query)
+        if len(keys) < 2:
+            return None
+        with self._lock:
+            candidates = [(k, r) for k, r in self._complete.items() if k < keys]
+        if not candidates:
+            candidates = self._cached_sets(query)
+        # The broadest match with the most terms leaves the fewest to decide.
+        for broad_keys, broad_results in sorted(candidates, key=lambda c: -len(c[0])):
+            matched = []
+            for r in broad_results:
+                verdict = parsed.decide(r, skip=broad_keys)
+                if verdict is None:
+                    break
+                if verdict:
+                    matched.append(r)
+            else:
+                with self._lock:
+                    self.answered += 1
+                return [
+                    SearchResult(title=r.title, link=r.link, snippet=r.snippet,
+                                 category=category, query=query, timestamp=r.timestamp)
+                    for r in matched
+                ]
+        return None
+
+    @classmethod
+    def broad_first(cls, dorks: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Reorders (category, query) dorks so that dorks refined by another one in
+        the list run before it; everything else keeps its order.
+        """
+        evaluator = cls()
+        queries = [q for _, q in dorks]
+        broad = [any(evaluator.refines(other, q) for other in queries if other != q) for q in queries]
+        return [d for d, b in zip(dorks, broad) if b] + [d for d, b in zip(dorks, broad) if not b]
@@ -3,28 +3,116 @@ Data models for the Google Dorking Tool.
 Version 1.2.0
 """
 
-from dataclasses import dataclass, field
+import sys
+import time
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Union
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=4096)
+def _format_epoch(seconds: int) -> str:
+    # Results of one sweep share a few thousand distinct seconds at most.
+    return sys.intern(time.strftime(TIMESTAMP_FORMAT, time.localtime(seconds)))
+
+
+def format_timestamp(stamp: Union[str, float]) -> str:
+    """A stored creation time as "YYYY-MM-DD HH:MM:SS" local time; strings are returned as given."""
+    return stamp if type(stamp) is str else _format_epoch(int(stamp))
 
 
-@dataclass
 class SearchResult:
-    """Represents an individual search result item."""
-    title: str
-    link: str
-    snippet: str
-    category: str = "Manual"
-    query: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    """
+    Represents an individual search result item.
+
+    Slotted to keep large sweeps small: there is no per-instance __dict__, the
+    category and query strings (repeated across every result of a dork) are
+    interned so all results share one copy, and the creation time is kept as
+    an epoch float that is only formatted when timestamp is read. Timestamps
+    passed in as strings (from the cache, journal, or findings store) are kept
+    as given and interned, since results of one page share the same second.
+    """
+
+    __slots__ = ("title", "link", "snippet", "_category", "_query", "_stamp")
+
+    def __init__(self, title: str, link: str, snippet: str, category: str = "Manual",
+                 query: str = "", timestamp: Union[str, float, None] = None):
+        self.title = title
+        self.link = link
+        self.snippet = snippet
+        self.category = category
+        self.query = query
+        self.timestamp = timestamp
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    @category.setter
+    def category(self, value: str):
+        self._category = sys.intern(value) if type(value) is str else value
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    @query.setter
+    def query(self, value: str):
+        self._query = sys.intern(value) if type(value) is str else value
+
+    @property
+    def timestamp(self) -> str:
+        """Creation time as "YYYY-MM-DD HH:MM:SS" local time."""
+        return format_timestamp(self._stamp)
+
+    @timestamp.setter
+    def timestamp(self, value: Union[str, float, None]):
+        if value is None:
+            self._stamp = time.time()
+        elif type(value) is str:
+            self._stamp = sys.intern(value)
+        else:
+            self._stamp = float(value)
+
+    @property
+    def stamp(self) -> Union[str, float]:
+        """Creation time as stored: an epoch float, or the string it was given."""
+        return self._stamp
+
+    @property
+    def epoch(self) -> float:
+        """Creation time as seconds since the epoch (0.0 if the stored string is unparsable)."""
+        stamp = self._stamp
+        if type(stamp) is not str:
+            return stamp
+        try:
+            return datetime.strptime(stamp, TIMESTAMP_FORMAT).timestamp()
+        except ValueError:
+            return 0.0
+
+    def _fields(self):
+        return (self.title, self.link, self.snippet, self._category, self._query, self.timestamp)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(title={self.title!r}, link={self.link!r}, snippet={self.snippet!r}, "
+                f"category={self._category!r}, query={self._query!r}, timestamp={self.timestamp!r})")
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "title": self.title,
             "link": self.link,
             "snippet": self.snippet,
-            "category": self.category,
-            "query": self.query,
+            "category": self._category,
+            "query": self._query,
             "timestamp": self.timestamp
         }
 
@@ -36,5 +124,5 @@ class SearchResult:
             snippet=data.get("snippet", ""),
             category=data.get("category", "Manual"),
             query=data.get("query", ""),
-            timestamp=data.get("timestamp") or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp=data.get("timestamp") or None
         )
@@ -0,0 +1,224 @@
+"""
+Write-behind daily quota ledger shared safely between app instances.
+Version 1.2.0
+"""
+
+import os
+import json
+import time
+import atexit
+import weakref
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class _InterProcessLock:
+    """Exclusive advisory lock on a sidecar .lock file (fcntl on POSIX, msvcrt on Windows)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = None
+
+    def __enter__(self):
+        self._fh = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        else:
+            self._fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+            else:
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._fh.close()
+            self._fh = None
+        return False
+
+
+class QuotaLedger:
+    """
+    Daily request counter persisted to a JSON file with write-behind batching.
+
+    Increments accumulate in memory and are merged into the file as a delta
+    (file count + pending) under an inter-process lock, so concurrent app
+    instances sharing one quota file add up instead of overwriting each other.
+    Writes go to a temp file followed by os.replace, so a crash never leaves a
+    half-written file. Pending increments are flushed every flush_every requests,
+    by a background flusher after flush_interval seconds, and at interpreter exit.
+    close() flushes and takes the ledger off the background flusher; a closed
+    ledger still counts, writing every increment through.
+    The UTC day boundary is computed once per day and compared as a float.
+    """
+
+    _live: "weakref.WeakSet[QuotaLedger]" = weakref.WeakSet()
+    _flusher: Optional[threading.Thread] = None
+    _flusher_lock = threading.Lock()
+
+    def __init__(self, path: str, daily_limit: int = 100, flush_every: int = 10,
+                 flush_interval: float = 2.0, refresh_interval: float = 5.0):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.daily_limit = daily_limit
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._base = 0        # count last seen on disk
+        self._pending = 0     # increments not yet written
+        self._last_sync = 0.0
+        self._closed = False
+        self._set_day(time.time())
+        self.refresh()
+        self._register(self)
+
+    @classmethod
+    def _register(cls, ledger: "QuotaLedger"):
+        cls._live.add(ledger)
+        with cls._flusher_lock:
+            if cls._flusher is None:
+                cls._flusher = threading.Thread(target=cls._flush_loop, name="quota-ledger", daemon=True)
+                cls._flusher.start()
+                atexit.register(cls.flush_all)
+
+    @classmethod
+    def _flush_loop(cls):
+        while True:
+            time.sleep(0.5)
+            for ledger in list(cls._live):
+                ledger._tick()
+
+    @classmethod
+    def flush_all(cls):
+        # Only unsaved increments need writing; a refresh is pointless at exit.
+        for ledger in list(cls._live):
+            if ledger._pending:
+                ledger.flush()
+
+    def _set_day(self, now: float):
+        current = datetime.fromtimestamp(now, timezone.utc)
+        self.day = current.strftime("%Y-%m-%d")
+        next_day = (current + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._day_end = next_day.timestamp()
+
+    def _check_rollover(self):
+        now = time.time()
+        if now >= self._day_end:
+            self._set_day(now)
+            self._base = 0
+            self._pending = 0
+
+    def _read_disk(self) -> int:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("date") == self.day:
+                return int(data.get("count", 0))
+        except Exception:
+            pass
+        return 0
+
+    def _write_disk(self, count: int):
+        data = {
+            "date": self.day,
+            "count": count,
+            "daily_limit": self.daily_limit,
+            "last_updated": datetime.now(timezone.utc).isoformat()
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            self._check_rollover()
+            return self._base + self._pending
+
+    def stats(self) -> Tuple[int, int, int]:
+        """Returns (used, limit, remaining)."""
+        used = self.count
+        return used, self.daily_limit, max(0, self.daily_limit - used)
+
+    def add(self, n: int = 1):
+        """Counts n requests; written to disk in batches."""
+        with self._lock:
+            self._check_rollover()
+            self._pending += n
+            if self._pending >= self.flush_every or self._closed:
+                self.flush()
+
+    def flush(self):
+        """Merges pending increments into the file under the inter-process lock."""
+        with self._lock:
+            self._check_rollover()
+            try:
+                with _InterProcessLock(self.lock_path):
+                    merged = self._read_disk() + self._pending
+                    if self._pending:
+                        self._write_disk(merged)
+                self._base = merged
+                self._pending = 0
+                self._last_sync = time.time()
+            except Exception as e:
+                print(f"[ERROR] Failed to write quota ledger: {e}")
+
+    def close(self):
+        """Writes pending increments and stops background refreshes of this ledger."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._pending:
+                self.flush()
+        QuotaLedger._live.discard(self)
+
+    def refresh(self):
+        """Picks up increments made by other app instances."""
+        with self._lock:
+            self._check_rollover()
+            try:
+                with _InterProcessLock(self.lock_path):
+                    self._base = self._read_disk()
+                self._last_sync = time.time()
+            except Exception as e:
+                print(f"[ERROR] Failed to read quota ledger: {e}")
+
+    def reset(self):
+        """Sets today's count to zero for every instance sharing the file."""
+        with self._lock:
+            self._check_rollover()
+            try:
+                with _InterProcessLock(self.lock_path):
+                    self._write_disk(0)
+            except Exception as e:
+                print(f"[ERROR] Failed to reset quota ledger: {e}")
+            self._base = 0
+            self._pending = 0
+            self._last_sync = time.time()
+
+    def _tick(self):
+        # A flush with nothing pending is a plain refresh from disk.
+        age = time.time() - self._last_sync
+        if (self._pending and age >= self.flush_interval) or age >= self.refresh_interval:
+            self.flush()
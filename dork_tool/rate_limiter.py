@@ -4,27 +4,75 @@ Version 1.2.0
 """
 
 import os
-import json
 import time
-from datetime import datetime, timezone
-from typing import Tuple
+import threading
+from typing import List, Optional, Tuple
+
+from .quota_ledger import QuotaLedger
+
+
+class TokenBucket:
+    """
+    Refills at `rate` tokens per second up to `capacity`. Tokens may be borrowed
+    (the balance goes negative) so a caller can reserve a future slot and learn
+    how long to wait instead of blocking.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(rate, 1e-9)
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= 1.0
+
+    def take(self, now: float) -> float:
+        """Consumes one token and returns the seconds until it was actually available."""
+        self._refill(now)
+        self.tokens -= 1.0
+        return max(0.0, -self.tokens / self.rate)
 
 
 class AdvancedRateLimiter:
     """
-    Enforces inter-request throttling and tracks daily API quotas.
-    Quota data is saved to ~/.google_dorking_tool/quota.json
+    Enforces request rate windows and tracks daily API quotas.
+
+    Requests pass a per-second bucket (burst size `burst`) and a per-minute bucket
+    (the Custom Search 100 queries/minute cap), so short bursts go out immediately
+    and only sustained traffic is slowed down. The per-day window is the persisted
+    quota counter. min_interval optionally adds a fixed spacing on top.
+    All methods are thread-safe.
+
+    Quota data is kept in a write-behind QuotaLedger backed by
+    ~/.google_dorking_tool/quota.json unless a separate quota_file is given
+    (one per pooled API key).
     """
 
-    def __init__(self, daily_limit: int = 100, min_interval: float = 1.2):
+    def __init__(self, daily_limit: int = 100, min_interval: float = 0.0,
+                 quota_file: Optional[str] = None, per_second: float = 5.0,
+                 burst: int = 5, per_minute: int = 100):
         self.daily_limit = daily_limit
         self.min_interval = min_interval
+        self.per_second = per_second
+        self.burst = burst
+        self.per_minute = per_minute
         self.last_request_time: float = 0.0
-        self.quota_file = os.path.join(
+        self.quota_file = quota_file or os.path.join(
             os.path.expanduser("~"), ".google_dorking_tool", "quota.json"
         )
+        self._lock = threading.RLock()
+        self._windows: List[TokenBucket] = [
+            TokenBucket(per_second, burst),
+            TokenBucket(per_minute / 60.0, per_minute)
+        ]
         self._ensure_dir()
-        self._load_quota()
+        self.ledger = QuotaLedger(self.quota_file, daily_limit)
 
     def _ensure_dir(self):
         try:
@@ -34,69 +82,74 @@ class AdvancedRateLimiter:
         except Exception:
             pass
 
-    def _get_current_utc_date(self) -> str:
-        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    def _load_quota(self):
-        self.today = self._get_current_utc_date()
-        self.requests_today = 0
-        if os.path.exists(self.quota_file):
-            try:
-                with open(self.quota_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if data.get("date") == self.today:
-                        self.requests_today = data.get("count", 0)
-            except Exception:
-                self.requests_today = 0
-
-    def _save_quota(self):
-        try:
-            data = {
-                "date": self.today,
-                "count": self.requests_today,
-                "daily_limit": self.daily_limit,
-                "last_updated": datetime.now(timezone.utc).isoformat()
-            }
-            with open(self.quota_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            pass
+    @property
+    def today(self) -> str:
+        return self.ledger.day
 
-    def _check_day_rollover(self):
-        current_date = self._get_current_utc_date()
-        if current_date != self.today:
-            self.today = current_date
-            self.requests_today = 0
-            self._save_quota()
+    @property
+    def requests_today(self) -> int:
+        return self.ledger.count
 
     def can_request(self) -> Tuple[bool, str]:
         """Checks if a new request is permitted under daily quota."""
-        self._check_day_rollover()
-        if self.requests_today >= self.daily_limit:
-            return False, f"Daily quota reached ({self.requests_today}/{self.daily_limit}). Quota resets at 00:00 UTC."
+        used = self.ledger.count
+        if used >= self.daily_limit:
+            return False, f"Daily quota reached ({used}/{self.daily_limit}). Quota resets at 00:00 UTC."
         return True, ""
 
+    def try_acquire(self) -> bool:
+        """
+        Non-blocking: takes a send slot only if every rate window has one free
+        right now and the daily quota is not exhausted.
+        """
+        with self._lock:
+            if not self.can_request()[0]:
+                return False
+            now = time.monotonic()
+            if now < self.last_request_time + self.min_interval:
+                return False
+            if not all(w.available(now) for w in self._windows):
+                return False
+            for w in self._windows:
+                w.take(now)
+            self.last_request_time = now
+            return True
+
+    def acquire(self) -> float:
+        """
+        Non-blocking reservation: claims the next send slot across all rate windows
+        and returns how many seconds the caller must wait before sending (0 within
+        the burst allowance). Async callers await that delay; threads sleep it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max([0.0, self.last_request_time + self.min_interval - now] +
+                        [w.take(now) for w in self._windows])
+            self.last_request_time = now + delay
+            return delay
+
     def throttle(self):
-        """Enforces minimum inter-request delay."""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_request_time = time.time()
+        """Blocks until the next send slot; the lock is not held while sleeping."""
+        delay = self.acquire()
+        if delay > 0:
+            time.sleep(delay)
 
     def record_request(self):
-        """Increments and persists the daily request counter."""
-        self._check_day_rollover()
-        self.requests_today += 1
-        self._save_quota()
+        """Increments the daily request counter (persisted in batches by the ledger)."""
+        self.ledger.add()
 
     def get_stats(self) -> Tuple[int, int, int]:
         """Returns (used, limit, remaining)."""
-        self._check_day_rollover()
-        remaining = max(0, self.daily_limit - self.requests_today)
-        return self.requests_today, self.daily_limit, remaining
+        return self.ledger.stats()
+
+    def flush(self):
+        """Writes pending quota increments to disk now."""
+        self.ledger.flush()
+
+    def close(self):
+        """Writes pending quota increments and stops background syncing; call when the limiter is replaced."""
+        self.ledger.close()
 
     def reset(self):
         """Manually resets the daily request counter."""
-        self.requests_today = 0
-        self._save_quota()
+        self.ledger.reset()
@@ -0,0 +1,385 @@
+"""
+Local query language for slicing fetched results with dork operators.
+Version 1.2.0
+"""
+
+import re
+from itertools import compress, repeat
+from operator import contains
+from typing import Collection, List, Optional, Sequence, Set, Tuple
+
+from .models import SearchResult
+from .search_index import ResultSearchIndex
+
+# Positions in a row tuple: lowercased title, link, snippet, and the whole haystack.
+TITLE, LINK, SNIPPET, ANY = range(4)
+
+_FIELD_OPS = {
+    "intitle": TITLE, "allintitle": TITLE,
+    "inurl": LINK, "allinurl": LINK,
+    "intext": SNIPPET, "allintext": SNIPPET,
+}
+_LINK_OPS = ("site", "filetype", "ext")
+# Dork operators with no local meaning; a dork using them cannot be decided locally.
+_FOREIGN_OPS = ("cache", "link", "related", "info", "before", "after")
+_CANONICAL_OPS = {"ext": "filetype", "allintitle": "intitle", "allinurl": "inurl", "allintext": "intext"}
+
+_URL_PREFIX = r"(?:[a-z][a-z0-9+.\-]*://|(?![a-z][a-z0-9+.\-]*://))(?:[^/?#@]*@)?"
+_LEXER = re.compile(r'\s*(?:(\()|(\))|(-)?(?:([A-Za-z]+):)?(?:"([^"]*)"?|([^\s()"]+)))')
+# FTS5 column of each operator FindingsStore indexes ("" searches title and snippet).
+_FTS_COLUMNS = {"": "", "intitle": "title", "allintitle": "title", "intext": "snippet", "allintext": "snippet"}
+_WORD = re.compile(r"\w")
+
+
+def _decide_all(nodes: list, row: Tuple[str, str, str, str]) -> Optional[bool]:
+    """Three-valued AND: False beats unknown (None), which beats True."""
+    unknown = False
+    for n in nodes:
+        answer = n.decide(row)
+        if answer is False:
+            return False
+        unknown = unknown or answer is None
+    return None if unknown else True
+
+
+def _fts_and(nodes: list) -> Tuple[Optional[str], list]:
+    """
+    FTS5 expression for the AND of the nodes it can express, and the nodes
+    left over. Exclusions need at least one positive term (NOT is binary).
+    """
+    positive, negative, rest = [], [], []
+    for n in nodes:
+        expr = n.node.fts() if isinstance(n, _Not) else n.fts()
+        if expr is None:
+            rest.append(n)
+        else:
+            (negative if isinstance(n, _Not) else positive).append(expr)
+    if not positive:
+        return None, list(nodes)
+    expr = " AND ".join(positive)
+    if negative:
+        expr = f"({expr}) NOT ({' OR '.join(negative)})"
+    return f"({expr})", rest
+
+
+class _Term:
+    """One operator or word, e.g. intitle:"login page", site:example.com, filetype:pdf, admin."""
+
+    def __init__(self, op: str, value: str, foreign: bool = False):
+        self.op = op
+        self.value = value.lower()
+        self.foreign = foreign
+        self.pattern = None
+        self.needle = self.value  # substring every match contains, for the index prefilter
+        if op == "site":
+            self.value = self.value.split("://", 1)[-1]
+            host, slash, path = self.value.partition("/")
+            # Host or any subdomain of it (only subdomains for *.host), then the path prefix if given.
+            subdomains = r"(?:[^/?#@:]*\.)"
+            if host.startswith("*."):
+                host = host[2:]
+            else:
+                subdomains += "?"
+            self.needle = host  # a port may sit between the host and the path
+            self.pattern = re.compile(
+                _URL_PREFIX + subdomains + re.escape(host) + r"(?::\d*)?"
+                + (re.escape(slash + path) if path else r"(?=[/?#]|$)")
+            )
+        elif op in ("filetype", "ext"):
+            self.value = self.needle = "." + self.value.lstrip(".")
+            self.pattern = re.compile(_URL_PREFIX + r"[^/?#]*/[^?#]*" + re.escape(self.value) + r"(?=[?#]|$)")
+
+    @property
+    def key(self) -> str:
+        return f"{_CANONICAL_OPS.get(self.op, self.op)}:{self.value}"
+
+    def test(self, row: Tuple[str, str, str, str]) -> bool:
+        if self.pattern is not None:
+            return self.pattern.match(row[LINK]) is not None
+        return self.value in row[_FIELD_OPS.get(self.op, ANY)]
+
+    def decide(self, row: Tuple[str, str, str, str]) -> Optional[bool]:
+        """
+        What Google would answer for this result, or None when the result's
+        fields cannot tell: snippets are excerpts, so a word missing from them
+        may still be on the page, and titles ending in "..." are truncated.
+        """
+        if self.foreign:
+            return None
+        if self.pattern is not None or self.op in ("inurl", "allinurl"):
+            return self.test(row)
+        if self.test(row):
+            return True
+        if self.op in ("intitle", "allintitle") and not row[TITLE].endswith("..."):
+            return False
+        return None
+
+    def fts(self) -> Optional[str]:
+        """FTS5 expression over title/snippet columns, or None when the term is not about them."""
+        if self.foreign or self.op not in _FTS_COLUMNS or not _WORD.search(self.value):
+            return None
+        value, prefix = (self.value[:-1], "*") if self.value.endswith("*") else (self.value, "")
+        phrase = '"' + value.replace('"', '""') + '"' + prefix
+        column = _FTS_COLUMNS[self.op]
+        return f"{column} : {phrase}" if column else phrase
+
+    def lookup(self, index: ResultSearchIndex, within: Optional[Sequence[int]] = None) -> Set[int]:
+        # A match in any field is a superset of a match in one field; narrow it on the column.
+        rows = index.search(self.needle, rows=within)
+        if self.pattern is not None:
+            links = index.fields[LINK]
+            rows = compress(rows, map(self.pattern.match, map(links.__getitem__, rows)))
+        elif self.op:
+            column = index.fields[_FIELD_OPS[self.op]]
+            rows = compress(rows, map(contains, map(column.__getitem__, rows), repeat(self.value)))
+        return set(rows)
+
+
+class _Not:
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def key(self) -> str:
+        return "-" + self.node.key
+
+    def test(self, row: Tuple[str, str, str, str]) -> bool:
+        return not self.node.test(row)
+
+    def decide(self, row: Tuple[str, str, str, str]) -> Optional[bool]:
+        answer = self.node.decide(row)
+        return None if answer is None else not answer
+
+    def fts(self) -> Optional[str]:
+        return None  # FTS5 NOT is binary; _And and ResultQuery.fts place exclusions
+
+    def lookup(self, index: ResultSearchIndex, within: Optional[Sequence[int]] = None) -> Set[int]:
+        rows = set(range(len(index)) if within is None else within)
+        return rows - self.node.lookup(index, within)
+
+
+class _And:
+    def __init__(self, nodes: list):
+        # Exclusions last: they only subtract from what the other terms matched.
+        self.nodes = sorted(nodes, key=lambda n: isinstance(n, _Not))
+
+    @property
+    def key(self) -> str:
+        return "(" + " ".join(sorted(n.key for n in self.nodes)) + ")"
+
+    def test(self, row: Tuple[str, str, str, str]) -> bool:
+        return all(n.test(row) for n in self.nodes)
+
+    def decide(self, row: Tuple[str, str, str, str]) -> Optional[bool]:
+        return _decide_all(self.nodes, row)
+
+    def fts(self) -> Optional[str]:
+        expr, rest = _fts_and(self.nodes)
+        return None if rest else expr
+
+    def lookup(self, index: ResultSearchIndex, within: Optional[Sequence[int]] = None) -> Set[int]:
+        # Each term only searches the rows the previous ones matched.
+        rows = None
+        for node in self.nodes:
+            rows = node.lookup(index, within if rows is None else sorted(rows))
+            if not rows:
+                break
+        return rows
+
+
+class _Or:
+    def __init__(self, nodes: list):
+        self.nodes = nodes
+
+    @property
+    def key(self) -> str:
+        return "(" + " OR ".join(sorted(n.key for n in self.nodes)) + ")"
+
+    def test(self, row: Tuple[str, str, str, str]) -> bool:
+        return any(n.test(row) for n in self.nodes)
+
+    def decide(self, row: Tuple[str, str, str, str]) -> Optional[bool]:
+        unknown = False
+        for n in self.nodes:
+            answer = n.decide(row)
+            if answer:
+                return True
+            unknown = unknown or answer is None
+        return None if unknown else False
+
+    def fts(self) -> Optional[str]:
+        exprs = [n.fts() for n in self.nodes]
+        return "(" + " OR ".join(exprs) + ")" if all(exprs) else None
+
+    def lookup(self, index: ResultSearchIndex, within: Optional[Sequence[int]] = None) -> Set[int]:
+        rows = set()
+        for node in self.nodes:
+            rows |= node.lookup(index, within)
+        return rows
+
+
+class ResultQuery:
+    """
+    Filter expression over fetched results using the dork operator vocabulary
+    of DorkEngine.OPERATORS, evaluated locally without any API request.
+
+    Supported: intitle:, inurl:, intext: (snippet), allintitle:/allinurl:/
+    allintext: (apply to every following word), site: (host suffix plus
+    optional path prefix), filetype:/ext: (URL path extension), "quoted
+    phrases", -exclusion, OR / |, AND, and parentheses. Bare words match any
+    field. Matching is case-insensitive. Operators without a local meaning
+    (cache:, related:, before:, ...) are matched as literal text. Parsing never
+    fails; unbalanced quotes or parentheses are closed at the end.
+
+    conjuncts lists the top-level AND terms under canonical keys, and decide()
+    judges a result with three-valued logic, so LocalDorkEvaluator can tell
+    when one dork only narrows another.
+
+    The text is compiled once into a tree that serves both as a predicate
+    (matches) and as an index lookup (select): every term is answered from a
+    ResultSearchIndex, field operators narrowing its candidates on the index's
+    lowercase columns, and id sets are combined with set algebra. Within an
+    AND group each term only searches the rows the previous terms matched.
+    """
+
+    def __init__(self, text: str = ""):
+        self.text = text.strip()
+        self._tokens = list(self._lex(self.text))
+        self._pos = 0
+        self._sources = {}
+        self.root = self._parse_or(None, 0) if self._tokens else None
+        self._tokens = []
+        # Top-level AND terms as (canonical key, source text, node).
+        nodes = self.root.nodes if isinstance(self.root, _And) else [self.root] if self.root else []
+        self.conjuncts: List[Tuple[str, str, object]] = [
+            (n.key, self._sources.get(id(n), ""), n) for n in nodes
+        ]
+        self._sources = {}
+
+    @property
+    def is_empty(self) -> bool:
+        return self.root is None
+
+    @property
+    def plain(self) -> Optional[str]:
+        """The substring when the query is a single bare word or phrase, else None."""
+        if isinstance(self.root, _Term) and self.root.op == "":
+            return self.root.value
+        return None
+
+    # Parsing
+    @staticmethod
+    def _lex(text: str):
+        """Yields (kind, negated, op, value, foreign, start, end) tuples."""
+        pos = 0
+        while pos < len(text):
+            m = _LEXER.match(text, pos)
+            if not m or m.end() == pos:
+                break
+            pos = m.end()
+            start = m.end() - len(m.group(0).lstrip())
+            if m.group(1) or m.group(2):
+                yield m.group(1) or m.group(2), False, "", "", False, start, pos
+                continue
+            op = (m.group(4) or "").lower()
+            quoted = m.group(5) is not None
+            value = m.group(5) if quoted else m.group(6)
+            foreign = op in _FOREIGN_OPS
+            if op and op not in _FIELD_OPS and op not in _LINK_OPS:
+                value = f"{m.group(4)}:{value}"
+                op = ""
+            if not op and not quoted and not m.group(3) and value in ("OR", "|", "AND"):
+                yield value, False, "", "", False, start, pos
+                continue
+            yield "term", bool(m.group(3)), op, value, foreign, start, pos
+
+    def _peek(self) -> Optional[str]:
+        return self._tokens[self._pos][0] if self._pos < len(self._tokens) else None
+
+    def _parse_or(self, field_op: Optional[str], depth: int):
+        branches = [self._parse_and(field_op, depth)]
+        while self._peek() in ("OR", "|"):
+            self._pos += 1
+            branches.append(self._parse_and(field_op, depth))
+        branches = [b for b in branches if b is not None]
+        if not branches:
+            return None
+        return branches[0] if len(branches) == 1 else _Or(branches)
+
+    def _parse_and(self, field_op: Optional[str], depth: int):
+        nodes = []
+        while True:
+            kind = self._peek()
+            if kind is None or kind in ("OR", "|") or (kind == ")" and depth):
+                break
+            token = self._tokens[self._pos]
+            self._pos += 1
+            if kind in ("AND", ")"):
+                continue  # AND is implied; a stray ")" at top level is ignored
+            if kind == "(":
+                node = self._parse_or(field_op, depth + 1)
+                if self._peek() == ")":
+                    self._pos += 1
+                if node is not None:
+                    nodes.append(node)
+                    if not depth:
+                        self._sources[id(node)] = self.text[token[5]:self._tokens[self._pos - 1][6]]
+                continue
+            _, negated, op, value, foreign, start, end = token
+            if op.startswith("allin"):
+                field_op = op
+            node = _Term(op or field_op or "", value, foreign)
+            if not node.value:
+                continue
+            node = _Not(node) if negated else node
+            nodes.append(node)
+            if not depth:
+                self._sources[id(node)] = self.text[start:end]
+        if not nodes:
+            return None
+        return nodes[0] if len(nodes) == 1 else _And(nodes)
+
+    # Evaluation
+    @staticmethod
+    def _row(result: SearchResult) -> Tuple[str, str, str, str]:
+        title, link, snippet = result.title.lower(), result.link.lower(), result.snippet.lower()
+        return title, link, snippet, "\0".join((title, link, snippet, result.category.lower()))
+
+    def matches(self, result: SearchResult) -> bool:
+        """Predicate form, usable on any SearchResult."""
+        return self.root is None or self.root.test(self._row(result))
+
+    def matches_terms(self, result: SearchResult, nodes: Sequence) -> bool:
+        """True when result passes every node, e.g. the terms left over by fts()."""
+        row = self._row(result)
+        return all(n.test(row) for n in nodes)
+
+    def decide(self, result: SearchResult, skip: Collection[str] = ()) -> Optional[bool]:
+        """
+        Whether Google would return result for this query as a dork, judged from
+        the result's own fields: True, False, or None when they cannot tell.
+        Top-level terms whose keys are in skip are taken as already satisfied.
+        """
+        return _decide_all([n for key, _, n in self.conjuncts if key not in skip], self._row(result))
+
+    def fts(self) -> Tuple[Optional[str], list]:
+        """
+        FTS5 MATCH expression for the top-level terms about titles and snippets
+        (words, phrases, word* prefixes, intitle:, intext:, their exclusions and
+        OR groups), and the terms left to test per result, e.g. site:. The
+        expression is None when no positive term can be expressed.
+        """
+        return _fts_and([n for _, _, n in self.conjuncts])
+
+    def select(self, index: ResultSearchIndex, category: Optional[str] = None,
+               rows: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Row ids (ascending) of index matching the query and, if given, category.
+        rows restricts the evaluation to those ids (e.g. newly appended rows).
+        """
+        plain = self.plain
+        if self.root is None or plain is not None:
+            return index.search(plain or "", category, rows)
+        if category is not None:
+            rows = index.search("", category, rows)
+        return sorted(self.root.lookup(index, rows))
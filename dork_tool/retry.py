@@ -0,0 +1,74 @@
+"""
+Retry policy with jittered exponential backoff for Custom Search API requests.
+Version 1.2.0
+"""
+
+import time
+import random
+import threading
+from typing import Optional
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed page request is retried.
+
+    Retries HTTP 429/5xx responses and timeouts/network errors (no status code),
+    never credential or quota errors. Delays use full-jitter exponential backoff
+    (uniform between 0 and base_delay * 2^(attempt-1), capped at max_delay); a
+    Retry-After value from the server is used as the minimum. At most
+    max_attempts sends are made per page, and no retry is scheduled past the
+    sweep deadline (sweep_deadline seconds after start()).
+
+    wait() sleeps on an Event, so cancel() interrupts a pending backoff at once.
+    One policy instance belongs to one sweep or search.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 30.0,
+                 sweep_deadline: Optional[float] = None):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sweep_deadline = sweep_deadline
+        self.retries = 0
+        self._deadline_at: Optional[float] = None
+        self._cancelled = threading.Event()
+
+    def start(self):
+        """Starts the sweep clock and clears any earlier cancellation."""
+        self._cancelled.clear()
+        self.retries = 0
+        self._deadline_at = time.monotonic() + self.sweep_deadline if self.sweep_deadline else None
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def is_retryable(self, page) -> bool:
+        """True for a failed, non-fatal PageResponse with a transient status."""
+        if page.ok or page.fatal:
+            return False
+        return page.status_code == 0 or page.status_code in self.RETRY_STATUSES
+
+    def next_delay(self, attempt: int, retry_after: float = 0.0) -> Optional[float]:
+        """
+        Seconds to wait before send number attempt+1, or None when attempts,
+        the deadline, or cancellation rule out another try.
+        """
+        if attempt >= self.max_attempts or self.cancelled:
+            return None
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = max(retry_after, random.uniform(0, ceiling))
+        if self._deadline_at is not None and time.monotonic() + delay > self._deadline_at:
+            return None
+        self.retries += 1
+        return delay
+
+    def wait(self, delay: float) -> bool:
+        """Sleeps for delay seconds; returns False if cancelled meanwhile."""
+        return not self._cancelled.wait(delay)
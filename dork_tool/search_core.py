@@ -0,0 +1,349 @@
+"""
+Qt-free Custom Search API core shared by the GUI workers, the async sweep engine,
+and the headless CLI.
+Version 1.2.0
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .models import SearchResult
+from .rate_limiter import AdvancedRateLimiter
+from .key_pool import KeyPool, PooledKey
+from .session import CSE_ENDPOINT, HttpSessionManager
+from .cache import ResponseCache
+from .retry import RetryPolicy
+from .dedup import HashedSeenSet, canonical_url
+
+
+@dataclass
+class PageResponse:
+    """Outcome of fetching one page of results."""
+    results: List[SearchResult] = field(default_factory=list)
+    total_available: int = 0
+    error: str = ""
+    status_code: int = 0
+    from_cache: bool = False
+    fatal: bool = False  # credential/permission errors that should stop a sweep
+    retry_after: float = 0.0  # seconds requested by a Retry-After header
+    local: bool = False  # derived from a broader dork's results without a request
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class SearchClient:
+    """
+    Fetches result pages from the Custom Search API through the shared session,
+    the response cache, and the rate limiter. Limiter access is serialized, so one
+    client can be used from several threads.
+
+    When the rate limiter is a KeyPool, every request is sent with the pooled key
+    that has the most quota left; a key answering 403/429 is benched and the page
+    is retried with the next key. Pages are cached under the cx that answered
+    them, so a pool mixing search engines never serves one engine's results as
+    another's; cache lookups try the primary engine first, then the pool's others.
+
+    Transient failures (429, 5xx, timeouts) are retried by fetch_page() and
+    request_with_retry() according to retry_policy; cancel() interrupts a backoff
+    or a rate-limit wait.
+
+    fetch_results() collects up to 100 results of one query page by page, or,
+    with concurrency > 1, fetches the pages after the first in parallel.
+    """
+
+    def __init__(self, api_key: str, cse_id: str,
+                 rate_limiter: Optional[AdvancedRateLimiter] = None,
+                 http_session: Optional[HttpSessionManager] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        self.api_key = api_key
+        self.cse_id = cse_id
+        self.rate_limiter = rate_limiter or AdvancedRateLimiter()
+        self.key_pool = self.rate_limiter if isinstance(self.rate_limiter, KeyPool) else None
+        self.http = http_session or HttpSessionManager.shared()
+        self.cache = response_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._limiter_lock = threading.Lock()
+
+    def cancel(self):
+        """Interrupts any rate-limit wait or retry backoff in progress and prevents further retries."""
+        self.retry_policy.cancel()
+
+    @staticmethod
+    def _retry_after(response) -> float:
+        value = (getattr(response, "headers", None) or {}).get("Retry-After", "")
+        if not value:
+            return 0.0
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return 0.0
+
+    @property
+    def has_credentials(self) -> bool:
+        if self.key_pool is not None:
+            return len(self.key_pool) > 0
+        return bool(self.api_key and self.cse_id)
+
+    def cached_page(self, query: str, start: int = 1, num: int = 10,
+                    category: str = "Manual") -> Optional[PageResponse]:
+        """Returns a cached page, or None on a miss. Never touches the limiter."""
+        if not self.cache:
+            return None
+        cached = None
+        for cse_id in self._engines():
+            cached = self.cache.get(cse_id, query, start, num, category=category)
+            if cached is not None:
+                break
+        if cached is None:
+            return None
+        return PageResponse(results=cached[0], total_available=cached[1], status_code=200, from_cache=True)
+
+    def _engines(self) -> List[str]:
+        """CSE IDs requests may be sent with: the primary one first, then the pool's others."""
+        engines = [self.cse_id] if self.cse_id else []
+        if self.key_pool is not None:
+            for key in self.key_pool.keys:
+                if key.cse_id not in engines:
+                    engines.append(key.cse_id)
+        return engines
+
+    def request_page(self, query: str, start: int = 1, num: int = 10,
+                     category: str = "Manual") -> PageResponse:
+        """
+        Sends one API request and records it against the quota.
+        Callers are responsible for quota checks and throttling beforehand.
+        """
+        if self.key_pool is None:
+            return self._send(self.api_key, self.cse_id, None, query, start, num, category)
+
+        page = None
+        for _ in range(len(self.key_pool)):
+            key = self.key_pool.checkout()
+            if key is None:
+                break
+            try:
+                page = self._send(key.api_key, key.cse_id, key, query, start, num, category)
+            finally:
+                self.key_pool.release(key)
+            if page.status_code not in (403, 429):
+                return page
+            self.key_pool.report_failure(key, page.status_code, page.error)
+
+        last_error = f" Last error: {page.error}" if page is not None else ""
+        return PageResponse(
+            error=f"All pooled API keys are rate limited or out of quota.{last_error}",
+            status_code=page.status_code if page is not None else 0,
+            fatal=page is None or page.status_code != 429
+        )
+
+    def _send(self, api_key: str, cse_id: str, pooled_key: Optional[PooledKey],
+              query: str, start: int, num: int, category: str) -> PageResponse:
+        params = {
+            "key": api_key,
+            "cx": cse_id,
+            "q": query,
+            "num": num,
+            "start": start
+        }
+
+        try:
+            response = self.http.get(CSE_ENDPOINT, params=params, timeout=12)
+            with self._limiter_lock:
+                if pooled_key is not None:
+                    self.key_pool.record_request(pooled_key)
+                else:
+                    self.rate_limiter.record_request()
+        except requests.exceptions.Timeout:
+            return PageResponse(error="Search request timed out. Please check your network connection.")
+        except requests.exceptions.RequestException as e:
+            return PageResponse(error=f"Network error: {str(e)}")
+
+        status = response.status_code
+        if status == 200:
+            try:
+                data = response.json()
+                if not isinstance(data, dict):
+                    raise ValueError("not a JSON object")
+                total_available = int(data.get("searchInformation", {}).get("totalResults", "0"))
+            except ValueError:
+                # A proxy error or captive portal page served with HTTP 200.
+                return PageResponse(error="Invalid API response: HTTP 200 without a JSON result body. "
+                                          "Check for a proxy or captive portal.", status_code=status)
+            page = [
+                SearchResult(
+                    title=item.get("title", "No Title"),
+                    link=item.get("link", ""),
+                    snippet=item.get("snippet", ""),
+                    category=category,
+                    query=query
+                )
+                for item in data.get("items", [])
+            ]
+            if self.cache:
+                self.cache.put(cse_id, query, start, num, page, total_available)
+            return PageResponse(results=page, total_available=total_available, status_code=status)
+        elif status == 400:
+            return PageResponse(error="HTTP 400: Invalid Request or invalid CSE ID.", status_code=status, fatal=True)
+        elif status == 403:
+            return PageResponse(
+                error="HTTP 403: Forbidden - Custom Search API not enabled or daily quota exceeded.",
+                status_code=status, fatal=True
+            )
+        elif status == 429:
+            return PageResponse(error="HTTP 429: Rate limited by Google. Please wait a moment.",
+                                status_code=status, retry_after=self._retry_after(response))
+        else:
+            return PageResponse(error=f"API Error {status}: {response.text[:120]}",
+                                status_code=status, retry_after=self._retry_after(response))
+
+    def fetch_page(self, query: str, start: int = 1, num: int = 10,
+                   category: str = "Manual") -> PageResponse:
+        """Cache lookup, then request_with_retry() - the blocking path."""
+        cached = self.cached_page(query, start, num, category)
+        if cached is not None:
+            return cached
+        return self.request_with_retry(query, start, num, category)
+
+    @staticmethod
+    def page_plan(start: int, wanted: int, total_available: int = 0) -> List[Tuple[int, int]]:
+        """(start, num) offsets for wanted results from start, capped by total_available and the API's 100-result window."""
+        if total_available:
+            wanted = min(wanted, max(0, total_available - (start - 1)))
+        plan = []
+        while wanted > 0 and start <= 91:
+            num = min(10, wanted)
+            plan.append((start, num))
+            start += num
+            wanted -= num
+        return plan
+
+    def fetch_results(self, query: str, num_results: int = 10, start: int = 1,
+                      category: str = "Manual", concurrency: int = 1,
+                      on_progress: Optional[Callable[[int, str], None]] = None,
+                      on_error: Optional[Callable[[str], None]] = None) -> Tuple[List[SearchResult], int]:
+        """
+        Fetches up to num_results (max 100) results of query from start.
+        Returns (results, total_available).
+
+        The first page is fetched on its own to learn how many results exist.
+        With concurrency > 1 the remaining pages are then fetched through a
+        bounded pool and reassembled in offset order; otherwise they are
+        fetched one after another. Either way results stop at the first failed
+        or short page, and a result whose canonical URL already appeared on
+        an earlier page (the index can shift between requests) is dropped.
+        Every page passes through the rate limiter and the retry policy;
+        cancel() stops further pages.
+        """
+        on_progress = on_progress or (lambda p, m: None)
+        report = on_error or (lambda m: None)
+
+        def on_error(message: str):
+            # A page cut short by cancel() is not an error worth reporting.
+            if not self.retry_policy.cancelled:
+                report(message)
+
+        num_results = min(max(num_results, 1), 100)
+        concurrency = min(max(concurrency, 1), 10)
+        results: List[SearchResult] = []
+        seen = HashedSeenSet()
+
+        def keep(page: List[SearchResult]):
+            results.extend(r for r in page if not r.link or seen.add(canonical_url(r.link)))
+
+        first_num = min(10, num_results)
+        on_progress(15, f"Fetching results {start} - {start + first_num - 1}...")
+        first = self.fetch_page(query, start, first_num, category)
+        if not first.ok:
+            on_error(first.error)
+            return results, first.total_available
+        keep(first.results)
+        total_available = first.total_available
+        if len(first.results) < first_num:
+            return results, total_available
+
+        plan = self.page_plan(start + first_num, num_results - first_num, total_available)
+        if not plan or self.retry_policy.cancelled:
+            return results, total_available
+
+        if concurrency <= 1:
+            for done, (page_start, num) in enumerate(plan):
+                if self.retry_policy.cancelled:
+                    break
+                on_progress(min(90, int(15 + (done + 1) / (len(plan) + 1) * 75)),
+                            f"Fetching results {page_start} - {page_start + num - 1}...")
+                page = self.fetch_page(query, page_start, num, category)
+                if not page.ok:
+                    on_error(page.error)
+                    break
+                keep(page.results)
+                if len(page.results) < num:
+                    break
+            return results, total_available
+
+        on_progress(30, f"Fetching {len(plan)} more pages ({concurrency} in parallel)...")
+        pages: Dict[int, Optional[PageResponse]] = {}  # None: skipped after cancel()
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(plan))) as pool:
+            futures = {pool.submit(self._fetch_unless_cancelled, query, page_start, num, category): page_start
+                       for page_start, num in plan}
+            for future in as_completed(futures):
+                pages[futures[future]] = future.result()
+                on_progress(min(90, int(30 + (len(pages) / len(plan)) * 60)),
+                            f"Fetched {len(pages)}/{len(plan)} pages...")
+
+        # Reassemble in offset order, stopping at the first failed or short page.
+        for page_start, num in plan:
+            page = pages[page_start]
+            if page is None:
+                break
+            if not page.ok:
+                on_error(page.error)
+                break
+            keep(page.results)
+            if len(page.results) < num:
+                break
+        return results, total_available
+
+    def _fetch_unless_cancelled(self, query: str, start: int, num: int, category: str) -> Optional[PageResponse]:
+        if self.retry_policy.cancelled:
+            return None
+        return self.fetch_page(query, start, num, category)
+
+    def request_with_retry(self, query: str, start: int = 1, num: int = 10,
+                           category: str = "Manual") -> PageResponse:
+        """Quota check, throttle, and request, repeated with backoff while the failure is transient."""
+        attempt = 1
+        while True:
+            with self._limiter_lock:
+                can_req, msg = self.rate_limiter.can_request()
+                if not can_req:
+                    return PageResponse(error=msg, fatal=True)
+                delay = self.rate_limiter.acquire()
+            # Wait outside the lock so parallel page fetches only wait for their own slot.
+            if delay > 0 and not self.retry_policy.wait(delay):
+                return PageResponse(error="Search cancelled.")
+
+            page = self.request_page(query, start, num, category)
+            if not self.retry_policy.is_retryable(page):
+                return page
+            backoff = self.retry_policy.next_delay(attempt, page.retry_after)
+            if backoff is None:
+                if attempt > 1:
+                    page.error = f"{page.error} (gave up after {attempt} attempts)"
+                return page
+            if not self.retry_policy.wait(backoff):
+                return page
+            attempt += 1
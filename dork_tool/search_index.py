@@ -0,0 +1,153 @@
+"""
+Incremental in-memory search index for filtering fetched results.
+Version 1.2.0
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from itertools import compress, repeat
+from operator import contains
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import SearchResult
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class ResultSearchIndex:
+    """
+    Case-insensitive substring index over title, link, snippet, and category.
+
+    Each result is lowercased once when it is added: its fields are kept as
+    columns and joined into one haystack string (separated by NUL so a match
+    never spans two fields), and its alphanumeric tokens are added to an inverted index of token -> row ids.
+    Row ids are positions in arrival order.
+
+    search() narrows the candidates through the token index (every query token
+    must occur inside some token of a matching row) and then confirms the
+    substring against the pre-lowercased haystacks; a single-token query is
+    answered from the postings alone. Queries that are not
+    selective enough for the index to help fall back to one C-level pass over
+    the haystacks.
+    """
+
+    MIN_TOKEN = 2
+
+    def __init__(self):
+        self.haystacks: List[str] = []
+        # Lowercased title, link, and snippet columns for field-scoped queries.
+        self.fields: Tuple[List[str], List[str], List[str]] = ([], [], [])
+        self._postings: Dict[str, array] = {}
+        self._by_category: Dict[str, array] = {}
+        self._vocab = ""                  # "\n"-separated tokens, scanned with str.find
+        self._new_tokens: List[str] = []  # tokens not yet merged into _vocab
+
+    def __len__(self) -> int:
+        return len(self.haystacks)
+
+    def clear(self):
+        self.haystacks = []
+        self.fields = ([], [], [])
+        self._postings = {}
+        self._by_category = {}
+        self._vocab = ""
+        self._new_tokens = []
+
+    def add(self, results: Iterable[SearchResult]):
+        """Indexes results as the next row ids."""
+        postings = self._postings
+        titles, links, snippets = self.fields
+        for r in results:
+            row = len(self.haystacks)
+            title, link, snippet = r.title.lower(), r.link.lower(), r.snippet.lower()
+            haystack = "\0".join((title, link, snippet, r.category.lower()))
+            self.haystacks.append(haystack)
+            titles.append(title)
+            links.append(link)
+            snippets.append(snippet)
+            for token in set(_TOKEN.findall(haystack)):
+                ids = postings.get(token)
+                if ids is None:
+                    postings[token] = array("I", (row,))
+                    self._new_tokens.append(token)
+                else:
+                    ids.append(row)
+            ids = self._by_category.get(r.category)
+            if ids is None:
+                self._by_category[r.category] = array("I", (row,))
+            else:
+                ids.append(row)
+
+    def category_rows(self, category: str) -> Sequence[int]:
+        return self._by_category.get(category, ())
+
+    def _tokens_containing(self, fragment: str) -> List[str]:
+        if self._new_tokens:
+            merged = "\n".join(self._new_tokens)
+            self._vocab = f"{self._vocab}\n{merged}" if self._vocab else merged
+            self._new_tokens = []
+        vocab = self._vocab
+        found = []
+        pos = vocab.find(fragment)
+        while pos != -1:
+            start = vocab.rfind("\n", 0, pos) + 1
+            end = vocab.find("\n", pos)
+            if end == -1:
+                end = len(vocab)
+            found.append(vocab[start:end])
+            pos = vocab.find(fragment, end)
+        return found
+
+    def _candidates(self, text: str) -> Tuple[Optional[List[int]], bool]:
+        """
+        Sorted row ids that may contain text (None when the index cannot narrow
+        it down) and whether they are exact, i.e. need no substring check.
+        """
+        fragments = [t for t in _TOKEN.findall(text) if len(t) >= self.MIN_TOKEN]
+        if not fragments:
+            return None, False
+        # A query that is a single token matches exactly the rows holding a token containing it.
+        exact = fragments == [text]
+        limit = len(self.haystacks) // 2
+        best = None
+        # The longest fragments are usually the most selective; two are enough to narrow the scan.
+        for fragment in sorted(fragments, key=len, reverse=True)[:2]:
+            lists = [self._postings[t] for t in self._tokens_containing(fragment)]
+            if exact:
+                return (list(lists[0]) if len(lists) == 1 else sorted(set().union(*lists))), True
+            if sum(len(ids) for ids in lists) > limit:
+                continue
+            rows = set().union(*lists)
+            best = rows if best is None else best & rows
+            if not best:
+                break
+        return (None if best is None else sorted(best)), False
+
+    def search(self, text: str, category: Optional[str] = None,
+               rows: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Row ids (ascending) whose fields contain text and, if given, that belong
+        to category. Passing rows restricts the search to those ids, e.g. the
+        matches of a shorter query the user is still typing.
+        """
+        text = text.strip().lower()
+        exact = False
+        if rows is None and text:
+            rows, exact = self._candidates(text)
+        if category is not None:
+            in_category = self.category_rows(category)
+            if rows is None:
+                rows = in_category
+            elif isinstance(rows, range):
+                # Category ids are ascending, so a range of new rows is a slice of them.
+                rows = in_category[bisect_left(in_category, rows.start):bisect_left(in_category, rows.stop)]
+            else:
+                wanted = set(in_category)
+                rows = [i for i in rows if i in wanted]
+        haystacks = self.haystacks
+        if not text or exact:
+            return list(range(len(haystacks))) if rows is None else list(rows)
+        if rows is None:
+            return list(compress(range(len(haystacks)), map(contains, haystacks, repeat(text))))
+        return list(compress(rows, map(contains, map(haystacks.__getitem__, rows), repeat(text))))
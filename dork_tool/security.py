@@ -7,7 +7,8 @@ import json
 import base64
 import requests
 from datetime import datetime
-from typing import Tuple, Optional, Any
+from typing import List, Tuple, Optional, Any
+from .session import CSE_ENDPOINT, HttpSessionManager
 
 try:
     from cryptography.fernet import Fernet
@@ -19,12 +20,14 @@ except ImportError:
 class CredentialManager:
     """
     Manages API credentials securely using Fernet symmetric encryption.
-    Stores encrypted credentials in ~/.google_dorking_tool/creds.dat
+    Stores encrypted credentials in ~/.google_dorking_tool/creds.dat and any
+    additional pooled API keys in ~/.google_dorking_tool/keys.dat
     """
 
     def __init__(self):
         self.config_dir = os.path.join(os.path.expanduser("~"), ".google_dorking_tool")
         self.cred_file = os.path.join(self.config_dir, "creds.dat")
+        self.pool_file = os.path.join(self.config_dir, "keys.dat")
         self.key_file = os.path.join(self.config_dir, "master.key")
         self._ensure_config_dir()
         self._fernet = self._init_fernet()
@@ -57,6 +60,41 @@ class CredentialManager:
             print(f"[ERROR] Fernet initialization failed: {e}")
             return None
 
+    def _write_encrypted(self, path: str, data: Any):
+        json_str = json.dumps(data)
+        if self._fernet:
+            payload = self._fernet.encrypt(json_str.encode("utf-8"))
+        else:
+            payload = base64.b64encode(json_str.encode("utf-8"))
+        with open(path, "wb") as f:
+            f.write(payload)
+
+        if hasattr(os, "chmod"):
+            try:
+                os.chmod(path, 0o600)
+            except Exception:
+                pass
+
+    def _read_encrypted(self, path: str) -> Optional[Any]:
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            content = f.read().strip()
+
+        if not content:
+            return None
+
+        if self._fernet:
+            try:
+                return json.loads(self._fernet.decrypt(content).decode("utf-8"))
+            except Exception:
+                pass
+
+        try:
+            return json.loads(base64.b64decode(content).decode("utf-8"))
+        except Exception:
+            return None
+
     def save(self, api_key: str, cse_id: str) -> bool:
         """Encrypts and persists credentials."""
         data = {
@@ -64,23 +102,8 @@ class CredentialManager:
             "cse_id": cse_id.strip(),
             "updated_at": datetime.now().isoformat()
         }
-        json_str = json.dumps(data)
-
         try:
-            if self._fernet:
-                encrypted = self._fernet.encrypt(json_str.encode("utf-8"))
-                with open(self.cred_file, "wb") as f:
-                    f.write(encrypted)
-            else:
-                encoded = base64.b64encode(json_str.encode("utf-8"))
-                with open(self.cred_file, "wb") as f:
-                    f.write(encoded)
-
-            if hasattr(os, "chmod"):
-                try:
-                    os.chmod(self.cred_file, 0o600)
-                except Exception:
-                    pass
+            self._write_encrypted(self.cred_file, data)
             return True
         except Exception as e:
             print(f"[ERROR] Failed to save credentials: {e}")
@@ -95,40 +118,60 @@ class CredentialManager:
             return env_key, env_cse
 
         # 2. Local encrypted storage
-        if not os.path.exists(self.cred_file):
-            return "", ""
-
         try:
-            with open(self.cred_file, "rb") as f:
-                content = f.read().strip()
-
-            if not content:
+            data = self._read_encrypted(self.cred_file)
+            if not isinstance(data, dict):
                 return "", ""
+            return data.get("api_key", ""), data.get("cse_id", "")
+        except Exception as e:
+            print(f"[ERROR] Failed to load credentials: {e}")
+            return "", ""
 
-            if self._fernet:
-                try:
-                    decrypted = self._fernet.decrypt(content).decode("utf-8")
-                    data = json.loads(decrypted)
-                    return data.get("api_key", ""), data.get("cse_id", "")
-                except Exception:
-                    pass
+    def save_pool(self, entries: List[Tuple[str, str, str]]) -> bool:
+        """Encrypts and persists additional (api_key, cse_id, label) entries for the key pool."""
+        data = {
+            "keys": [
+                {"api_key": k.strip(), "cse_id": c.strip(), "label": label.strip()}
+                for k, c, label in entries if k.strip()
+            ],
+            "updated_at": datetime.now().isoformat()
+        }
+        try:
+            self._write_encrypted(self.pool_file, data)
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to save key pool: {e}")
+            return False
 
-            try:
-                decrypted = base64.b64decode(content).decode("utf-8")
-                data = json.loads(decrypted)
-                return data.get("api_key", ""), data.get("cse_id", "")
-            except Exception:
-                return "", ""
+    def load_pool(self) -> List[Tuple[str, str, str]]:
+        """
+        Loads additional pooled keys as (api_key, cse_id, label) tuples.
+        GOOGLE_API_KEYS (comma-separated) takes precedence; those keys use GOOGLE_CSE_ID
+        or the saved CSE ID. An empty cse_id means "same engine as the primary credentials".
+        """
+        env_keys = os.environ.get("GOOGLE_API_KEYS", "").strip()
+        if env_keys:
+            cse_id = os.environ.get("GOOGLE_CSE_ID", "").strip()
+            return [(k.strip(), cse_id, "") for k in env_keys.split(",") if k.strip()]
 
+        try:
+            data = self._read_encrypted(self.pool_file)
+            if not isinstance(data, dict):
+                return []
+            return [
+                (item.get("api_key", ""), item.get("cse_id", ""), item.get("label", ""))
+                for item in data.get("keys", []) if item.get("api_key")
+            ]
         except Exception as e:
-            print(f"[ERROR] Failed to load credentials: {e}")
-            return "", ""
+            print(f"[ERROR] Failed to load key pool: {e}")
+            return []
 
     def clear(self) -> bool:
-        """Deletes encrypted credential file."""
+        """Deletes encrypted credential and key pool files."""
         try:
-            if os.path.exists(self.cred_file):
-                os.remove(self.cred_file)
+            for path in (self.cred_file, self.pool_file):
+                if os.path.exists(path):
+                    os.remove(path)
             return True
         except Exception as e:
             print(f"[ERROR] Failed to clear credentials: {e}")
@@ -142,7 +185,6 @@ class CredentialManager:
         if not api_key or not cse_id:
             return False, "API Key and CSE ID cannot be empty."
 
-        url = "https://www.googleapis.com/customsearch/v1"
         params = {
             "key": api_key,
             "cx": cse_id,
@@ -150,7 +192,7 @@ class CredentialManager:
             "num": 1
         }
         try:
-            resp = requests.get(url, params=params, timeout=8)
+            resp = HttpSessionManager.shared().get(CSE_ENDPOINT, params=params, timeout=8)
             if resp.status_code == 200:
                 return True, "API connection verified successfully."
             elif resp.status_code == 400:
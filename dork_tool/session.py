@@ -0,0 +1,109 @@
+"""
+Shared HTTP session layer with keep-alive connection pooling and retry policy.
+Version 1.2.0
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+CSE_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
+
+
+class HttpSessionManager:
+    """
+    Wraps a requests.Session whose adapters keep TLS connections to the API alive
+    between calls. A process-wide instance is available through shared(), so
+    the search workers and credential validation reuse the same pool.
+
+    urllib3 only retries failed connection attempts, where no request reached
+    the API. Responses (429, 5xx) and read errors are returned as they are and
+    left to RetryPolicy, so every send is counted against quota and backoff
+    sleeps stay interruptible by cancel().
+    """
+
+    _shared: Optional["HttpSessionManager"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_size: int = 10, max_retries: int = 2,
+                 backoff_factor: float = 0.5):
+        self.pool_size = max(1, pool_size)
+        self.max_retries = max(0, max_retries)  # connection attempts only
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=backoff_factor,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        # pool_size bounds both the cached per-host pools and the sockets kept
+        # alive in each, so parallel page fetches never open throwaway connections.
+        self.adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "HttpSessionManager":
+        """Returns the process-wide session, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, **kwargs: Any) -> "HttpSessionManager":
+        """Replaces the process-wide session with one built from the given settings."""
+        with cls._shared_lock:
+            old = cls._shared
+            cls._shared = cls(**kwargs)
+        if old is not None:
+            old.close()
+        return cls._shared
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: float = 12) -> requests.Response:
+        """Issues a GET through the pooled session."""
+        with self._lock:
+            self._calls += 1
+        return self.session.get(url, params=params, timeout=timeout)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns connection reuse counters. The opened/sent figures are read from
+        the live urllib3 pools, so retries are included in 'requests_sent'.
+        """
+        opened = 0
+        sent = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += getattr(pool, "num_connections", 0)
+            sent += getattr(pool, "num_requests", 0)
+        return {
+            "calls": self._calls,
+            "requests_sent": sent,
+            "connections_opened": opened,
+            "connections_reused": max(0, sent - opened)
+        }
+
+    def close(self):
+        try:
+            self.session.close()
+        except Exception:
+            pass
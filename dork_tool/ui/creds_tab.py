@@ -3,15 +3,18 @@ Credentials and Quota Management Tab Widget (PySide6).
 Clean form layout, API connection validation, and daily quota monitoring wrapped in QScrollArea.
 """
 
-from typing import Callable
+from typing import Callable, Optional, Union
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QGroupBox, QFormLayout, QProgressBar, QMessageBox, QFrame, QScrollArea
+    QGroupBox, QFormLayout, QProgressBar, QMessageBox, QFrame, QScrollArea,
+    QPlainTextEdit
 )
 from PySide6.QtCore import Qt
 
 from ..security import CredentialManager
 from ..rate_limiter import AdvancedRateLimiter
+from ..key_pool import KeyPool
+from ..cache import ResponseCache
 
 
 class CredentialsTab(QWidget):
@@ -20,12 +23,14 @@ class CredentialsTab(QWidget):
     """
 
     def __init__(self, cred_mgr: CredentialManager,
-                 rate_limiter: AdvancedRateLimiter,
+                 rate_limiter: Union[AdvancedRateLimiter, KeyPool],
                  on_credentials_changed: Callable[[], None],
+                 response_cache: Optional[ResponseCache] = None,
                  parent=None):
         super().__init__(parent)
         self.cred_mgr = cred_mgr
         self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
         self.on_credentials_changed = on_credentials_changed
 
         self.init_ui()
@@ -94,6 +99,38 @@ class CredentialsTab(QWidget):
         cred_layout.addRow("", btn_bar)
         layout.addWidget(cred_box)
 
+        # 1b. Additional keys for quota-aware rotation
+        pool_box = QGroupBox("API Key Pool (Combined Daily Quota)")
+        pool_layout = QVBoxLayout(pool_box)
+        pool_layout.setContentsMargins(16, 16, 16, 16)
+        pool_layout.setSpacing(10)
+
+        pool_info = QLabel(
+            "One additional key per line: API_KEY, CSE_ID, label (CSE ID and label optional; "
+            "a blank CSE ID uses the one above). Each request uses the key with the most quota left; "
+            "keys answering HTTP 403/429 are rotated out automatically."
+        )
+        pool_info.setWordWrap(True)
+        pool_info.setStyleSheet("color: #8b949e; font-size: 12px;")
+
+        self.pool_input = QPlainTextEdit()
+        self.pool_input.setPlaceholderText("AIzaSy..., 017576...:sul9q1akysi, project-b")
+        self.pool_input.setFixedHeight(90)
+
+        pool_btn_bar = QHBoxLayout()
+        self.save_pool_btn = QPushButton("Save Key Pool (AES-128 Encrypted)")
+        self.save_pool_btn.clicked.connect(self.save_key_pool)
+        self.pool_status_label = QLabel("")
+        self.pool_status_label.setStyleSheet("color: #8b949e; font-size: 12px;")
+        pool_btn_bar.addWidget(self.save_pool_btn)
+        pool_btn_bar.addStretch()
+
+        pool_layout.addWidget(pool_info)
+        pool_layout.addWidget(self.pool_input)
+        pool_layout.addLayout(pool_btn_bar)
+        pool_layout.addWidget(self.pool_status_label)
+        layout.addWidget(pool_box)
+
         # 2. Daily Quota Meter Box
         quota_box = QGroupBox("Daily API Rate Limiting & Quota Tracker")
         q_layout = QVBoxLayout(quota_box)
@@ -118,9 +155,20 @@ class CredentialsTab(QWidget):
         q_btn_bar.addWidget(quota_info)
         q_btn_bar.addStretch()
 
+        cache_bar = QHBoxLayout()
+        self.cache_status_label = QLabel("Response Cache: disabled")
+        self.cache_status_label.setStyleSheet("color: #8b949e; font-size: 12px;")
+        self.clear_cache_btn = QPushButton("Clear Response Cache")
+        self.clear_cache_btn.setEnabled(self.response_cache is not None)
+        self.clear_cache_btn.clicked.connect(self.clear_response_cache)
+        cache_bar.addWidget(self.clear_cache_btn)
+        cache_bar.addWidget(self.cache_status_label)
+        cache_bar.addStretch()
+
         q_layout.addWidget(self.quota_status_label)
         q_layout.addWidget(self.quota_progress)
         q_layout.addLayout(q_btn_bar)
+        q_layout.addLayout(cache_bar)
         layout.addWidget(quota_box)
 
         # 3. Setup Instructions Frame
@@ -158,6 +206,24 @@ class CredentialsTab(QWidget):
             self.api_key_input.setText(k)
         if c:
             self.cse_id_input.setText(c)
+        lines = []
+        for key, cse_id, label in self.cred_mgr.load_pool():
+            lines.append(f"{key}, {cse_id}, {label}" if label else ", ".join(p for p in (key, cse_id) if p))
+        self.pool_input.setPlainText("\n".join(lines))
+
+    def save_key_pool(self):
+        entries = []
+        for line in self.pool_input.toPlainText().splitlines():
+            parts = [p.strip() for p in line.split(",")]
+            if not parts or not parts[0]:
+                continue
+            parts += [""] * (3 - len(parts))
+            entries.append((parts[0], parts[1], parts[2]))
+        if self.cred_mgr.save_pool(entries):
+            QMessageBox.information(self, "Key Pool Saved", f"{len(entries)} additional API keys encrypted and stored locally.")
+            self.on_credentials_changed()
+        else:
+            QMessageBox.critical(self, "Save Error", "Failed to encrypt and save the key pool.")
 
     def save_credentials(self):
         k = self.api_key_input.text().strip()
@@ -196,6 +262,7 @@ class CredentialsTab(QWidget):
             self.cred_mgr.clear()
             self.api_key_input.clear()
             self.cse_id_input.clear()
+            self.pool_input.clear()
             self.on_credentials_changed()
             QMessageBox.information(self, "Cleared", "Credentials successfully deleted.")
 
@@ -204,9 +271,28 @@ class CredentialsTab(QWidget):
         self.quota_status_label.setText(f"Daily Requests: {used} / {limit} ({rem} remaining)")
         self.quota_progress.setMaximum(limit)
         self.quota_progress.setValue(used)
+        if isinstance(self.rate_limiter, KeyPool):
+            self.pool_status_label.setText(" | ".join(
+                f"{row['label']}: {row['used']}/{row['limit']}" + (" (rotated out)" if row["benched"] else "")
+                for row in self.rate_limiter.get_key_stats()
+            ))
+        else:
+            self.pool_status_label.setText("Single key in use.")
+        if self.response_cache is not None:
+            stats = self.response_cache.get_stats()
+            self.cache_status_label.setText(
+                f"Response Cache: {stats['entries']} pages stored | "
+                f"{stats['hits']} hits / {stats['misses']} misses this session"
+            )
 
     def reset_quota(self):
         self.rate_limiter.reset()
         self.refresh_quota()
         QMessageBox.information(self, "Quota Reset", "Daily quota tracker counter reset to 0.")
 
+    def clear_response_cache(self):
+        if self.response_cache is None:
+            return
+        if self.response_cache.clear():
+            self.refresh_quota()
+            QMessageBox.information(self, "Cache Cleared", "Cached API responses deleted. Reruns will query the API again.")
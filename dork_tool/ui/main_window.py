@@ -4,6 +4,7 @@ Global Keyboard Shortcuts, Toast Notifications, Tabs Orchestration, and Zero Emo
 Version 1.2.0
 """
 
+import os
 from typing import List, Optional
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -14,11 +15,18 @@ from PySide6.QtCore import Qt, QEvent
 from PySide6.QtGui import QKeySequence, QShortcut
 
 from ..models import SearchResult
+from ..columns import ResultColumns
 from ..security import CredentialManager
 from ..rate_limiter import AdvancedRateLimiter
+from ..key_pool import KeyPool
 from ..bookmarks import BookmarksManager
+from ..cache import ResponseCache
+from ..findings_store import FindingsStore
 from ..engine import DorkEngine
-from ..workers import GoogleSearchWorker, AutoDorkBatchWorker
+from ..bulk import BulkDorkGenerator, count_targets, iter_targets
+from ..journal import SweepJournal
+from ..retry import RetryPolicy
+from ..workers import GoogleSearchWorker, AsyncDorkBatchWorker
 from .loader import ThemeManager
 from .search_tab import SearchTab
 from .results_tab import ResultsTab
@@ -54,15 +62,17 @@ class MainWindow(QMainWindow):
 
         # Backend Managers
         self.cred_mgr = CredentialManager()
-        self.rate_limiter = AdvancedRateLimiter(daily_limit=100)
         self.bookmarks_mgr = BookmarksManager()
+        self.response_cache = ResponseCache()
+        self.findings_store = FindingsStore()
         self.current_theme = "dark"
 
         self.api_key, self.cse_id = self.cred_mgr.load()
+        self.rate_limiter = self.build_rate_limiter()
 
         # Active worker threads
         self.active_search_worker: Optional[GoogleSearchWorker] = None
-        self.active_batch_worker: Optional[AutoDorkBatchWorker] = None
+        self.active_batch_worker: Optional[AsyncDorkBatchWorker] = None
 
         self.init_window()
         self.init_ui()
@@ -120,21 +130,24 @@ class MainWindow(QMainWindow):
             on_run_api_search=self.start_api_search,
             on_run_batch_recon=self.start_batch_recon,
             bookmarks_mgr=self.bookmarks_mgr,
+            on_run_bulk_recon=self.start_bulk_recon,
             parent=self
         )
 
-        self.results_tab = ResultsTab(parent=self)
+        self.results_tab = ResultsTab(parent=self, findings_store=self.findings_store)
 
         self.saved_tab = SavedTab(
             bookmarks_mgr=self.bookmarks_mgr,
             on_execute_query=self.load_query_in_search_tab,
-            parent=self
+            parent=self,
+            on_search_findings=self.search_stored_findings
         )
 
         self.creds_tab = CredentialsTab(
             cred_mgr=self.cred_mgr,
             rate_limiter=self.rate_limiter,
             on_credentials_changed=self.on_credentials_updated,
+            response_cache=self.response_cache,
             parent=self
         )
 
@@ -216,8 +229,24 @@ class MainWindow(QMainWindow):
         self.header_quota_label.setText(f"API Quota: {used}/{limit} requests ({rem} remaining)")
         self.creds_tab.refresh_quota()
 
+    def build_rate_limiter(self):
+        """Returns a KeyPool when additional API keys are saved, otherwise the single-key limiter."""
+        pooled = self.cred_mgr.load_pool()
+        if pooled:
+            pool = KeyPool.from_credentials((self.api_key, self.cse_id), pooled, daily_limit=100)
+            if len(pool) > 1:
+                if not (self.api_key and self.cse_id):
+                    self.api_key, self.cse_id = pool.keys[0].api_key, pool.keys[0].cse_id
+                return pool
+            pool.close()
+        return AdvancedRateLimiter(daily_limit=100)
+
     def on_credentials_updated(self):
         self.api_key, self.cse_id = self.cred_mgr.load()
+        # A running worker may still count against the old limiter; a closed one writes through.
+        self.rate_limiter.close()
+        self.rate_limiter = self.build_rate_limiter()
+        self.creds_tab.rate_limiter = self.rate_limiter
         self.update_quota_display()
         self.show_toast("API credentials reloaded.")
 
@@ -226,6 +255,11 @@ class MainWindow(QMainWindow):
         self.tabs.setCurrentWidget(self.search_tab)
         self.show_toast("Loaded query into Search Tab.")
 
+    def search_stored_findings(self, text: str):
+        count = self.results_tab.search_stored(text)
+        self.tabs.setCurrentWidget(self.results_tab)
+        self.show_toast(f"{count} stored findings match '{text[:40]}'.")
+
     def cancel_active_worker(self):
         if self.active_search_worker and self.active_search_worker.isRunning():
             self.active_search_worker.cancel()
@@ -235,7 +269,8 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Cancelling batch sweep...")
         self.stop_btn.setVisible(False)
 
-    def start_api_search(self, query: str, category: str = "Manual"):
+    def start_api_search(self, query: str, category: str = "Manual",
+                         num_results: int = 10, concurrent_pages: int = 1):
         if not self.api_key or not self.cse_id:
             reply = QMessageBox.question(
                 self, "API Credentials Missing",
@@ -261,9 +296,12 @@ class MainWindow(QMainWindow):
             api_key=self.api_key,
             cse_id=self.cse_id,
             query=query,
-            num_results=10,
+            num_results=num_results,
             rate_limiter=self.rate_limiter,
-            category=category
+            category=category,
+            concurrent_pages=concurrent_pages,
+            response_cache=self.response_cache,
+            findings_store=self.findings_store
         )
 
         self.active_search_worker.progress_update.connect(self.on_worker_progress)
@@ -273,6 +311,29 @@ class MainWindow(QMainWindow):
 
         self.active_search_worker.start()
 
+    def open_sweep_journal(self, label: str, *id_parts: str) -> Optional[SweepJournal]:
+        """
+        Opens the checkpoint journal for a sweep, offering to resume it if an earlier
+        run was interrupted. Returns None if the user cancels.
+        """
+        journal = SweepJournal(SweepJournal.sweep_id_for(self.cse_id, *id_parts), label=label)
+        if journal.is_resumable:
+            reply = QMessageBox.question(
+                self, "Resume Previous Sweep",
+                f"An interrupted sweep for '{label}' has {journal.completed_units} completed queries saved.\n\n"
+                "Yes: resume and replay saved results without spending quota.\n"
+                "No: discard the checkpoint and start over.",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+            )
+            if reply == QMessageBox.Cancel:
+                journal.close()
+                return None
+            if reply == QMessageBox.No:
+                journal.discard()
+        elif journal.finished:
+            journal.discard()
+        return journal
+
     def start_batch_recon(self, target: str, selected_categories: List[str], target_type: str = "AUTO"):
         if not self.api_key or not self.cse_id:
             reply = QMessageBox.question(
@@ -290,6 +351,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Queries", "No queries could be generated for the target.")
             return
 
+        journal = self.open_sweep_journal(
+            target, "target", target, target_type, ",".join(sorted(selected_categories)), "5"
+        )
+        if journal is None:
+            return
+
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(5)
         self.stop_btn.setVisible(True)
@@ -299,16 +366,75 @@ class MainWindow(QMainWindow):
         self.results_tab.set_results([], query=f"Target: {target}")
         self.tabs.setCurrentWidget(self.results_tab)
 
-        self.active_batch_worker = AutoDorkBatchWorker(
+        self.active_batch_worker = AsyncDorkBatchWorker(
             api_key=self.api_key,
             cse_id=self.cse_id,
             dork_list=dork_list,
             rate_limiter=self.rate_limiter,
-            max_per_dork=5
+            max_per_dork=5,
+            response_cache=self.response_cache,
+            journal=journal,
+            retry_policy=RetryPolicy(sweep_deadline=30 * 60),
+            findings_store=self.findings_store,
+            max_concurrency=4
+        )
+
+        self.active_batch_worker.progress_update.connect(self.on_worker_progress)
+        self.active_batch_worker.results_added.connect(self.results_tab.queue_results)
+        self.active_batch_worker.error_occurred.connect(self.on_worker_error)
+        self.active_batch_worker.batch_finished.connect(self.on_batch_sweep_finished)
+
+        self.active_batch_worker.start()
+
+    def start_bulk_recon(self, filepath: str, selected_categories: List[str]):
+        if not self.api_key or not self.cse_id:
+            QMessageBox.warning(self, "API Credentials Missing",
+                                "Google Custom Search API Key and CSE ID are required for bulk sweeps.")
+            self.tabs.setCurrentWidget(self.creds_tab)
+            return
+
+        try:
+            target_count = count_targets(filepath)
+        except OSError as e:
+            QMessageBox.critical(self, "Target List Error", f"Could not read target list:\n{e}")
+            return
+        if not target_count:
+            QMessageBox.warning(self, "Empty Target List", "The selected file contains no targets.")
+            return
+
+        journal = self.open_sweep_journal(
+            os.path.basename(filepath), "bulk", os.path.abspath(filepath),
+            str(os.path.getmtime(filepath)), ",".join(sorted(selected_categories)), "5"
+        )
+        if journal is None:
+            return
+
+        # Dorks are generated per target as the sweep reaches it; progress is indeterminate.
+        generator = BulkDorkGenerator(iter_targets(filepath), selected_categories)
+
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.stop_btn.setVisible(True)
+        self.status_bar.showMessage(f"Initiating bulk sweep over {target_count} targets...")
+
+        self.results_tab.set_results([], query=f"Targets: {target_count} from list")
+        self.tabs.setCurrentWidget(self.results_tab)
+
+        self.active_batch_worker = AsyncDorkBatchWorker(
+            api_key=self.api_key,
+            cse_id=self.cse_id,
+            dork_list=generator,
+            rate_limiter=self.rate_limiter,
+            max_per_dork=5,
+            response_cache=self.response_cache,
+            journal=journal,
+            retry_policy=RetryPolicy(sweep_deadline=30 * 60),
+            findings_store=self.findings_store,
+            max_concurrency=4
         )
 
         self.active_batch_worker.progress_update.connect(self.on_worker_progress)
-        self.active_batch_worker.results_updated.connect(self.results_tab.update_results)
+        self.active_batch_worker.results_added.connect(self.results_tab.queue_results)
         self.active_batch_worker.error_occurred.connect(self.on_worker_error)
         self.active_batch_worker.batch_finished.connect(self.on_batch_sweep_finished)
 
@@ -326,7 +452,9 @@ class MainWindow(QMainWindow):
         self.tabs.setCurrentWidget(self.results_tab)
         self.show_toast(f"Found {len(results)} results for query.")
 
-    def on_batch_sweep_finished(self, results: List[SearchResult]):
+    def on_batch_sweep_finished(self, results: ResultColumns):
+        self.results_tab.flush_pending()
+        self.progress_bar.setRange(0, 100)
         self.progress_bar.setVisible(False)
         self.stop_btn.setVisible(False)
         self.update_quota_display()
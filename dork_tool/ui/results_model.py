@@ -0,0 +1,440 @@
+"""
+Qt item model behind the Results Explorer table (PySide6).
+Virtualized rendering, model-side filtering and sorting, optional page windows.
+Version 1.2.0
+"""
+
+import heapq
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from ..models import SearchResult
+from ..columns import ResultColumns
+from ..search_index import ResultSearchIndex
+from ..result_query import ResultQuery
+from ..near_dup import NearDuplicateClusterer
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Table model over a ResultColumns of findings. The view only asks for the
+    cells it paints, so 100k+ rows scroll without creating per-cell items, and
+    the model itself works on arrival ids (positions in all_rows): filtering,
+    sorting, and grouping move integers, and a SearchResult is only built by
+    result_at() or when rows is read.
+
+    The model owns the filtered view: set_filter() rebuilds it through a
+    ResultSearchIndex kept up to date at ingest, append() filters only the new
+    rows. sort() orders the filtered view and merges later appends into that
+    order. With a page size set, only one page window of the filtered view is
+    exposed to the table.
+
+    With grouping on, rows are clustered into near-duplicates (all rows once,
+    then each append) and the table shows each cluster's first row in the
+    filtered view, marked with how many similar rows it hides; toggle_group()
+    expands or collapses the rest right below it. rows stays the full
+    filtered view.
+    """
+
+    HEADERS = ["#", "Title", "URL / Link", "Category", "Snippet"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.all_rows = ResultColumns()
+        self._ids: List[int] = []                    # filtered view as arrival ids, in sort order
+        self.search_index = ResultSearchIndex()
+        self.clusters = NearDuplicateClusterer()
+        self._predicate: Optional[Callable[[SearchResult], bool]] = None
+        self._query = ResultQuery()
+        self._category: Optional[str] = None
+        self._match_ids: Optional[List[int]] = None  # ids passing text/category, None = all
+        self._sort_column = 0
+        self._sort_order = Qt.AscendingOrder
+        self._page_start = 0
+        self._page_size = 0  # 0 shows every row
+        self._grouped = False
+        self._expanded: Set[int] = set()             # cluster ids shown in full
+        self._group_view: List[int] = []             # arrival ids shown while grouped
+        self._group_sizes: Counter = Counter()       # cluster id -> rows in the filtered view
+        self._group_heads: Dict[int, int] = {}       # cluster id -> arrival id of its first row in the view
+        self.link_color = QColor("#58a6ff")
+        self.member_color = QColor("#8b949e")
+
+    @property
+    def rows(self) -> ResultColumns:
+        """The filtered view in sort order, as a view over all_rows."""
+        return self.all_rows.take(self._ids)
+
+    @property
+    def view_ids(self) -> List[int]:
+        """Arrival ids the table shows (before paging): the filtered view, or one per cluster when grouped."""
+        return self._group_view if self._grouped else self._ids
+
+    @property
+    def view_rows(self) -> ResultColumns:
+        return self.all_rows.take(self.view_ids)
+
+    @property
+    def group_count(self) -> int:
+        return len(self._group_heads)
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        visible = len(self.view_ids) - self._page_start
+        return max(0, min(visible, self._page_size) if self._page_size else visible)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._page_start + index.row()
+        view = self.view_ids
+        if row >= len(view):
+            return None
+        i = view[row]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._row_label(row, i)
+            title, link, snippet, category = self.all_rows.row(i)[:4]
+            return (title, link, category, snippet)[col - 1]
+        if role == Qt.ToolTipRole and col in (1, 2, 4):
+            return self.all_rows.row(i)[(0, 1, None, 2)[col - 1]]
+        if role == Qt.ToolTipRole and col == 0 and self._grouped:
+            hidden = self._group_sizes[self.clusters.cluster_of(i)] - 1
+            if self.is_group_head(i) and hidden:
+                return f"{hidden} near-duplicate rows. Click to expand or collapse."
+        if role == Qt.ForegroundRole and col == 2:
+            return self.link_color
+        if role == Qt.ForegroundRole and self._grouped and not self.is_group_head(i):
+            return self.member_color
+        if role == Qt.TextAlignmentRole and col in (0, 3):
+            return int(Qt.AlignCenter)
+        return None
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self._relayout(self._reorder)
+
+    def _row_label(self, row: int, i: int) -> str:
+        if not self._grouped:
+            return str(row + 1)
+        cluster = self.clusters.cluster_of(i)
+        if not self.is_group_head(i):
+            return f"   {row + 1}"
+        hidden = self._group_sizes[cluster] - 1
+        if not hidden:
+            return str(row + 1)
+        return f"{row + 1} [{'-' if cluster in self._expanded else '+'}{hidden}]"
+
+    # Data management
+    def _relayout(self, reorder: Callable[[], None]):
+        """Runs a row-count-preserving reorder and moves selections with their rows."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        tracked = [(idx, self._id_at(idx.row())) for idx in persistent]
+        reorder()
+        positions = {i: row - self._page_start for row, i in enumerate(self.view_ids)}
+        for idx, i in tracked:
+            row = positions.get(i, -1) if i is not None else -1
+            if 0 <= row < self.rowCount():
+                self.changePersistentIndex(idx, self.index(row, idx.column()))
+            else:
+                self.changePersistentIndex(idx, QModelIndex())
+        self.layoutChanged.emit()
+
+    def _sort_key(self, column: int) -> Optional[Callable[[int], str]]:
+        """Sort key on arrival ids (None for column 0, arrival order), read from lowercased columns."""
+        if column == 3:
+            categories = self.all_rows.column("category")
+            lowered = {c: c.lower() for c in set(categories)}
+            return lambda i: lowered[categories[i]]
+        titles, links, snippets = self.search_index.fields
+        column_values = {1: titles, 2: links, 4: snippets}.get(column)
+        return None if column_values is None else column_values.__getitem__
+
+    def _apply_sort(self):
+        key = self._sort_key(self._sort_column)
+        if key is not None:
+            self._ids.sort(key=key, reverse=self._sort_order == Qt.DescendingOrder)
+        elif self._sort_order == Qt.DescendingOrder:
+            # Column 0 is arrival order.
+            self._ids = self._select(self._match_ids)[::-1]
+        else:
+            self._ids = self._select(self._match_ids)
+
+    def _reorder(self):
+        self._apply_sort()
+        self._regroup()
+
+    def _regroup(self):
+        """Rebuilds the grouped view: each cluster's first row, followed by the rest if expanded."""
+        if not self._grouped:
+            return
+        cluster_of = self.clusters.cluster_of
+        sizes = Counter()
+        heads: Dict[int, int] = {}
+        members: Dict[int, List[int]] = {}
+        for i in self._ids:
+            cluster = cluster_of(i)
+            sizes[cluster] += 1
+            if cluster not in heads:
+                heads[cluster] = i
+            elif cluster in self._expanded:
+                members.setdefault(cluster, []).append(i)
+        view = []
+        for cluster, head in heads.items():
+            view.append(head)
+            view.extend(members.get(cluster, ()))
+        self._group_view = view
+        self._group_sizes = sizes
+        self._group_heads = heads
+
+    def is_group_head(self, i: int) -> bool:
+        return self._group_heads.get(self.clusters.cluster_of(i)) == i
+
+    def _cluster_rest(self):
+        """Clusters the rows added since grouping was last on."""
+        self.clusters.add(self.all_rows[self.clusters.assigned:])
+
+    def set_grouping(self, enabled: bool):
+        """Shows one row per near-duplicate cluster (collapsed) or every row."""
+        if enabled == self._grouped:
+            return
+        self.beginResetModel()
+        self._grouped = enabled
+        if enabled:
+            self._cluster_rest()
+        self._expanded = set()
+        self._group_view, self._group_sizes, self._group_heads = [], Counter(), {}
+        self._page_start = 0
+        self._regroup()
+        self.endResetModel()
+
+    def group_state(self, view_row: int) -> Optional[bool]:
+        """True/False if view_row heads an expanded/collapsed group of near-duplicates, else None."""
+        i = self._id_at(view_row)
+        if i is None or not self._grouped or not self.is_group_head(i):
+            return None
+        cluster = self.clusters.cluster_of(i)
+        if self._group_sizes[cluster] < 2:
+            return None
+        return cluster in self._expanded
+
+    def toggle_group(self, view_row: int) -> bool:
+        """Expands or collapses the group headed by view_row; False if it heads none."""
+        if self.group_state(view_row) is None:
+            return False
+        i = self._id_at(view_row)
+        cluster = self.clusters.cluster_of(i)
+        hidden = self._group_sizes[cluster] - 1
+        row = self._page_start + view_row
+        if self._page_size:
+            self.beginResetModel()
+            self._expanded.symmetric_difference_update({cluster})
+            self._regroup()
+            self.endResetModel()
+        elif cluster in self._expanded:
+            self.beginRemoveRows(QModelIndex(), view_row + 1, view_row + hidden)
+            del self._group_view[row + 1:row + 1 + hidden]
+            self.endRemoveRows()
+            self._expanded.discard(cluster)
+        else:
+            cluster_of = self.clusters.cluster_of
+            members = [m for m in self._ids if m != i and cluster_of(m) == cluster]
+            self.beginInsertRows(QModelIndex(), view_row + 1, view_row + hidden)
+            self._group_view[row + 1:row + 1] = members
+            self.endInsertRows()
+            self._expanded.add(cluster)
+        self.dataChanged.emit(self.index(view_row, 0), self.index(view_row, 0))
+        return True
+
+    def _search(self, rows: Optional[Sequence[int]] = None) -> Optional[List[int]]:
+        """Arrival ids passing the query and category filters, or None when neither is set."""
+        if self._query.is_empty and self._category is None:
+            return None
+        return self._query.select(self.search_index, self._category, rows)
+
+    def _select(self, ids: Optional[Sequence[int]], first: int = 0) -> List[int]:
+        """Arrival ids (None: every row from first on) that pass the predicate."""
+        ids = list(range(first, len(self.all_rows)) if ids is None else ids)
+        if self._predicate is not None:
+            result_of = self.all_rows.__getitem__
+            ids = [i for i in ids if self._predicate(result_of(i))]
+        return ids
+
+    def set_results(self, results: Sequence[SearchResult]):
+        self.beginResetModel()
+        self.all_rows = ResultColumns(results)
+        self.search_index.clear()
+        self.search_index.add(results)
+        self.clusters.clear()
+        if self._grouped:
+            self._cluster_rest()
+        self._expanded = set()
+        self._match_ids = self._search()
+        self._ids = self._select(self._match_ids)
+        self._page_start = 0
+        if self._sort_column:
+            self._apply_sort()
+        self._regroup()
+        self.endResetModel()
+
+    def set_filter(self, predicate: Optional[Callable[[SearchResult], bool]] = None,
+                   text: str = "", category: Optional[str] = None):
+        """
+        Filters by a ResultQuery compiled from text (a plain substring or
+        field-scoped dork operators), a category, and an optional predicate.
+        When a plain substring extends the previous one, only the previous
+        matches are searched again.
+        """
+        query = ResultQuery(text)
+        old, new = self._query.plain, query.plain
+        refine = (self._match_ids is not None and category == self._category
+                  and (self._query.is_empty or (old is not None and new is not None and old in new)))
+        self.beginResetModel()
+        self._predicate = predicate
+        self._query = query
+        self._category = category
+        self._match_ids = self._search(self._match_ids if refine else None)
+        self._ids = self._select(self._match_ids)
+        if self._sort_column or self._sort_order == Qt.DescendingOrder:
+            self._apply_sort()
+        self._regroup()
+        self.endResetModel()
+
+    def append(self, results: Sequence[SearchResult]):
+        """Adds new rows; only they are indexed and tested against the filters."""
+        if not results:
+            return
+        first = len(self.all_rows)
+        self.all_rows.extend(results)
+        self.search_index.add(results)
+        if self._grouped:
+            self._cluster_rest()
+        new_ids = self._search(range(first, len(self.all_rows)))
+        if new_ids is not None:
+            self._match_ids.extend(new_ids)
+        matched = self._select(new_ids, first)
+        if not matched:
+            return
+        if self._grouped and not self._page_size and self._append_grouped(matched):
+            return
+        if self._page_size or self._grouped:
+            # Paged mode shows a small window and grouped views are rebuilt; a reset is cheap.
+            self.beginResetModel()
+            self._ids.extend(matched)
+            if self._sort_column or self._sort_order == Qt.DescendingOrder:
+                self._apply_sort()
+            self._regroup()
+            self.endResetModel()
+            return
+        if self._sort_column == 0 and self._sort_order == Qt.DescendingOrder:
+            self.beginInsertRows(QModelIndex(), 0, len(matched) - 1)
+            self._ids[:0] = reversed(matched)
+            self.endInsertRows()
+            return
+        if self._sort_column:
+            self._insert_sorted(matched)
+            return
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(matched) - 1)
+        self._ids.extend(matched)
+        self.endInsertRows()
+
+    def _insert_sorted(self, matched: List[int]):
+        """
+        Merges new arrival ids into the sorted view: only the batch is sorted,
+        and each run of new rows is inserted where it lands. A batch scattered
+        into many runs is appended once and moved with one relayout instead.
+        """
+        key = self._sort_key(self._sort_column)
+        reverse = self._sort_order == Qt.DescendingOrder
+        merged = list(heapq.merge(self._ids, sorted(matched, key=key, reverse=reverse), key=key, reverse=reverse))
+        first_new = min(matched)  # every existing row arrived before the batch
+        runs = []
+        for row, i in enumerate(merged):
+            if i >= first_new:
+                if runs and runs[-1][1] == row:
+                    runs[-1][1] = row + 1
+                else:
+                    runs.append([row, row + 1])
+        if len(runs) > 64:
+            first = len(self._ids)
+            self.beginInsertRows(QModelIndex(), first, first + len(matched) - 1)
+            self._ids.extend(matched)
+            self.endInsertRows()
+            self._relayout(lambda: setattr(self, "_ids", merged))
+            return
+        for start, end in runs:
+            self.beginInsertRows(QModelIndex(), start, end - 1)
+            self._ids[start:start] = merged[start:end]
+            self.endInsertRows()
+
+    def _append_grouped(self, matched: List[int]) -> bool:
+        """
+        Appends in arrival order while grouped: new clusters add a row at the
+        end and rows of collapsed clusters only bump their head's count.
+        False when the view must be rebuilt instead (sorted, or an expanded
+        cluster grew).
+        """
+        if self._sort_column or self._sort_order == Qt.DescendingOrder:
+            return False
+        cluster_of = self.clusters.cluster_of
+        if any(cluster_of(i) in self._expanded for i in matched):
+            return False
+        self._ids.extend(matched)
+        heads = []
+        for i in matched:
+            cluster = cluster_of(i)
+            self._group_sizes[cluster] += 1
+            if cluster not in self._group_heads:
+                self._group_heads[cluster] = i
+                heads.append(i)
+        if heads:
+            first = len(self._group_view)
+            self.beginInsertRows(QModelIndex(), first, first + len(heads) - 1)
+            self._group_view.extend(heads)
+            self.endInsertRows()
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, 0), [Qt.DisplayRole])
+        return True
+
+    def set_page(self, start: int, size: int):
+        """Shows rows[start:start+size]; size 0 shows every row."""
+        start = max(0, start) if size else 0
+        if (start, max(0, size)) == (self._page_start, self._page_size):
+            return
+        self.beginResetModel()
+        self._page_start = start
+        self._page_size = max(0, size)
+        self.endResetModel()
+
+    def set_link_color(self, color: QColor):
+        self.link_color = color
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 2), self.index(self.rowCount() - 1, 2), [Qt.ForegroundRole])
+
+    def _id_at(self, view_row: int) -> Optional[int]:
+        row = self._page_start + view_row
+        view = self.view_ids
+        if 0 <= view_row and row < len(view):
+            return view[row]
+        return None
+
+    def result_at(self, view_row: int) -> Optional[SearchResult]:
+        i = self._id_at(view_row)
+        return None if i is None else self.all_rows[i]
@@ -1,38 +1,81 @@
 """
 Results Explorer Tab Widget (PySide6).
-Category Filter Chips, Live Search Filtering, Pagination, Context Menu, and Multi-Format Exports.
+Category Filter Chips, Live Search Filtering, Virtualized Table with Optional Pagination,
+Context Menu, and Multi-Format Exports.
 Version 1.2.0 - Zero Emojis
 """
 
 import json
+import os
 from collections import Counter
-from typing import List
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QFileDialog,
-    QMessageBox, QApplication, QMenu, QScrollArea, QFrame, QButtonGroup
+    QTableView, QAbstractItemView, QHeaderView, QComboBox, QFileDialog,
+    QMessageBox, QApplication, QMenu, QScrollArea, QFrame, QButtonGroup, QCheckBox
 )
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QTimer
 from PySide6.QtGui import QDesktopServices, QCursor, QColor
 
 from ..models import SearchResult
-from ..exporter import ExportManager
+from ..exporter import ExportManager, NdjsonReader
+from ..dedup import HashedSeenSet, canonical_url
+from ..findings_store import FindingsStore
+from ..columns import ResultColumns
+from .results_model import ResultsTableModel
 
 
 class ResultsTab(QWidget):
     """
-    Results Explorer with category chip filtering, live search, pagination,
-    table sorting, and multi-format exports.
+    Results Explorer with category chip filtering, live search, optional pagination,
+    table sorting, and multi-format exports. Rows live in a ResultsTableModel shown
+    by a QTableView, so only visible cells are rendered.
+
+    Streaming sweeps deliver only new findings through queue_results(); batches
+    arriving within one frame are coalesced and applied incrementally, so chip
+    counts and the filtered view never rescan all_results. The filter box is
+    debounced and answered from a search index built as results arrive.
+
+    With a FindingsStore, findings from earlier sessions can be loaded back;
+    they are read one store page per event-loop turn so the UI stays responsive.
+    search_stored() instead shows the store's full-text matches, best first.
+    JSON Lines files (exports or CLI sweep output) are imported the same way.
     """
 
-    def __init__(self, parent=None):
+    FRAME_MS = 16
+    FILTER_DEBOUNCE_MS = 150
+    STORE_PAGE_SIZE = 2000
+    STORE_SEARCH_LIMIT = 1000
+
+    def __init__(self, parent=None, findings_store: Optional[FindingsStore] = None):
         super().__init__(parent)
-        self.all_results: List[SearchResult] = []
-        self.filtered_results: List[SearchResult] = []
+        self.model = ResultsTableModel(self)
+        self.findings_store = findings_store
+        self._pages: Optional[Iterator[List[SearchResult]]] = None
+        self._import_reader: Optional[NdjsonReader] = None
         self.current_category_filter: str = "ALL"
         self.current_page: int = 1
-        self.results_per_page: int = 10
+        self.results_per_page: int = 0  # 0 = one scrolling table, no pages
         self.current_query: str = ""
+        self._seen_keys = HashedSeenSet()  # canonical URL, query, category
+        self._chip_buttons: Dict[str, QPushButton] = {}
+        self._pending: List[SearchResult] = []
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(self.FRAME_MS)
+        self._frame_timer.timeout.connect(self.flush_pending)
+
+        # Typing restarts the timer; the filter runs once the user pauses.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self.apply_filter)
+
+        self._page_timer = QTimer(self)
+        self._page_timer.setInterval(0)
+        self._page_timer.timeout.connect(self._load_next_page)
 
         self.init_ui()
 
@@ -47,14 +90,27 @@ class ResultsTab(QWidget):
 
         filter_label = QLabel("Search Findings:")
         self.filter_input = QLineEdit()
-        self.filter_input.setPlaceholderText("Filter by title, URL, snippet, or category...")
+        self.filter_input.setPlaceholderText('Filter findings, e.g. admin  intitle:login  site:example.com  filetype:pdf  -test  "index of"')
+        self.filter_input.setToolTip(
+            "Words match title, URL, snippet, or category. Dork operators filter locally without API calls:\n"
+            "intitle:  inurl:  intext:  allintitle:  site:  filetype:/ext:  \"exact phrase\"  -exclude  OR  ( )"
+        )
         self.filter_input.textChanged.connect(self.on_filter_changed)
+        self.filter_input.returnPressed.connect(self.apply_filter)
+
+        self.group_similar_check = QCheckBox("Group Similar")
+        self.group_similar_check.setToolTip(
+            "Collapse near-duplicate findings (mirrors, paginated listings, repeated\n"
+            "'Index of /' pages) into one row each. Click a row's # cell to expand it."
+        )
+        self.group_similar_check.toggled.connect(self.set_grouping)
 
         self.results_count_label = QLabel("0 Results")
         self.results_count_label.setStyleSheet("font-weight: 600; color: #58a6ff;")
 
         filter_bar.addWidget(filter_label)
         filter_bar.addWidget(self.filter_input, 1)
+        filter_bar.addWidget(self.group_similar_check)
         filter_bar.addWidget(self.results_count_label)
         layout.addLayout(filter_bar)
 
@@ -75,22 +131,29 @@ class ResultsTab(QWidget):
         self.chips_scroll.setWidget(self.chips_widget)
         layout.addWidget(self.chips_scroll)
 
-        # 3. Results Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["#", "Title", "URL / Link", "Category", "Snippet"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Interactive)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Interactive)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        # 3. Results Table (model/view; sorting is done by the model)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # ResizeToContents would measure every row; fixed widths keep large sets cheap.
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(28)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setColumnWidth(0, 64)
         self.table.setColumnWidth(1, 240)
         self.table.setColumnWidth(2, 300)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setColumnWidth(3, 150)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
+        self.table.setSortingEnabled(True)
+        self.table.horizontalHeader().setSortIndicator(0, Qt.AscendingOrder)
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.table.cellDoubleClicked.connect(self.on_row_double_clicked)
+        self.table.doubleClicked.connect(self.on_row_double_clicked)
+        self.table.clicked.connect(self.on_row_clicked)
 
         layout.addWidget(self.table)
 
@@ -107,7 +170,7 @@ class ResultsTab(QWidget):
         self.page_label.setStyleSheet("color: #8b949e; font-weight: 600;")
 
         self.per_page_combo = QComboBox()
-        self.per_page_combo.addItems(["10 per page", "25 per page", "50 per page", "100 per page"])
+        self.per_page_combo.addItems(["All rows", "10 per page", "25 per page", "50 per page", "100 per page"])
         self.per_page_combo.currentIndexChanged.connect(self.on_per_page_changed)
 
         bottom_bar.addWidget(self.prev_btn)
@@ -119,7 +182,8 @@ class ResultsTab(QWidget):
         # Export & Actions Buttons
         export_label = QLabel("Export:")
         self.export_format_combo = QComboBox()
-        self.export_format_combo.addItems(["CSV (Excel UTF-8)", "JSON Data", "Styled HTML Report", "Markdown Table", "Plain Text"])
+        self.export_format_combo.addItems(["CSV (Excel UTF-8)", "JSON Data", "Styled HTML Report", "Markdown Table", "Plain Text",
+                                           "NDJSON (JSON Lines)"])
 
         self.export_btn = QPushButton("Export Findings")
         self.export_btn.setObjectName("primaryBtn")
@@ -132,75 +196,247 @@ class ResultsTab(QWidget):
         self.copy_selected_btn = QPushButton("Copy URL")
         self.copy_selected_btn.clicked.connect(self.copy_selected_url)
 
+        self.load_stored_btn = QPushButton("Search Stored Findings")
+        self.load_stored_btn.setToolTip(
+            "Full-text search of findings saved from earlier sessions for the filter text,\n"
+            "ranked by relevance. With an empty filter, loads every stored finding."
+        )
+        self.load_stored_btn.setVisible(self.findings_store is not None and self.findings_store.available)
+        self.load_stored_btn.clicked.connect(lambda: self.search_stored(self.filter_input.text()))
+
+        self.import_btn = QPushButton("Import Findings")
+        self.import_btn.setToolTip("Load findings from a JSON Lines file (.ndjson / .jsonl, optionally .gz / .xz / .bz2)")
+        self.import_btn.clicked.connect(self.import_findings)
+
         bottom_bar.addWidget(export_label)
         bottom_bar.addWidget(self.export_format_combo)
         bottom_bar.addWidget(self.export_btn)
         bottom_bar.addWidget(self.open_selected_btn)
         bottom_bar.addWidget(self.copy_selected_btn)
+        bottom_bar.addWidget(self.load_stored_btn)
+        bottom_bar.addWidget(self.import_btn)
 
         layout.addLayout(bottom_bar)
         self.rebuild_category_chips()
+        self.render_page()
+
+    @property
+    def all_results(self) -> ResultColumns:
+        """Every finding in arrival order (owned by the model)."""
+        return self.model.all_rows
+
+    @property
+    def filtered_results(self) -> ResultColumns:
+        """Rows passing the current filters, in the table's sort order."""
+        return self.model.rows
+
+    @property
+    def category_counts(self) -> Counter:
+        """Findings per category, from the per-category totals kept by all_results."""
+        return self.model.all_rows.category_counts()
+
+    def _reset_index(self, results: List[SearchResult]):
+        self._page_timer.stop()
+        self._pages = None
+        self._import_reader = None
+        self._seen_keys.clear()
+        self._pending = []
+        self._frame_timer.stop()
+        self.model.set_results(self._ingest(results))
+
+    def _ingest(self, results: List[SearchResult]) -> List[SearchResult]:
+        """Indexes results not seen before (by canonical URL, query, and category) and returns them."""
+        added = []
+        seen = self._seen_keys
+        for result in results:
+            if not seen.add(f"{canonical_url(result.link)}\x1f{result.query}\x1f{result.category}"):
+                continue
+            added.append(result)
+        return added
 
     def set_results(self, results: List[SearchResult], query: str = ""):
-        self.all_results = results
+        self._reset_index(results)
         self.current_query = query
         self.current_category_filter = "ALL"
         self.filter_input.clear()
         self.rebuild_category_chips()
         self.apply_filter()
 
-    def update_results(self, results: List[SearchResult]):
+    def queue_results(self, results: List[SearchResult]):
         """
-        Replaces the current result set with a cumulative update from a worker.
-        Batch workers emit all findings collected so far; replacing avoids
-        duplicating earlier rows on every progress update.
+        Receives a delta of new findings from a worker. Deltas are buffered and
+        applied together on the next frame tick.
         """
-        self.all_results = list(results)
-        self.rebuild_category_chips()
-        self.apply_filter()
+        self._pending.extend(results)
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def flush_pending(self):
+        """Applies buffered deltas now (also called when a sweep finishes)."""
+        self._frame_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.append_results(pending)
 
     def append_results(self, results: List[SearchResult]):
         """
-        Appends new findings while deduplicating by URL, query, and category.
-        Kept for callers that provide incremental result batches.
+        Appends new findings while deduplicating by canonical URL, query, and category.
+        Chip counts and the filtered view are updated from the new rows only.
         """
-        seen = {(r.link, r.query, r.category) for r in self.all_results}
-        for result in results:
-            key = (result.link, result.query, result.category)
-            if key not in seen:
-                self.all_results.append(result)
-                seen.add(key)
-        self.rebuild_category_chips()
-        self.apply_filter()
+        added = self._ingest(results)
+        if not added:
+            return
+        self.model.append(added)
+
+        if any(r.category not in self._chip_buttons for r in added):
+            self.rebuild_category_chips()
+        else:
+            self.update_chip_labels({r.category for r in added})
+
+        self.update_count_label()
+        if self.results_per_page:
+            self.render_page()
+
+    def load_stored(self, **filters):
+        """
+        Replaces the view with findings from the store (optionally filtered by
+        category, host, query, since, until), appended page by page.
+        """
+        if self.findings_store is None:
+            return
+        total = self.findings_store.count(**filters)
+        self.set_results([], query="Stored findings")
+        self._pages = self.findings_store.iter_pages(self.STORE_PAGE_SIZE, **filters)
+        self.results_count_label.setText(f"Loading {total} stored findings...")
+        self._page_timer.start()
+
+    def search_stored(self, text: str) -> int:
+        """
+        Replaces the view with the best STORE_SEARCH_LIMIT stored findings
+        matching text (see FindingsStore.search); empty text loads them all.
+        Returns the number of matches shown.
+        """
+        if self.findings_store is None:
+            return 0
+        if not text.strip():
+            self.load_stored()
+            return self.findings_store.count()
+        results = self.findings_store.search(text, self.STORE_SEARCH_LIMIT)
+        self.set_results(results, query=f"Stored: {text.strip()}")
+        return len(results)
+
+    def import_findings(self):
+        filepath, _ = QFileDialog.getOpenFileName(
+            self, "Import Findings", "",
+            "JSON Lines Files (*.ndjson *.jsonl *.ndjson.gz *.ndjson.xz *.ndjson.bz2 *.jsonl.gz *.jsonl.xz *.jsonl.bz2)"
+            ";;All Files (*)"
+        )
+        if filepath:
+            self.import_ndjson(filepath)
+
+    def import_ndjson(self, filepath: str):
+        """
+        Replaces the view with the findings in a JSON Lines file, read
+        STORE_PAGE_SIZE lines per event-loop turn. Lines that are not JSON
+        objects are skipped and reported when loading ends.
+        """
+        reader = NdjsonReader(filepath)
+        self.set_results([], query=f"Imported: {os.path.basename(filepath)}")
+        self._pages = self._chunked(reader)
+        self._import_reader = reader
+        self.results_count_label.setText(f"Importing {os.path.basename(filepath)}...")
+        self._page_timer.start()
+
+    def _chunked(self, results) -> Iterator[List[SearchResult]]:
+        it = iter(results)
+        while True:
+            page = list(islice(it, self.STORE_PAGE_SIZE))
+            if not page:
+                return
+            yield page
+
+    def _load_next_page(self):
+        try:
+            page = next(self._pages, None) if self._pages is not None else None
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Loading findings failed: {e}")
+            page = None
+        if page is None:
+            self._page_timer.stop()
+            self._pages = None
+            self.update_count_label()
+            self._finish_import()
+            return
+        self.append_results(page)
+
+    def _finish_import(self):
+        reader, self._import_reader = self._import_reader, None
+        if reader is not None and reader.skipped:
+            window = self.window()
+            if hasattr(window, "show_toast"):
+                window.show_toast(f"Skipped {reader.skipped} unreadable lines.")
+
+    def update_count_label(self):
+        text = f"{len(self.filtered_results)} of {len(self.all_results)} Results"
+        if self.group_similar_check.isChecked():
+            text += f" ({self.model.group_count} groups)"
+        self.results_count_label.setText(text)
+
+    def set_grouping(self, enabled: bool):
+        """Collapses near-duplicate findings into expandable groups, or shows every row."""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.model.set_grouping(enabled)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.update_count_label()
+        self.render_page()
+
+    def on_row_clicked(self, index):
+        if index.column() == 0:
+            self.model.toggle_group(index.row())
+
+    def _chip_text(self, category: str) -> str:
+        if category == "ALL":
+            return f"All ({len(self.all_results)})"
+        return f"{category} ({self.category_counts[category]})"
+
+    def update_chip_labels(self, categories):
+        for cat_name in list(categories) + ["ALL"]:
+            chip = self._chip_buttons.get(cat_name)
+            if chip is not None:
+                chip.setText(self._chip_text(cat_name))
 
     def rebuild_category_chips(self):
         # Clear existing buttons from group and layout
         for btn in self.chips_group.buttons():
             self.chips_group.removeButton(btn)
             btn.deleteLater()
-
-        # Count findings per category
-        cat_counts = Counter(r.category for r in self.all_results)
-        total_count = len(self.all_results)
+        while self.chips_layout.count():
+            self.chips_layout.takeAt(0)
+        self._chip_buttons = {}
 
         # 1. "All" Chip
-        all_btn = QPushButton(f"All ({total_count})")
+        all_btn = QPushButton(self._chip_text("ALL"))
         all_btn.setCheckable(True)
         all_btn.setChecked(self.current_category_filter == "ALL")
         all_btn.setProperty("class", "chip-btn")
         all_btn.clicked.connect(lambda: self.select_category_chip("ALL"))
         self.chips_group.addButton(all_btn)
         self.chips_layout.addWidget(all_btn)
+        self._chip_buttons["ALL"] = all_btn
 
-        # 2. Category Chips
-        for cat_name, count in sorted(cat_counts.items()):
-            chip = QPushButton(f"{cat_name} ({count})")
+        # 2. Category Chips (counts are maintained at ingest)
+        for cat_name in sorted(self.category_counts):
+            chip = QPushButton(self._chip_text(cat_name))
             chip.setCheckable(True)
             chip.setChecked(self.current_category_filter == cat_name)
             chip.setProperty("class", "chip-btn")
             chip.clicked.connect(lambda _, c=cat_name: self.select_category_chip(c))
             self.chips_group.addButton(chip)
             self.chips_layout.addWidget(chip)
+            self._chip_buttons[cat_name] = chip
 
         self.chips_layout.addStretch()
 
@@ -211,30 +447,36 @@ class ResultsTab(QWidget):
 
     def on_filter_changed(self):
         self.current_page = 1
-        self.apply_filter()
+        self._filter_timer.start()
 
     def on_per_page_changed(self):
         text = self.per_page_combo.currentText()
-        self.results_per_page = int(text.split()[0])
+        self.results_per_page = int(text.split()[0]) if text[0].isdigit() else 0
         self.current_page = 1
         self.render_page()
 
     def apply_filter(self):
-        query = self.filter_input.text().strip().lower()
-
-        filtered = []
-        for r in self.all_results:
-            if self.current_category_filter != "ALL" and r.category != self.current_category_filter:
-                continue
-            if not query or query in r.title.lower() or query in r.link.lower() or query in r.snippet.lower() or query in r.category.lower():
-                filtered.append(r)
-
-        self.filtered_results = filtered
-        self.results_count_label.setText(f"{len(self.filtered_results)} of {len(self.all_results)} Results")
+        """Compiles the filter text into a ResultQuery answered from the model's search index."""
+        self._filter_timer.stop()
+        category = None if self.current_category_filter == "ALL" else self.current_category_filter
+        self.model.set_filter(text=self.filter_input.text(), category=category)
+        self.update_count_label()
         self.render_page()
 
     def render_page(self):
-        total = len(self.filtered_results)
+        """Updates the page window (when paginating), page controls, and link color."""
+        window = self.window()
+        is_light = hasattr(window, "current_theme") and window.current_theme == "light"
+        self.model.set_link_color(QColor("#0969da") if is_light else QColor("#58a6ff"))
+
+        paged = self.results_per_page > 0
+        for widget in (self.prev_btn, self.next_btn, self.page_label):
+            widget.setVisible(paged)
+        if not paged:
+            self.model.set_page(0, 0)
+            return
+
+        total = len(self.model.view_rows)
         total_pages = max(1, (total + self.results_per_page - 1) // self.results_per_page)
 
         if self.current_page > total_pages:
@@ -245,38 +487,7 @@ class ResultsTab(QWidget):
         self.page_label.setText(f"Page {self.current_page} of {total_pages}")
         self.prev_btn.setEnabled(self.current_page > 1)
         self.next_btn.setEnabled(self.current_page < total_pages)
-
-        start_idx = (self.current_page - 1) * self.results_per_page
-        end_idx = min(start_idx + self.results_per_page, total)
-        page_items = self.filtered_results[start_idx:end_idx]
-
-        self.table.setRowCount(len(page_items))
-
-        # Check theme for adaptive link color
-        window = self.window()
-        is_light = hasattr(window, "current_theme") and window.current_theme == "light"
-        link_color = QColor("#0969da") if is_light else QColor("#58a6ff")
-
-        for row, item in enumerate(page_items):
-            actual_idx = start_idx + row + 1
-
-            idx_item = QTableWidgetItem(str(actual_idx))
-            idx_item.setTextAlignment(Qt.AlignCenter)
-
-            title_item = QTableWidgetItem(item.title)
-            link_item = QTableWidgetItem(item.link)
-            link_item.setForeground(link_color)
-
-            cat_item = QTableWidgetItem(item.category)
-            cat_item.setTextAlignment(Qt.AlignCenter)
-
-            snippet_item = QTableWidgetItem(item.snippet)
-
-            self.table.setItem(row, 0, idx_item)
-            self.table.setItem(row, 1, title_item)
-            self.table.setItem(row, 2, link_item)
-            self.table.setItem(row, 3, cat_item)
-            self.table.setItem(row, 4, snippet_item)
+        self.model.set_page((self.current_page - 1) * self.results_per_page, self.results_per_page)
 
     def prev_page(self):
         if self.current_page > 1:
@@ -284,24 +495,20 @@ class ResultsTab(QWidget):
             self.render_page()
 
     def next_page(self):
-        total = len(self.filtered_results)
+        total = len(self.model.view_rows)
         total_pages = max(1, (total + self.results_per_page - 1) // self.results_per_page)
         if self.current_page < total_pages:
             self.current_page += 1
             self.render_page()
 
     def get_selected_result(self):
-        row = self.table.currentRow()
-        if row < 0:
+        index = self.table.currentIndex()
+        if not index.isValid():
             return None
-        start_idx = (self.current_page - 1) * self.results_per_page
-        item_idx = start_idx + row
-        if 0 <= item_idx < len(self.filtered_results):
-            return self.filtered_results[item_idx]
-        return None
+        return self.model.result_at(index.row())
 
-    def on_row_double_clicked(self, row: int, col: int):
-        r = self.get_selected_result()
+    def on_row_double_clicked(self, index):
+        r = self.model.result_at(index.row())
         if r and r.link:
             QDesktopServices.openUrl(QUrl(r.link))
 
@@ -323,15 +530,20 @@ class ResultsTab(QWidget):
             QMessageBox.information(self, "Selection Required", "Please select a result row to copy.")
 
     def show_context_menu(self, pos):
-        row = self.table.rowAt(pos.y())
-        if row < 0:
+        index = self.table.indexAt(pos)
+        if not index.isValid():
             return
-        self.table.selectRow(row)
+        self.table.selectRow(index.row())
         r = self.get_selected_result()
         if not r:
             return
 
         menu = QMenu(self)
+        group_act = None
+        expanded = self.model.group_state(index.row())
+        if expanded is not None:
+            group_act = menu.addAction("Collapse Similar Results" if expanded else "Expand Similar Results")
+            menu.addSeparator()
         open_act = menu.addAction("Open URL in Browser")
         copy_url_act = menu.addAction("Copy URL")
         copy_title_act = menu.addAction("Copy Title")
@@ -340,7 +552,9 @@ class ResultsTab(QWidget):
         copy_json_act = menu.addAction("Copy Row as JSON")
 
         action = menu.exec(QCursor.pos())
-        if action == open_act:
+        if action is not None and action == group_act:
+            self.model.toggle_group(index.row())
+        elif action == open_act:
             QDesktopServices.openUrl(QUrl(r.link))
         elif action == copy_url_act:
             QApplication.clipboard().setText(r.link)
@@ -371,28 +585,33 @@ class ResultsTab(QWidget):
 
         fmt_idx = self.export_format_combo.currentIndex()
         if fmt_idx == 0:
-            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as CSV", "dork_results.csv", "CSV Files (*.csv)")
+            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as CSV", "dork_results.csv", "CSV Files (*.csv);;Compressed (*.csv.gz *.csv.xz *.csv.bz2)")
             if filepath:
                 if ExportManager.export_csv(filepath, target_results):
                     QMessageBox.information(self, "Export Succeeded", f"Saved {len(target_results)} findings to:\n{filepath}")
         elif fmt_idx == 1:
-            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as JSON", "dork_results.json", "JSON Files (*.json)")
+            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as JSON", "dork_results.json", "JSON Files (*.json);;Compressed (*.json.gz *.json.xz *.json.bz2)")
             if filepath:
                 if ExportManager.export_json(filepath, target_results):
                     QMessageBox.information(self, "Export Succeeded", f"Saved {len(target_results)} findings to:\n{filepath}")
         elif fmt_idx == 2:
-            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as HTML Report", "dork_report.html", "HTML Files (*.html)")
+            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as HTML Report", "dork_report.html", "HTML Files (*.html);;Compressed (*.html.gz *.html.xz *.html.bz2)")
             if filepath:
                 if ExportManager.export_html(filepath, target_results, self.current_query):
                     QMessageBox.information(self, "Export Succeeded", f"Saved HTML report to:\n{filepath}")
         elif fmt_idx == 3:
-            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as Markdown", "dork_results.md", "Markdown Files (*.md)")
+            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as Markdown", "dork_results.md", "Markdown Files (*.md);;Compressed (*.md.gz *.md.xz *.md.bz2)")
             if filepath:
                 if ExportManager.export_markdown(filepath, target_results, self.current_query):
                     QMessageBox.information(self, "Export Succeeded", f"Saved Markdown report to:\n{filepath}")
         elif fmt_idx == 4:
-            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as Plain Text", "dork_results.txt", "Text Files (*.txt)")
+            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as Plain Text", "dork_results.txt", "Text Files (*.txt);;Compressed (*.txt.gz *.txt.xz *.txt.bz2)")
             if filepath:
                 if ExportManager.export_txt(filepath, target_results, self.current_query):
                     QMessageBox.information(self, "Export Succeeded", f"Saved text report to:\n{filepath}")
+        elif fmt_idx == 5:
+            filepath, _ = QFileDialog.getSaveFileName(self, "Export Findings as JSON Lines", "dork_results.ndjson", "JSON Lines Files (*.ndjson *.jsonl);;Compressed (*.ndjson.gz *.ndjson.xz *.ndjson.bz2)")
+            if filepath:
+                if ExportManager.export_ndjson(filepath, target_results):
+                    QMessageBox.information(self, "Export Succeeded", f"Saved {len(target_results)} findings to:\n{filepath}")
 
@@ -4,7 +4,7 @@ Search Filtering, Quick Copy, and Re-run capabilities with Zero Emojis.
 Version 1.2.0
 """
 
-from typing import Callable
+from typing import Callable, Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox, QSplitter,
@@ -21,14 +21,18 @@ from ..bookmarks import BookmarksManager
 class SavedTab(QWidget):
     """
     Split view displaying Saved Dork Bookmarks and Search History with search filters.
+    With on_search_findings, the history filter text can also be run as a
+    full-text search over every stored finding.
     """
 
     def __init__(self, bookmarks_mgr: BookmarksManager,
                  on_execute_query: Callable[[str], None],
-                 parent=None):
+                 parent=None,
+                 on_search_findings: Optional[Callable[[str], None]] = None):
         super().__init__(parent)
         self.bookmarks_mgr = bookmarks_mgr
         self.on_execute_query = on_execute_query
+        self.on_search_findings = on_search_findings
         self.raw_bookmarks = []
         self.raw_history = []
 
@@ -113,9 +117,15 @@ class SavedTab(QWidget):
         clear_hist_btn.setObjectName("dangerBtn")
         clear_hist_btn.clicked.connect(self.clear_history)
 
+        search_findings_btn = QPushButton("Search Findings")
+        search_findings_btn.setToolTip("Full-text search of every stored finding for the filter text (no API calls)")
+        search_findings_btn.setVisible(self.on_search_findings is not None)
+        search_findings_btn.clicked.connect(self.search_findings)
+
         hist_bar.addWidget(self.hist_filter_input, 2)
         hist_bar.addWidget(rerun_btn)
         hist_bar.addWidget(copy_hist_btn)
+        hist_bar.addWidget(search_findings_btn)
         hist_bar.addWidget(clear_hist_btn)
         hist_layout.addLayout(hist_bar)
 
@@ -275,6 +285,13 @@ class SavedTab(QWidget):
             if query_item:
                 self.on_execute_query(query_item.text())
 
+    def search_findings(self):
+        text = self.hist_filter_input.text().strip()
+        if not text:
+            QMessageBox.information(self, "Search Findings", "Type words to search for in stored findings.")
+            return
+        self.on_search_findings(text)
+
     def clear_history(self):
         reply = QMessageBox.question(self, "Clear History", "Are you sure you want to clear all search history?", QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QComboBox, QGroupBox, QGridLayout, QScrollArea, QFrame,
     QCheckBox, QRadioButton, QButtonGroup, QMessageBox, QApplication,
-    QTabWidget
+    QTabWidget, QFileDialog
 )
 from PySide6.QtCore import Qt, QUrl
 from PySide6.QtGui import QDesktopServices, QKeyEvent
@@ -42,13 +42,18 @@ class SearchTab(QWidget):
     Plain-English Explainer, and Automated Recon Suite.
     """
 
-    def __init__(self, on_run_api_search: Callable[[str, str], None],
+    API_RESULT_COUNTS = (10, 30, 50, 100)
+    PARALLEL_PAGES = 4  # pages in flight at once when "Fetch Pages in Parallel" is checked
+
+    def __init__(self, on_run_api_search: Callable[[str, str, int, int], None],
                  on_run_batch_recon: Callable[[str, List[str], str], None],
                  bookmarks_mgr: BookmarksManager,
+                 on_run_bulk_recon: Callable[[str, List[str]], None] = None,
                  parent=None):
         super().__init__(parent)
         self.on_run_api_search = on_run_api_search
         self.on_run_batch_recon = on_run_batch_recon
+        self.on_run_bulk_recon = on_run_bulk_recon
         self.bookmarks_mgr = bookmarks_mgr
         self.category_checkboxes: List[Tuple[str, QCheckBox]] = []
         self.filetype_buttons: Dict[str, QPushButton] = {}
@@ -202,6 +207,16 @@ class SearchTab(QWidget):
         self.search_api_btn.setObjectName("primaryBtn")
         self.search_api_btn.clicked.connect(self.run_api_search)
 
+        self.api_results_combo = QComboBox()
+        self.api_results_combo.addItems([f"{n} results" for n in self.API_RESULT_COUNTS])
+        self.api_results_combo.setToolTip("Results to fetch via the API (10 per request)")
+
+        self.parallel_pages_check = QCheckBox("Fetch Pages in Parallel")
+        self.parallel_pages_check.setChecked(True)
+        self.parallel_pages_check.setToolTip(
+            "Fetch result pages after the first concurrently (still within the rate limit)"
+        )
+
         self.search_browser_btn = QPushButton("Open in Browser (Direct)")
         self.search_browser_btn.setObjectName("browserBtn")
         self.search_browser_btn.clicked.connect(self.run_browser_search)
@@ -217,6 +232,8 @@ class SearchTab(QWidget):
         self.clear_btn.clicked.connect(self.clear_editor)
 
         actions_bar.addWidget(self.search_api_btn)
+        actions_bar.addWidget(self.api_results_combo)
+        actions_bar.addWidget(self.parallel_pages_check)
         actions_bar.addWidget(self.search_browser_btn)
         actions_bar.addWidget(self.save_bookmark_btn)
         actions_bar.addWidget(self.copy_query_btn)
@@ -509,8 +526,14 @@ class SearchTab(QWidget):
         self.preview_dorks_btn = QPushButton("Preview Generated Dorks")
         self.preview_dorks_btn.clicked.connect(self.preview_dork_queries)
 
+        self.bulk_sweep_btn = QPushButton("Bulk Sweep from Target List...")
+        self.bulk_sweep_btn.setToolTip("Sweep every domain, email, name, or username in a text file (one per line)")
+        self.bulk_sweep_btn.setEnabled(self.on_run_bulk_recon is not None)
+        self.bulk_sweep_btn.clicked.connect(self.run_bulk_sweep)
+
         exec_bar.addWidget(self.run_sweep_btn)
         exec_bar.addWidget(self.preview_dorks_btn)
+        exec_bar.addWidget(self.bulk_sweep_btn)
         exec_bar.addStretch()
         layout.addLayout(exec_bar)
 
@@ -656,7 +679,9 @@ class SearchTab(QWidget):
         if not query:
             QMessageBox.warning(self, "Empty Query", "Please enter a valid search query.")
             return
-        self.on_run_api_search(query, "Manual Search")
+        num_results = self.API_RESULT_COUNTS[self.api_results_combo.currentIndex()]
+        pages = self.PARALLEL_PAGES if self.parallel_pages_check.isChecked() else 1
+        self.on_run_api_search(query, "Manual Search", num_results, pages)
 
     def run_browser_search(self):
         query = self.query_editor.toPlainText().strip()
@@ -722,6 +747,19 @@ class SearchTab(QWidget):
         t_type = self.get_resolved_target_type(target, combo_idx)
         self.on_run_batch_recon(target, selected, t_type)
 
+    def run_bulk_sweep(self):
+        if self.on_run_bulk_recon is None:
+            return
+        selected = self.get_selected_categories()
+        if not selected:
+            QMessageBox.warning(self, "No Categories", "Please select at least one reconnaissance category.")
+            return
+        filepath, _ = QFileDialog.getOpenFileName(
+            self, "Select Target List", "", "Text Files (*.txt *.lst *.csv);;All Files (*)"
+        )
+        if filepath:
+            self.on_run_bulk_recon(filepath, selected)
+
     def preview_dork_queries(self):
         target = self.target_scope_input.text().strip()
         if not target:
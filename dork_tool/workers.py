@@ -3,16 +3,29 @@ PySide6 QThread Background Search Workers.
 Version 1.2.0 - With robust exception and cancellation handling.
 """
 
-import requests
-from typing import List, Tuple
+from typing import Iterable, Optional, Tuple
 from PySide6.QtCore import QThread, Signal
-from .models import SearchResult
 from .rate_limiter import AdvancedRateLimiter
+from .session import HttpSessionManager
+from .cache import ResponseCache
+from .search_core import SearchClient
+from .async_sweep import AsyncSweepEngine
+from .journal import SweepJournal
+from .retry import RetryPolicy
+from .findings_store import FindingsStore
+from .columns import ResultColumns
 
 
 class GoogleSearchWorker(QThread):
     """
     Background worker thread for executing Google Custom Search API requests with pagination.
+
+    Pages are fetched by SearchClient.fetch_results(): with concurrent_pages > 1 the
+    first page is fetched on its own to learn how many results exist, then the remaining
+    page offsets are fetched in parallel through a bounded pool and reassembled in order.
+    Every page still passes through the shared rate limiter, and transient failures
+    (429/5xx/timeouts) are retried with backoff.
+    Collected results are written to the findings_store, if given, in one transaction.
     """
     result_ready = Signal(list, int, str)  # List[SearchResult], total_results, query
     progress_update = Signal(int, str)     # percentage (0-100), status_message
@@ -22,7 +35,11 @@ class GoogleSearchWorker(QThread):
     def __init__(self, api_key: str, cse_id: str, query: str,
                  num_results: int = 10, start_index: int = 1,
                  rate_limiter: AdvancedRateLimiter = None,
-                 category: str = "Manual"):
+                 category: str = "Manual", concurrent_pages: int = 1,
+                 http_session: HttpSessionManager = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 findings_store: Optional[FindingsStore] = None):
         super().__init__()
         self.api_key = api_key
         self.cse_id = cse_id
@@ -31,10 +48,14 @@ class GoogleSearchWorker(QThread):
         self.start_index = max(start_index, 1)
         self.rate_limiter = rate_limiter or AdvancedRateLimiter()
         self.category = category
+        self.concurrent_pages = min(max(concurrent_pages, 1), 10)
+        self.findings_store = findings_store
+        self.client = SearchClient(api_key, cse_id, self.rate_limiter, http_session, response_cache, retry_policy)
         self._is_cancelled = False
 
     def cancel(self):
         self._is_cancelled = True
+        self.client.cancel()
 
     def run(self):
         try:
@@ -46,86 +67,20 @@ class GoogleSearchWorker(QThread):
                 self.error_occurred.emit("Search query cannot be empty.")
                 return
 
-            results: List[SearchResult] = []
-            total_fetched = 0
-            total_available = 0
-            current_start = self.start_index
+            self.client.retry_policy.start()
+            if self._is_cancelled:
+                self.client.cancel()
 
             self.progress_update.emit(10, f"Initializing search for: '{self.query[:40]}...'")
 
-            while total_fetched < self.num_results and not self._is_cancelled:
-                if current_start > 91:
-                    break
-
-                can_req, msg = self.rate_limiter.can_request()
-                if not can_req:
-                    self.error_occurred.emit(msg)
-                    break
-
-                self.rate_limiter.throttle()
-
-                batch_size = min(10, self.num_results - total_fetched)
-                url = "https://www.googleapis.com/customsearch/v1"
-                params = {
-                    "key": self.api_key,
-                    "cx": self.cse_id,
-                    "q": self.query,
-                    "num": batch_size,
-                    "start": current_start
-                }
-
-                self.progress_update.emit(
-                    min(90, int(15 + (total_fetched / self.num_results) * 75)),
-                    f"Fetching results {current_start} - {current_start + batch_size - 1}..."
-                )
-
-                try:
-                    response = requests.get(url, params=params, timeout=12)
-                    self.rate_limiter.record_request()
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        search_info = data.get("searchInformation", {})
-                        total_available = int(search_info.get("totalResults", "0"))
-                        items = data.get("items", [])
-
-                        if not items:
-                            break
-
-                        for item in items:
-                            results.append(SearchResult(
-                                title=item.get("title", "No Title"),
-                                link=item.get("link", ""),
-                                snippet=item.get("snippet", ""),
-                                category=self.category,
-                                query=self.query
-                            ))
-
-                        total_fetched += len(items)
-                        current_start += len(items)
-
-                        if len(items) < batch_size:
-                            break
-
-                    elif response.status_code == 400:
-                        self.error_occurred.emit("HTTP 400: Invalid Request or invalid CSE ID.")
-                        break
-                    elif response.status_code == 403:
-                        self.error_occurred.emit("HTTP 403: Forbidden - Custom Search API not enabled or daily quota exceeded.")
-                        break
-                    elif response.status_code == 429:
-                        self.error_occurred.emit("HTTP 429: Rate limited by Google. Please wait a moment.")
-                        break
-                    else:
-                        self.error_occurred.emit(f"API Error {response.status_code}: {response.text[:120]}")
-                        break
-
-                except requests.exceptions.Timeout:
-                    self.error_occurred.emit("Search request timed out. Please check your network connection.")
-                    break
-                except requests.exceptions.RequestException as e:
-                    self.error_occurred.emit(f"Network error: {str(e)}")
-                    break
+            results, total_available = self.client.fetch_results(
+                self.query, self.num_results, self.start_index, self.category,
+                concurrency=self.concurrent_pages,
+                on_progress=self.progress_update.emit,
+                on_error=self.error_occurred.emit
+            )
+            if self.findings_store is not None:
+                self.findings_store.add(results)
 
             if self._is_cancelled:
                 self.progress_update.emit(100, "Search cancelled by user.")
@@ -139,91 +94,80 @@ class GoogleSearchWorker(QThread):
             self.finished_search.emit()
 
 
-class AutoDorkBatchWorker(QThread):
+class AsyncDorkBatchWorker(QThread):
     """
-    Background worker thread for batch executing multiple dork queries in sequence.
+    Background worker thread for batch sweeps over a list or lazy iterable of dorks.
+    Drives AsyncSweepEngine on a private asyncio event loop, so several dorks are in
+    flight at once; the signals are emitted from this thread, so Qt queues them onto
+    the GUI thread. Rate-limited or failed dorks are retried with backoff before being
+    reported. With reuse_results, dorks that only narrow a broader dork with complete
+    results are answered locally instead of by the API. Fetched pages are queued on
+    the findings_store, if given, for batched writes, and new findings are
+    accumulated in a columnar ResultColumns.
+
+    Replaces the sequential AutoDorkBatchWorker (max_concurrency=1 keeps its
+    one-at-a-time order). Unlike it, results_added carries only the new findings
+    instead of the cumulative list, and batch_finished carries a ResultColumns.
     """
     category_started = Signal(str, str, int, int)  # category, query, index, total
-    results_updated = Signal(list)                 # cumulative List[SearchResult]
+    results_added = Signal(list)                   # new List[SearchResult] since the last emit
     progress_update = Signal(int, str)             # percentage (0-100), message
     error_occurred = Signal(str)
-    batch_finished = Signal(list)                  # final List[SearchResult]
-
-    def __init__(self, api_key: str, cse_id: str, dork_list: List[Tuple[str, str]],
-                 rate_limiter: AdvancedRateLimiter = None, max_per_dork: int = 5):
+    batch_finished = Signal(object)                # final ResultColumns of findings
+
+    def __init__(self, api_key: str, cse_id: str, dork_list: Iterable[Tuple[str, str]],
+                 rate_limiter: AdvancedRateLimiter = None, max_per_dork: int = 5,
+                 http_session: HttpSessionManager = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 journal: Optional[SweepJournal] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 reuse_results: bool = True,
+                 findings_store: Optional[FindingsStore] = None,
+                 max_concurrency: int = 4):
         super().__init__()
         self.api_key = api_key
         self.cse_id = cse_id
         self.dork_list = dork_list
+        self.journal = journal
         self.rate_limiter = rate_limiter or AdvancedRateLimiter()
         self.max_per_dork = max_per_dork
+        self.client = SearchClient(api_key, cse_id, self.rate_limiter, http_session, response_cache, retry_policy)
+        self.reuse_results = reuse_results
+        self.findings_store = findings_store
+        self.max_concurrency = max_concurrency
+        self._engine: Optional[AsyncSweepEngine] = None
         self._is_cancelled = False
 
     def cancel(self):
         self._is_cancelled = True
+        self.client.cancel()
+        if self._engine is not None:
+            self._engine.cancel()
 
     def run(self):
-        all_results: List[SearchResult] = []
+        all_results = ResultColumns()
         try:
             if not self.api_key or not self.cse_id:
                 self.error_occurred.emit("API Key and CSE ID are required. Configure them in the Credentials tab.")
                 return
 
-            seen_links = set()
-            total_dorks = len(self.dork_list)
-
-            for idx, (cat_name, query) in enumerate(self.dork_list, start=1):
-                if self._is_cancelled:
-                    break
-
-                can_req, msg = self.rate_limiter.can_request()
-                if not can_req:
-                    self.error_occurred.emit(msg)
-                    break
-
-                self.category_started.emit(cat_name, query, idx, total_dorks)
-                pct = int((idx / total_dorks) * 100)
-                self.progress_update.emit(pct, f"[{idx}/{total_dorks}] Running {cat_name}: {query[:35]}...")
-
-                self.rate_limiter.throttle()
-
-                url = "https://www.googleapis.com/customsearch/v1"
-                params = {
-                    "key": self.api_key,
-                    "cx": self.cse_id,
-                    "q": query,
-                    "num": min(self.max_per_dork, 10),
-                    "start": 1
-                }
-
-                try:
-                    resp = requests.get(url, params=params, timeout=12)
-                    self.rate_limiter.record_request()
-
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        items = data.get("items", [])
-                        for item in items:
-                            link = item.get("link", "")
-                            if link and link not in seen_links:
-                                seen_links.add(link)
-                                sr = SearchResult(
-                                    title=item.get("title", "No Title"),
-                                    link=link,
-                                    snippet=item.get("snippet", ""),
-                                    category=cat_name,
-                                    query=query
-                                )
-                                all_results.append(sr)
-                        self.results_updated.emit(list(all_results))
-
-                    elif resp.status_code == 429:
-                        self.error_occurred.emit("HTTP 429: Rate limit hit. Cooling down...")
-                    elif resp.status_code in (400, 403):
-                        self.error_occurred.emit(f"HTTP {resp.status_code}: Error with API keys or permissions.")
-                        break
-                except Exception as e:
-                    self.error_occurred.emit(f"Error executing dork: {str(e)}")
+            self._engine = AsyncSweepEngine(
+                client=self.client,
+                dork_list=self.dork_list,
+                max_per_dork=self.max_per_dork,
+                max_concurrency=self.max_concurrency,
+                journal=self.journal,
+                reuse_results=self.reuse_results,
+                findings_store=self.findings_store,
+                on_dork_started=self.category_started.emit,
+                on_results=lambda new: self.results_added.emit(new) if new else None,
+                on_progress=self.progress_update.emit,
+                on_error=self.error_occurred.emit
+            )
+            if self._is_cancelled:
+                self._engine.cancel()
+
+            all_results = self._engine.run()
 
             if self._is_cancelled:
                 self.progress_update.emit(100, f"Batch sweep cancelled by user. Aggregated {len(all_results)} results.")
@@ -233,4 +177,6 @@ class AutoDorkBatchWorker(QThread):
         except Exception as e:
             self.error_occurred.emit(f"Unexpected batch worker error: {str(e)}")
         finally:
+            if self.findings_store is not None:
+                self.findings_store.flush()
             self.batch_finished.emit(all_results)
@@ -101,6 +101,43 @@ def test_multi_target_detection_and_generation():
     print("  -> Multi-Target Entity Engine, Explainer & Real-Time Analyzer: PASSED")
 
 
+def test_bulk_dork_generator():
+    print("[TEST] Bulk Target Streaming & Cross-Target Dedup...")
+    from dork_tool.bulk import BulkDorkGenerator, count_targets, iter_targets
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "targets.txt")
+        with open(path, "w", encoding="utf-8-sig") as f:
+            f.write("# scope\nexample.com\n\n  https://example.com/  \nother.org\n")
+        assert list(iter_targets(path)) == ["example.com", "https://example.com/", "other.org"]
+        assert count_targets(path) == 3
+
+        # Dorks for a target are generated only once the sweep reaches it.
+        consumed = []
+
+        def targets():
+            for target in iter_targets(path):
+                consumed.append(target)
+                yield target
+
+        gen = BulkDorkGenerator(targets(), ["basic_info"])
+        pairs = iter(gen)
+        first = next(pairs)
+        assert first == ("Basic Info", "site:example.com") and consumed == ["example.com"]
+        assert gen.targets_processed == 1 and gen.current_target == "example.com"
+
+        # The URL form cleans to the same domain, so its queries were all produced already.
+        rest = list(pairs)
+        per_domain = len(DorkEngine.generate_dorks("example.com", ["basic_info"]))
+        assert gen.targets_processed == 3 and gen.current_target == "other.org"
+        assert gen.duplicates_skipped == per_domain
+        queries = [q for _, q in [first] + rest]
+        assert len(queries) == len(set(queries)) == 2 * per_domain
+        assert all("other.org" in q for q in queries[per_domain:])
+
+    print("  -> Lazy Per-Target Generation, List Parsing & Cross-Target Dedup: PASSED")
+
+
 def test_visual_form_builder():
     print("[TEST] Visual Form Builder Dork Compilation...")
     app = QApplication.instance() or QApplication(sys.argv)
@@ -138,6 +175,100 @@ def test_qss_stylesheets():
     print("  -> dark.qss and light.qss Loaded: PASSED")
 
 
+def test_cli_dorks_and_search():
+    print("[TEST] Headless CLI dorks & search...")
+    import contextlib
+    import io
+    from unittest import mock
+    from dork_tool import cli
+    from dork_tool.quota_ledger import QuotaLedger
+    from dork_tool.session import HttpSessionManager
+
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+
+        def json(self):
+            items = [{"title": f"Doc {i}", "link": f"https://example.com/{i}.pdf", "snippet": "s"} for i in range(3)]
+            return {"searchInformation": {"totalResults": "3"}, "items": items}
+
+    class FakeHttp:
+        def get(self, url, params=None, timeout=12):
+            return FakeResponse()
+
+    def run(*argv):
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = cli.main(list(argv))
+        return code, out.getvalue(), err.getvalue()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # A fresh home directory: no saved credentials, quota, cache, or findings store.
+        with mock.patch.dict(os.environ, {"HOME": tmpdir, "USERPROFILE": tmpdir}):
+            for name in ("GOOGLE_API_KEY", "GOOGLE_CSE_ID", "GOOGLE_API_KEYS"):
+                os.environ.pop(name, None)
+
+            code, out, _ = run("dorks", "example.com", "-c", "files")
+            lines = out.splitlines()
+            assert code == 0 and lines and all(line.split("\t")[1].startswith("site:example.com") for line in lines)
+            assert run("dorks", "example.com", "-c", "nope")[0] == 2
+
+            code, out, err = run("search", "site:example.com", "--no-cache", "--no-store")
+            assert code == 2 and out == "" and "API Key and CSE ID are required" in err
+
+            with mock.patch.object(HttpSessionManager, "_shared", FakeHttp()):
+                base = ("search", "site:example.com ext:pdf", "--api-key", "K", "--cse-id", "C",
+                        "--no-cache", "--no-store", "--single-key", "-q", "-n", "3")
+                code, out, err = run(*base)
+                assert code == 0 and out.splitlines()[0] == "Manual\thttps://example.com/0.pdf\tDoc 0"
+                assert "[OK] 3 results" in err
+
+                code, out, _ = run(*base, "--format", "json", "--category", "Files")
+                rows = [json.loads(line) for line in out.splitlines()]
+                assert code == 0 and [r["title"] for r in rows] == ["Doc 0", "Doc 1", "Doc 2"]
+                assert rows[0]["category"] == "Files" and rows[0]["query"] == "site:example.com ext:pdf"
+
+                export = os.path.join(tmpdir, "out.csv")
+                assert run(*base, "-o", export)[0] == 0 and os.path.getsize(export) > 0
+                assert run(*base, "-o", os.path.join(tmpdir, "out.xlsx"))[0] == 1
+
+            # Ctrl+C mid-sweep keeps the journal; the same command resumes without resending.
+            class InterruptingHttp:
+                def __init__(self, interrupt_at=0):
+                    self.queries = []
+                    self.interrupt_at = interrupt_at
+
+                def get(self, url, params=None, timeout=12):
+                    self.queries.append(params["q"])
+                    if len(self.queries) == self.interrupt_at:
+                        raise KeyboardInterrupt
+                    return FakeResponse()
+
+            sweep = ("sweep", "example.com", "-c", "basic_info", "--api-key", "K", "--cse-id", "C", "--no-cache",
+                     "--no-store", "--no-reuse", "--single-key", "--concurrency", "1", "-q")
+            queries = [q for _, q in DorkEngine.generate_dorks("example.com", ["basic_info"])]
+            http = InterruptingHttp(interrupt_at=2)
+            with mock.patch.object(HttpSessionManager, "_shared", http):
+                code, _, err = run(*sweep)
+            assert code == 0 and "[!] Sweep interrupted." in err and http.queries == queries[:2]
+            http = InterruptingHttp()
+            with mock.patch.object(HttpSessionManager, "_shared", http):
+                code, _, err = run(*sweep)
+            assert code == 0 and "Resuming interrupted sweep: 1 completed" in err
+            assert http.queries == queries[1:]
+
+            # A closed stdout pipe (e.g. "| head") ends the command quietly.
+            class ClosedPipe(io.StringIO):
+                def write(self, text):
+                    raise BrokenPipeError
+
+            with contextlib.redirect_stdout(ClosedPipe()):
+                assert cli.main(["dorks", "example.com"]) == 1
+            QuotaLedger.flush_all()  # before tmpdir goes away
+
+    print("  -> Dork Listing, Missing Credentials, Text/JSON Streams, Exports, Interrupt Resume & Broken Pipes: PASSED")
+
+
 def test_exports_and_csv_injection():
     print("[TEST] Multi-Format Exporters & CSV Formula Injection Protection...")
     results = [
@@ -184,15 +315,1076 @@ def test_exports_and_csv_injection():
     print("  -> Exporters & Formula Injection Sanitization: PASSED")
 
 
+def test_streaming_exporters():
+    print("[TEST] Streaming Exporters from Generators...")
+    import csv
+    from dork_tool import exporter
+
+    def generate(n):
+        for i in range(n):
+            title = "=HYPERLINK(1)" if i == n - 1 else f"Finding {i}, <b>bold</b>"
+            yield SearchResult(title=title, link=f"https://example.com/{i}?a=1&b=2", snippet='say "hi"\nline two',
+                               category="Files", query="site:example.com", timestamp="2024-01-05 10:00:00")
+
+    n = exporter.CHUNK_ROWS + 5  # spans a chunk boundary
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {fmt: os.path.join(tmpdir, f"out.{fmt}") for fmt in ("csv", "json", "html", "md", "txt")}
+        assert ExportManager.export_csv(paths["csv"], generate(n))
+        assert ExportManager.export_json(paths["json"], generate(n))
+        assert ExportManager.export_html(paths["html"], generate(n), "q")
+        assert ExportManager.export_markdown(paths["md"], generate(n), "q")
+        assert ExportManager.export_txt(paths["txt"], generate(n), "q")
+
+        with open(paths["csv"], encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == n + 1 and rows[1][0] == "Finding 0, <b>bold</b>" and rows[1][2] == 'say "hi"\nline two'
+        assert rows[-1][0] == "'=HYPERLINK(1)"
+        with open(paths["json"], encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["total_results"] == n and len(data["results"]) == n
+        assert [SearchResult.from_dict(d) for d in data["results"]] == list(generate(n))
+        with open(paths["html"], encoding="utf-8") as f:
+            page = f.read()
+        assert page.count('class="result-card"') == n and "&lt;b&gt;bold&lt;/b&gt;" in page
+        assert f"Total Findings: <strong>{n}</strong>" in page and page.rstrip().endswith("</html>")
+        with open(paths["txt"], encoding="utf-8") as f:
+            assert f.read().rstrip().endswith(f"Total Results: {n}")
+
+        # Sized inputs keep the count in the header; empty ones still produce valid reports.
+        assert ExportManager.export_json(paths["json"], [])
+        with open(paths["json"], encoding="utf-8") as f:
+            assert json.load(f)["results"] == []
+        assert ExportManager.export_html(paths["html"], [], "")
+        with open(paths["html"], encoding="utf-8") as f:
+            assert "No results found." in f.read()
+
+        # Imported files may carry null fields; every format writes them as empty text.
+        imported = [SearchResult.from_dict({"title": None, "link": "https://example.com/x", "snippet": None,
+                                            "timestamp": "2024-01-05 10:00:00"})]
+        ndjson_path = os.path.join(tmpdir, "out.ndjson")
+        for export, path in ((ExportManager.export_csv, paths["csv"]), (ExportManager.export_json, paths["json"]),
+                             (ExportManager.export_ndjson, ndjson_path), (ExportManager.export_txt, paths["txt"]),
+                             (ExportManager.export_markdown, paths["md"]), (ExportManager.export_html, paths["html"])):
+            assert export(path, imported), path
+        with open(paths["csv"], encoding="utf-8-sig", newline="") as f:
+            assert list(csv.reader(f)) == [["Title", "URL", "Snippet", "Category", "Query", "Timestamp"],
+                                           ["", "https://example.com/x", "", "Manual", "", "2024-01-05 10:00:00"]]
+        with open(ndjson_path, encoding="utf-8") as f:
+            assert SearchResult.from_dict(json.loads(f.readline())).title == ""
+
+    print("  -> Chunked CSV/JSON/HTML/Markdown/TXT Writes from Iterators & Null Fields: PASSED")
+
+
+def test_compressed_exports():
+    print("[TEST] Compressed Exports & Import...")
+    import bz2
+    import gzip
+    import lzma
+    from dork_tool import cli
+    from dork_tool.exporter import NdjsonReader, format_extension
+
+    findings = [SearchResult(title=f"Report {i}", link=f"https://example.com/r{i}.pdf", snippet="quarterly figures",
+                             category="Files", query="site:example.com filetype:pdf",
+                             timestamp="2024-01-05 10:00:00") for i in range(3000)]
+    assert format_extension("Out.CSV.GZ") == ".csv" and format_extension("out.ndjson") == ".ndjson"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain = os.path.join(tmpdir, "findings.csv")
+        ExportManager.export_csv(plain, findings)
+        with open(plain, "rb") as f:
+            expected = f.read()
+        for suffix in (".gz", ".xz", ".bz2"):
+            path = plain + suffix
+            assert ExportManager.export_csv(path, (r for r in findings))
+            with open(path, "rb") as f:
+                packed = f.read()
+            assert len(packed) * 10 < len(expected)
+            assert {".gz": gzip, ".xz": lzma, ".bz2": bz2}[suffix].decompress(packed) == expected
+
+            archive = os.path.join(tmpdir, "findings.ndjson" + suffix)
+            assert ExportManager.export_ndjson(archive, findings[:10])
+            assert ExportManager.export_ndjson(archive, findings[10:20], append=True)
+            assert list(NdjsonReader(archive)) == findings[:20]
+
+        # A compressed archive cut off mid-write is read up to the cut.
+        archive = os.path.join(tmpdir, "findings.ndjson.gz")
+        ExportManager.export_ndjson(archive, findings)
+        with open(archive, "rb") as f:
+            data = f.read()
+        with open(archive, "wb") as f:
+            f.write(data[:len(data) // 2])
+        reader = NdjsonReader(archive)
+        assert list(reader) == findings[:reader.read] and reader.skipped == 1
+
+        merged = os.path.join(tmpdir, "merged.json.xz")
+        assert cli.main(["merge", os.path.join(tmpdir, "findings.ndjson.bz2"), "-o", merged]) == 0
+        with lzma.open(merged, "rt", encoding="utf-8") as f:
+            assert json.load(f)["total_results"] == 20
+
+    print("  -> gzip/xz/bz2 Output, Background Compression, Append & Truncated Reads: PASSED")
+
+
+def test_ndjson_roundtrip():
+    print("[TEST] NDJSON Export, Append & Streaming Import...")
+    from dork_tool import cli
+    from dork_tool.exporter import NdjsonReader, NdjsonWriter
+    from dork_tool.ui.results_tab import ResultsTab
+
+    findings = [SearchResult(title=f"Report {i}", link=f"https://example.com/r{i}.pdf", snippet="a\nb \u00e9",
+                             category="Files", query="site:example.com filetype:pdf",
+                             timestamp="2024-01-05 10:00:00") for i in range(3)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "findings.ndjson")
+        assert ExportManager.export_ndjson(path, findings[:2])
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2 and json.loads(lines[0]) == findings[0].to_dict()
+
+        # A crash mid-write leaves a torn line; appending starts a fresh one and reading skips it.
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"title": "torn')
+        with NdjsonWriter(path, append=True) as writer:
+            assert writer.write(r for r in findings[2:]) == 1
+        reader = NdjsonReader(path)
+        assert list(reader) == findings
+        assert reader.read == 3 and reader.skipped == 1
+
+        # merge filters and deduplicates across files.
+        other = os.path.join(tmpdir, "other.jsonl")
+        ExportManager.export_ndjson(other, findings[:1] + [SearchResult("Blog", "https://example.com/blog", "", "Files")])
+        merged = os.path.join(tmpdir, "merged.ndjson")
+        assert cli.main(["merge", path, other, "--where", "filetype:pdf", "-o", merged]) == 0
+        assert list(NdjsonReader(merged)) == findings
+        assert cli.main(["merge", os.path.join(tmpdir, "missing.ndjson")]) == 2
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        tab = ResultsTab()
+        tab.import_ndjson(path)
+        while tab._pages is not None:
+            tab._load_next_page()
+        assert list(tab.all_results) == findings
+        assert tab.current_query == "Imported: findings.ndjson"
+
+    print("  -> Line-Per-Finding Writes, Torn-Line Recovery, Merge & GUI Import: PASSED")
+
+
+def test_sweep_journal_resume():
+    print("[TEST] Sweep Journal Checkpointing & Resume...")
+    from dork_tool.journal import SweepJournal
+
+    page = [SearchResult(title="Index of /", link="https://example.com/files/", snippet="", category="Directory Listings", query="site:example.com intitle:index.of")]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = SweepJournal("unit-test", label="example.com", journal_dir=tmpdir)
+        journal.record_unit("Directory Listings", "site:example.com intitle:index.of", 1, 5, page)
+        journal.close()
+
+        # Simulate a crash mid-write: the torn line must be ignored and truncated.
+        with open(journal.filepath, "ab") as f:
+            f.write(b'{"type": "unit", "query": "site:exa')
+
+        resumed = SweepJournal("unit-test", journal_dir=tmpdir)
+        assert resumed.is_resumable and resumed.completed_units == 1
+        assert resumed.has_unit("site:example.com  intitle:index.of")
+        replayed = resumed.load_unit("site:example.com intitle:index.of")
+        assert replayed and replayed[0].link == "https://example.com/files/"
+
+        resumed.record_unit("Basic Info", "site:example.com", 1, 5, [])
+        resumed.mark_finished()
+        finished = SweepJournal("unit-test", journal_dir=tmpdir)
+        assert finished.finished and not finished.is_resumable
+        assert finished.completed_units == 2
+
+        # A sweep cancelled from outside (Ctrl+C cancels the asyncio task) stays resumable.
+        import asyncio
+        from dork_tool.async_sweep import AsyncSweepEngine
+        from dork_tool.rate_limiter import AdvancedRateLimiter
+        from dork_tool.search_core import SearchClient
+
+        class FakeHttp:
+            def __init__(self):
+                self.queries = []
+
+            def get(self, url, params=None, timeout=12):
+                self.queries.append(params["q"])
+                link = f"https://example.com/{params['q']}"
+                return type("Response", (), {
+                    "status_code": 200, "headers": {},
+                    "json": lambda self: {"items": [{"title": link, "link": link}]}
+                })()
+
+        dorks = [("Files", f"q{i}") for i in range(4)]
+        limiter = AdvancedRateLimiter(daily_limit=1000, quota_file=os.path.join(tmpdir, "quota.json"),
+                                      per_second=1000, burst=100, per_minute=1000)
+
+        def sweep(http, on_results=None):
+            journal = SweepJournal("cancel-test", journal_dir=tmpdir)
+            client = SearchClient("KEY", "CX", limiter, http_session=http)
+            engine = AsyncSweepEngine(client, dorks, max_concurrency=1, journal=journal,
+                                      reuse_results=False, on_results=on_results)
+            return engine, journal
+
+        async def cancel_after_first():
+            task = asyncio.current_task()
+            engine, journal = sweep(FakeHttp(), on_results=lambda new: task.cancel())
+            await engine.run_async()
+
+        try:
+            asyncio.run(cancel_after_first())
+            assert False, "the sweep should have been cancelled"
+        except asyncio.CancelledError:
+            pass
+        interrupted = SweepJournal("cancel-test", journal_dir=tmpdir)
+        assert interrupted.is_resumable and not interrupted.finished and interrupted.completed_units == 1
+        interrupted.close()
+
+        http = FakeHttp()
+        engine, journal = sweep(http)
+        assert len(engine.run()) == 4 and http.queries == ["q1", "q2", "q3"]  # q0 replayed from the journal
+        assert SweepJournal("cancel-test", journal_dir=tmpdir).finished
+        limiter.close()
+
+    print("  -> Journal Replay, Torn-Line Recovery & Resume After Cancellation: PASSED")
+
+
+def test_key_pool_rotation():
+    print("[TEST] API Key Pool Rotation...")
+    from dork_tool.key_pool import KeyPool
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = KeyPool([("KEY_A", "cx", "a"), ("KEY_B", "cx", "b"), ("KEY_A", "cx", "dup")],
+                       daily_limit=3, quota_dir=tmpdir)
+        assert len(pool) == 2
+        assert pool.get_stats() == (0, 6, 6)
+
+        def send():
+            key = pool.checkout()
+            pool.record_request(key)
+            pool.release(key)
+            return key
+
+        # Requests always go to the key with the most headroom.
+        assert [send().label for _ in range(4)] == ["a", "b", "a", "b"]
+
+        # Checked-out keys count as spent until released.
+        key = pool.checkout()
+        assert pool.checkout() is not key
+        pool.release(key)
+        pool.release(pool.keys[1])
+
+        pool.report_failure(pool.keys[0], 403, "quota exceeded")
+        assert send() is pool.keys[1]
+        assert pool.checkout() is None
+        can_req, _ = pool.can_request()
+        assert not can_req
+
+        pool.reset()
+        assert pool.can_request()[0] and pool.get_stats() == (0, 6, 6)
+
+        # Pages are cached under the engine (cx) that answered them.
+        from dork_tool.cache import ResponseCache
+        from dork_tool.search_core import SearchClient
+
+        class EngineHttp:
+            def get(self, url, params=None, timeout=12):
+                cx = params["cx"]
+                return type("Response", (), {
+                    "status_code": 200, "headers": {},
+                    "json": lambda self: {"items": [{"title": cx, "link": f"https://{cx}.example.com/"}]}
+                })()
+
+        mixed = KeyPool([("KEY_A", "cx_a", "a"), ("KEY_B", "cx_b", "b")], daily_limit=3, quota_dir=tmpdir)
+        mixed.report_failure(mixed.keys[0], 403, "quota exceeded")
+        cache = ResponseCache(db_path=os.path.join(tmpdir, "cache.db"))
+        client = SearchClient("KEY_A", "cx_a", mixed, http_session=EngineHttp(), response_cache=cache)
+        assert client.request_page("q").results[0].title == "cx_b"
+        assert cache.get("cx_a", "q", 1, 10) is None and cache.get("cx_b", "q", 1, 10) is not None
+        assert client.cached_page("q").results[0].title == "cx_b"
+        mixed.close()  # before tmpdir goes away
+
+    print("  -> Headroom Selection, 403 Rotation & Per-Engine Cache Keys: PASSED")
+
+
+def test_rate_limiter_windows():
+    print("[TEST] Multi-Window Token-Bucket Rate Limiter...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        limiter = AdvancedRateLimiter(daily_limit=1000, quota_file=os.path.join(tmpdir, "quota.json"),
+                                      per_second=5, burst=5, per_minute=100)
+        # The burst goes out immediately, later calls are spaced by the per-second rate.
+        delays = [limiter.acquire() for _ in range(7)]
+        assert delays[:5] == [0.0] * 5
+        assert 0.15 < delays[5] < 0.25 and 0.35 < delays[6] < 0.45
+        assert not limiter.try_acquire()
+
+        minute = AdvancedRateLimiter(daily_limit=1000, quota_file=os.path.join(tmpdir, "quota2.json"),
+                                     per_second=1000, burst=1000, per_minute=100)
+        assert sum(minute.try_acquire() for _ in range(150)) == 100
+
+    print("  -> Burst, Per-Second & Per-Minute Windows: PASSED")
+
+
+def test_quota_ledger_merge():
+    print("[TEST] Write-Behind Quota Ledger...")
+    from unittest import mock
+    from dork_tool.key_pool import KeyPool
+    from dork_tool.quota_ledger import QuotaLedger
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "quota.json")
+        # Two ledgers on one file stand in for two app instances.
+        first = QuotaLedger(path, daily_limit=100, flush_every=50)
+        second = QuotaLedger(path, daily_limit=100, flush_every=50)
+        for _ in range(7):
+            first.add()
+        second.add(5)
+        assert not os.path.exists(path)  # nothing written yet
+
+        first.flush()
+        second.flush()
+        with open(path, "r", encoding="utf-8") as f:
+            assert json.load(f)["count"] == 12
+        assert second.count == 12
+        first.refresh()
+        assert first.stats() == (12, 100, 88)
+
+        # close() writes what is pending and drops the ledger from the background flusher;
+        # later increments on a closed ledger are written straight through.
+        first.add(3)
+        first.close()
+        assert first not in QuotaLedger._live and second in QuotaLedger._live
+        second.refresh()
+        assert second.count == 15
+        first.add()
+        second.refresh()
+        assert second.count == 16
+        first.close()
+        second.close()
+
+        # A pool closes the primary key's own limiter when it swaps in the shared quota.json.
+        with mock.patch.dict(os.environ, {"HOME": tmpdir, "USERPROFILE": tmpdir}):
+            pool = KeyPool.from_credentials(("KEY_A", "cx_a"), [("KEY_B", "cx_b", "b")])
+        assert pool.keys[0].limiter.quota_file.endswith("quota.json")
+        assert sum(ledger.path.startswith(tmpdir) for ledger in QuotaLedger._live) == 2
+        pool.close()
+        assert not any(ledger.path.startswith(tmpdir) for ledger in QuotaLedger._live)
+
+    print("  -> Batched Writes, Cross-Instance Delta Merge & Close: PASSED")
+
+
+def test_retry_policy_backoff():
+    print("[TEST] Retry Policy Backoff...")
+    import threading
+    from dork_tool.retry import RetryPolicy
+    from dork_tool.search_core import PageResponse
+
+    policy = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=4.0)
+    policy.start()
+    assert policy.is_retryable(PageResponse(error="429", status_code=429))
+    assert policy.is_retryable(PageResponse(error="timeout"))
+    assert not policy.is_retryable(PageResponse(error="403", status_code=403, fatal=True))
+    assert not policy.is_retryable(PageResponse(status_code=200))
+
+    assert 0 <= policy.next_delay(1) <= 1.0
+    assert policy.next_delay(2, retry_after=3.5) >= 3.5
+    assert policy.next_delay(3) is None  # attempts exhausted
+
+    deadline = RetryPolicy(base_delay=10.0, sweep_deadline=0.5)
+    deadline.start()
+    assert deadline.next_delay(1, retry_after=5.0) is None
+
+    threading.Timer(0.1, policy.cancel).start()
+    assert policy.wait(5.0) is False  # cancel() interrupts the backoff sleep
+    assert policy.next_delay(1) is None
+
+    # urllib3 must not retry responses or reads behind the policy's back.
+    from dork_tool.session import HttpSessionManager
+    http = HttpSessionManager()
+    retry = http.adapter.max_retries
+    assert retry.status == 0 and retry.read == 0 and not retry.respect_retry_after_header
+    assert retry.connect == http.max_retries and not retry.status_forcelist
+    http.close()
+
+    print("  -> Jitter, Retry-After, Attempt Cap, Deadline, Cancel & No Transport Retries: PASSED")
+
+
+def test_response_cache_expiry_and_eviction():
+    print("[TEST] Response Cache TTL, LRU Eviction & Clear...")
+    import time
+    from dork_tool.cache import ResponseCache
+
+    page = [SearchResult(title="Report", link="https://example.com/r.pdf", snippet="", category="Files", query="q")]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ResponseCache(db_path=os.path.join(tmpdir, "cache.db"), ttl_seconds=60, max_entries=2)
+
+        # Whitespace-only edits share an entry; hits are relabelled for the caller.
+        cache.put("cx", "site:example.com  ext:pdf", 1, 10, page, 42)
+        results, total = cache.get("cx", " site:example.com ext:pdf ", 1, 10, category="Manual")
+        assert total == 42 and results[0].link == page[0].link and results[0].category == "Manual"
+        assert cache.get("other_cx", "site:example.com ext:pdf", 1, 10) is None
+
+        # Expired entries miss and are deleted.
+        cache.put("cx", "stale", 1, 10, page, 1, ttl_seconds=-1)
+        assert cache.get("cx", "stale", 1, 10) is None
+        assert cache.get_stats()["entries"] == 1
+
+        # Beyond max_entries the least recently used page is evicted.
+        time.sleep(0.01)
+        cache.put("cx", "b", 1, 10, page, 1)
+        time.sleep(0.01)
+        assert cache.get("cx", "site:example.com ext:pdf", 1, 10) is not None  # now more recent than "b"
+        time.sleep(0.01)
+        cache.put("cx", "c", 1, 10, page, 1)
+        assert cache.get("cx", "b", 1, 10) is None
+        assert cache.get("cx", "c", 1, 10) is not None
+        assert cache.get("cx", "site:example.com ext:pdf", 1, 10) is not None
+        assert cache.get_stats()["entries"] == 2
+
+        # Entries persist across instances until cleared.
+        reopened = ResponseCache(db_path=cache.db_path, ttl_seconds=60, max_entries=2)
+        assert reopened.get("cx", "c", 1, 10) is not None
+        assert reopened.clear() and reopened.get_stats()["entries"] == 0
+        assert cache.get("cx", "c", 1, 10) is None
+        stats = cache.get_stats()
+        assert stats["hits"] == 4 and stats["misses"] == 4
+
+    print("  -> Query Normalization, TTL Expiry, LRU Eviction, Persistence & Clear: PASSED")
+
+
+def test_http_session_manager():
+    print("[TEST] Shared HTTP Session Pooling...")
+    from dork_tool.session import HttpSessionManager
+
+    http = HttpSessionManager(pool_size=6, max_retries=1)
+    assert http.session.get_adapter("https://www.googleapis.com/customsearch/v1") is http.adapter
+    assert http.session.get_adapter("http://example.com/") is http.adapter
+    assert http.adapter._pool_connections == http.adapter._pool_maxsize == 6
+    retry = http.adapter.max_retries
+    assert retry.total == retry.connect == 1 and retry.allowed_methods == frozenset({"GET"})
+    assert http.get_stats() == {"calls": 0, "requests_sent": 0, "connections_opened": 0, "connections_reused": 0}
+    http.close()
+
+    assert HttpSessionManager(pool_size=0).pool_size == 1
+    shared = HttpSessionManager.shared()
+    assert HttpSessionManager.shared() is shared
+    configured = HttpSessionManager.configure(pool_size=3)
+    assert configured is HttpSessionManager.shared() and configured is not shared
+    assert configured.adapter._pool_maxsize == 3
+    HttpSessionManager.configure()  # restore the defaults for later tests
+
+    print("  -> Adapter Mounts, Pool Sizing, Connect-Only Retries & Shared Instance: PASSED")
+
+
+def test_concurrent_page_fetching():
+    print("[TEST] Concurrent Page Fetching...")
+    import threading
+    import time
+    from dork_tool.rate_limiter import AdvancedRateLimiter
+    from dork_tool.search_core import SearchClient
+    from dork_tool.workers import GoogleSearchWorker
+
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+
+        def __init__(self, items):
+            self.items = items
+
+        def json(self):
+            return {"searchInformation": {"totalResults": "45"}, "items": self.items}
+
+    class FakeHttp:
+        def __init__(self):
+            self.starts = []
+            self.active = self.peak = 0
+            self.lock = threading.Lock()
+
+        def get(self, url, params=None, timeout=12):
+            with self.lock:
+                self.starts.append(params["start"])
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05 / params["start"])  # later pages answer first
+            start, num = params["start"], params["num"]
+            links = [f"https://example.com/r{i}" for i in range(start, min(start + num, 46))]
+            if start == 21:
+                links[0] = "https://EXAMPLE.com/r15/?utm_source=feed"  # shifted index repeats a result
+            with self.lock:
+                self.active -= 1
+            return FakeResponse([{"title": link, "link": link, "snippet": ""} for link in links])
+
+    limiters = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        def client(http):
+            limiter = AdvancedRateLimiter(daily_limit=1000, quota_file=os.path.join(tmpdir, "quota.json"),
+                                          per_second=1000, burst=100, per_minute=1000)
+            limiters.append(limiter)
+            return SearchClient("KEY", "CX", limiter, http_session=http)
+
+        http = FakeHttp()
+        results, total = client(http).fetch_results("q", 50, concurrency=4)
+        links = [r.link for r in results]
+        assert total == 45 and http.starts[0] == 1 and sorted(http.starts) == [1, 11, 21, 31, 41]
+        assert http.peak > 1  # pages after the first overlapped
+        assert links == [f"https://example.com/r{i}" for i in range(1, 46) if i != 21]  # in order, duplicate dropped
+
+        serial_http = FakeHttp()
+        serial, _ = client(serial_http).fetch_results("q", 50)
+        assert [r.link for r in serial] == links and serial_http.peak == 1
+
+        worker = GoogleSearchWorker("KEY", "CX", "q", num_results=30, concurrent_pages=3,
+                                    rate_limiter=client(None).rate_limiter, http_session=FakeHttp())
+        received = []
+        worker.result_ready.connect(lambda rs, total, query: received.append(rs))
+        worker.run()
+        assert [r.link for r in received[0]] == [f"https://example.com/r{i}" for i in range(1, 31) if i != 21]
+        # cancel() cuts a long rate-limit wait short, and the cancelled page is not reported.
+        slow = client(FakeHttp())
+        slow.rate_limiter.acquire = lambda: 30.0
+        errors = []
+        threading.Timer(0.1, slow.cancel).start()
+        began = time.monotonic()
+        assert slow.fetch_results("q", 20, on_error=errors.append) == ([], 0)
+        assert time.monotonic() - began < 5 and errors == [] and slow.http.starts == []
+
+        # A 200 that is not JSON (a proxy or captive portal page) is reported, not raised.
+        class PortalHttp:
+            def get(self, url, params=None, timeout=12):
+                def not_json():
+                    raise ValueError("Expecting value: line 1 column 1 (char 0)")
+                return type("Response", (), {"status_code": 200, "headers": {}, "json": staticmethod(not_json)})()
+
+        results, _ = client(PortalHttp()).fetch_results("q", 10, on_error=errors.append)
+        assert results == [] and len(errors) == 1 and errors[0].startswith("Invalid API response")
+
+        # Write the counted sends now, not at exit after tmpdir is gone.
+        for limiter in limiters:
+            limiter.close()
+
+    print("  -> Ordered Reassembly, Overlap, Cross-Page Dedup, Worker Wiring, Cancellable Waits & Bad Bodies: PASSED")
+
+
+def test_async_batch_worker():
+    print("[TEST] Async Batch Sweep Worker...")
+    import threading
+    from dork_tool.rate_limiter import AdvancedRateLimiter
+    from dork_tool.workers import AsyncDorkBatchWorker
+
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+
+        def __init__(self, query):
+            self.query = query
+
+        def json(self):
+            items = [{"title": self.query, "link": f"https://example.com/{self.query}"},
+                     {"title": "shared", "link": "https://example.com/shared"}]
+            return {"searchInformation": {"totalResults": "2"}, "items": items}
+
+    class FakeHttp:
+        def __init__(self):
+            self.queries = []
+            self.lock = threading.Lock()
+
+        def get(self, url, params=None, timeout=12):
+            with self.lock:
+                self.queries.append(params["q"])
+            return FakeResponse(params["q"])
+
+    dorks = [("Files", f"q{i}") for i in range(6)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        limiter = AdvancedRateLimiter(daily_limit=1000, quota_file=os.path.join(tmpdir, "quota.json"),
+                                      per_second=1000, burst=100, per_minute=1000)
+
+        def make_worker(http, concurrency):
+            worker = AsyncDorkBatchWorker("KEY", "CX", dorks, rate_limiter=limiter, http_session=http,
+                                          reuse_results=False, max_concurrency=concurrency)
+            events = {"started": [], "added": [], "finished": []}
+            worker.category_started.connect(lambda cat, query, idx, total: events["started"].append((query, idx, total)))
+            worker.results_added.connect(lambda new: events["added"].append([r.title for r in new]))
+            worker.batch_finished.connect(events["finished"].append)
+            return worker, events
+
+        # One dork at a time: dorks start and deliver in list order, the shared link only once.
+        http = FakeHttp()
+        worker, events = make_worker(http, 1)
+        worker.run()
+        assert http.queries == [q for _, q in dorks]
+        assert events["started"] == [(q, i, 6) for i, (_, q) in enumerate(dorks, start=1)]
+        assert events["added"][0] == ["q0", "shared"] and events["added"][1:] == [[q] for _, q in dorks[1:]]
+        assert len(events["finished"]) == 1 and len(events["finished"][0]) == 7
+
+        # Several in flight: every dork still runs once.
+        http = FakeHttp()
+        worker, events = make_worker(http, 3)
+        worker.run()
+        assert sorted(http.queries) == [q for _, q in dorks] and len(events["finished"][0]) == 7
+
+        # Cancelling mid-sweep stops scheduling and still reports what was found.
+        http = FakeHttp()
+        worker, events = make_worker(http, 1)
+        worker.category_started.connect(lambda cat, query, idx, total: worker.cancel() if idx == 2 else None)
+        worker.run()
+        assert http.queries == ["q0"] and [q for q, _, _ in events["started"]] == ["q0", "q1"]
+        assert len(events["finished"]) == 1 and [r.title for r in events["finished"][0]] == ["q0", "shared"]
+        assert limiter.get_stats()[0] == 13
+        # Off the background flusher before tmpdir goes away.
+        limiter.close()
+
+    print("  -> Ordered Dispatch, Cross-Dork Dedup, Bounded Concurrency & Cancellation: PASSED")
+
+
+def test_results_tab_delta_streaming():
+    print("[TEST] Results Tab Delta Streaming...")
+    from dork_tool.ui.results_tab import ResultsTab
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tab = ResultsTab()
+    tab.set_results([], query="Target: example.com")
+
+    def finding(i, category):
+        return SearchResult(title=f"Finding {i}", link=f"https://example.com/{i}", snippet="", category=category, query=f"q{i}")
+
+    # Deltas are buffered until the frame tick (or an explicit flush).
+    tab.queue_results([finding(1, "Files"), finding(2, "Files")])
+    tab.queue_results([finding(3, "Logins"), finding(1, "Files")])
+    assert tab.all_results == []
+    tab.flush_pending()
+    assert len(tab.all_results) == 3
+    assert tab.category_counts == {"Files": 2, "Logins": 1}
+    assert sorted(b.text() for b in tab.chips_group.buttons()) == ["All (3)", "Files (2)", "Logins (1)"]
+
+    tab.select_category_chip("Files")
+    tab.append_results([finding(4, "Files"), finding(5, "Logins")])
+    assert [r.link for r in tab.filtered_results] == [f"https://example.com/{i}" for i in (1, 2, 4)]
+    assert tab.results_count_label.text() == "3 of 5 Results"
+
+    print("  -> Frame Coalescing, Incremental Chips & Filtered View: PASSED")
+
+
+def test_results_table_model():
+    print("[TEST] Results Table Model (Sort, Filter, Pages)...")
+    from PySide6.QtCore import QPersistentModelIndex, Qt
+    from dork_tool.ui.results_model import ResultsTableModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = ResultsTableModel()
+    model.set_results([
+        SearchResult(title=t, link=f"https://example.com/{t}", snippet="", category=c, query="q")
+        for t, c in (("beta", "Files"), ("alpha", "Logins"), ("gamma", "Files"))
+    ])
+    assert model.rowCount() == 3 and model.columnCount() == 5
+    assert model.data(model.index(0, 1)) == "beta"
+
+    model.sort(1, Qt.AscendingOrder)
+    assert [r.title for r in model.rows] == ["alpha", "beta", "gamma"]
+    model.append([SearchResult(title="aardvark", link="https://example.com/a", snippet="", category="Files", query="q")])
+    assert model.result_at(0).title == "aardvark"  # appends keep the active sort
+
+    model.set_filter(lambda r: r.category == "Files")
+    assert [r.title for r in model.rows] == ["aardvark", "beta", "gamma"]
+    model.set_page(2, 2)
+    assert model.rowCount() == 1 and model.data(model.index(0, 0)) == "3"
+
+    # Sorted appends are merged in: each run of new rows is inserted where it lands.
+    def result(title):
+        return SearchResult(title=title, link=f"https://example.com/{title}", snippet="", category="Files", query="q")
+
+    model = ResultsTableModel()
+    model.set_results([result(t) for t in ("d", "b", "f")])
+    model.sort(1, Qt.AscendingOrder)
+    tracked = QPersistentModelIndex(model.index(1, 1))  # "d"
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    model.append([result(t) for t in ("e", "a", "c", "d")])
+    assert [r.title for r in model.rows] == ["a", "b", "c", "d", "d", "e", "f"]
+    assert model.rows.take([3, 4]).column("link") == ["https://example.com/d"] * 2
+    assert model._ids[3:5] == [0, 6]  # ties keep arrival order, as a full sort would
+    assert inserted == [(0, 0), (2, 2), (4, 5)] and tracked.row() == 3
+
+    model.sort(1, Qt.DescendingOrder)
+    model.append([result("cc"), result("g")])
+    assert [r.title for r in model.rows] == ["g", "f", "e", "d", "d", "cc", "c", "b", "a"]
+
+    # A batch scattered over many runs is appended once and moved by a single relayout.
+    model.set_results([result(f"r{n:03}") for n in range(0, 200, 2)])
+    model.sort(1, Qt.AscendingOrder)
+    del inserted[:]
+    model.append([result(f"r{n:03}") for n in range(199, 0, -2)])
+    assert inserted == [(100, 199)] and [r.title for r in model.rows] == [f"r{n:03}" for n in range(200)]
+
+    print("  -> Model Sorting, Sorted Merge on Append, Filtering & Page Windows: PASSED")
+
+
+def test_result_search_index():
+    print("[TEST] Result Search Index & Debounced Filter...")
+    from dork_tool.search_index import ResultSearchIndex
+    from dork_tool.ui.results_tab import ResultsTab
+
+    index = ResultSearchIndex()
+    index.add([
+        SearchResult(title="Admin Login", link="https://a.example.com/admin.php", snippet="Panel", category="Logins", query="q"),
+        SearchResult(title="Backup", link="https://b.example.com/db.sql", snippet="SQL dump of users", category="Files", query="q"),
+        SearchResult(title="Readme", link="https://c.example.com/", snippet="nothing here", category="Files", query="q"),
+    ])
+    assert index.search("ADMIN") == [0]
+    assert index.search("dmin.p") == [0]          # substrings inside tokens still match
+    assert index.search("sql dump") == [1]
+    assert index.search("e", category="Files") == [1, 2]
+    assert index.search("files") == [1, 2]        # category text is searchable
+    assert index.search("login.example") == []    # a match never spans two fields
+    assert index.search("example", rows=[0, 2]) == [0, 2]
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tab = ResultsTab()
+    tab.set_results([
+        SearchResult(title=f"Result {i}", link=f"https://example.com/{i}", snippet="", category="Files", query="q")
+        for i in range(20)
+    ])
+    tab.filter_input.setText("result 1")
+    assert len(tab.filtered_results) == 20        # debounced: nothing filtered yet
+    tab.apply_filter()
+    assert len(tab.filtered_results) == 11
+    tab.filter_input.setText("result 12")
+    tab.apply_filter()
+    assert [r.title for r in tab.filtered_results] == ["Result 12"]
+    tab.append_results([SearchResult(title="Result 120", link="https://example.com/120", snippet="", category="Files", query="q")])
+    assert [r.title for r in tab.filtered_results] == ["Result 12", "Result 120"]
+
+    print("  -> Token Index, Field Boundaries, Refinement & Debounce: PASSED")
+
+
+def test_result_query_language():
+    print("[TEST] Field-Scoped Local Query Language...")
+    from dork_tool.search_index import ResultSearchIndex
+    from dork_tool.result_query import ResultQuery
+
+    results = [
+        SearchResult(title="Admin Login", link="https://www.example.com/admin/login.php", snippet="Sign in panel", category="Logins"),
+        SearchResult(title="Quarterly Report", link="https://files.example.com/docs/q1.pdf", snippet="confidential internal report", category="Files"),
+        SearchResult(title="Index of /backup", link="http://other.org/backup/", snippet="db.sql dump.tar.gz", category="Files"),
+        SearchResult(title="Login page", link="https://linkedin.com/in/someone", snippet="profile login", category="Social"),
+    ]
+    index = ResultSearchIndex()
+    index.add(results)
+    cases = {
+        "intitle:login": [0, 3],
+        "site:example.com": [0, 1],
+        "site:linkedin.com/in": [3],
+        "site:*.example.com": [0, 1],  # the tool's own subdomain dorks
+        "site:*.example.com/docs ext:pdf": [1],
+        "site:*.linkedin.com": [],
+        "filetype:pdf OR ext:php": [0, 1],
+        "login -site:example.com": [3],
+        'intitle:"index of" | intext:confidential': [1, 2],
+        "(filetype:pdf OR filetype:php) -intitle:admin": [1],
+        "allintitle:login page": [3],
+        "report confidential": [1],
+    }
+    for text, expected in cases.items():
+        query = ResultQuery(text)
+        assert query.select(index) == expected, text
+        assert [i for i, r in enumerate(results) if query.matches(r)] == expected, text
+    assert ResultQuery("site:example.com").select(index, category="Files") == [1]
+    assert ResultQuery("(").is_empty and ResultQuery('"index').select(index) == [2]  # lenient parsing
+
+    print("  -> Operators, Exclusions, OR Groups & Index Lookup: PASSED")
+
+
+def test_local_dork_evaluator():
+    print("[TEST] Local Evaluation of Narrower Dorks...")
+    from dork_tool.local_eval import LocalDorkEvaluator
+
+    broad = [
+        SearchResult(title="Admin Login", link="https://www.example.com/admin/login.php", snippet="Sign in", category="Files"),
+        SearchResult(title="Quarterly Report", link="https://files.example.com/docs/q1.pdf", snippet="report", category="Files"),
+        SearchResult(title="Guide", link="https://example.com/guide.pdf?v=2", snippet="setup guide", category="Files"),
+    ]
+    evaluator = LocalDorkEvaluator(num=10)
+    assert evaluator.refines("site:example.com ext:pdf", "site:example.com")
+    assert not evaluator.refines("site:example.com", "site:example.com")
+    assert evaluator.answer("site:example.com filetype:pdf") is None  # nothing recorded yet
+
+    evaluator.record("site:example.com", broad, total_available=3)
+    pdfs = evaluator.answer("site:example.com filetype:pdf", "Documents")
+    assert [r.link for r in pdfs] == [broad[1].link, broad[2].link]
+    assert {r.category for r in pdfs} == {"Documents"} and pdfs[0].query == "site:example.com filetype:pdf"
+    assert [r.link for r in evaluator.answer("site:example.com -site:www.example.com")] == [broad[1].link, broad[2].link]
+    assert evaluator.answer("site:example.com password") is None  # a missing word may still be on the page
+    assert evaluator.answered == 2
+
+    # A full page with more results behind it is not a complete set.
+    evaluator = LocalDorkEvaluator(num=3)
+    evaluator.record("site:example.com", broad, total_available=40)
+    assert evaluator.answer("site:example.com filetype:pdf") is None
+
+    dorks = [("Files", "site:a.com ext:pdf"), ("Logins", "inurl:login"), ("Files", "site:a.com")]
+    assert LocalDorkEvaluator.broad_first(dorks) == [dorks[2], dorks[0], dorks[1]]
+
+    print("  -> Completeness, Three-Valued Decisions & Broad-First Ordering: PASSED")
+
+
+def test_findings_store():
+    print("[TEST] Persistent Findings Store...")
+    from dork_tool.findings_store import FindingsStore
+    from dork_tool.ui.results_tab import ResultsTab
+
+    findings = [
+        SearchResult(title="Login", link="https://www.example.com/login", snippet="", category="Logins", query="q1", timestamp="2024-01-05 10:00:00"),
+        SearchResult(title="Report", link="https://files.example.com/r.pdf", snippet="", category="Files", query="q2", timestamp="2024-02-10 12:00:00"),
+        SearchResult(title="Other", link="http://notexample.com/", snippet="", category="Files", query="q2", timestamp="2024-03-01 08:00:00"),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "findings.db")
+        store = FindingsStore(db_path, batch_size=2)
+        store.queue(findings[:1])
+        assert store.count() == 0  # buffered until the batch fills
+        store.queue(findings[1:] + findings[:1])
+        store.flush()
+        assert store.count() == 3  # duplicate (link, query, category) ignored
+
+        reopened = FindingsStore(db_path)
+        assert reopened.count(host="example.com") == 2
+        assert [r.title for _, r in reopened.page(category="Files")] == ["Report", "Other"]
+        assert reopened.count(query="q2", since="2024-02-01", until="2024-03-01") == 1
+        assert [len(p) for p in reopened.iter_pages(limit=2)] == [2, 1]
+        assert reopened.category_counts() == {"Files": 2, "Logins": 1}
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        tab = ResultsTab(findings_store=reopened)
+        tab.load_stored(host="example.com")
+        while tab._pages is not None:
+            tab._load_next_page()
+        assert [r.title for r in tab.all_results] == ["Login", "Report"]
+        assert tab.category_counts == {"Logins": 1, "Files": 1}
+        store.close()
+        reopened.close()
+
+    print("  -> Batched Writes, Indexed Filters, Keyset Paging & Reload: PASSED")
+
+
+def test_findings_full_text_search():
+    print("[TEST] Full-Text Search over Stored Findings...")
+    from dork_tool.findings_store import FindingsStore
+    from dork_tool.ui.results_tab import ResultsTab
+
+    findings = [
+        SearchResult(title="Leaked config file", link="https://dev.example.com/config.php", snippet="database password in config", category="Files", query="q1"),
+        SearchResult(title="Team page", link="https://example.com/team", snippet="our config management team", category="People", query="q2"),
+        SearchResult(title="Configuration guide", link="https://docs.other.org/guide.pdf", snippet="how to configure the server", category="Files", query="q3"),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = FindingsStore(os.path.join(tmpdir, "findings.db"))
+        store.add(findings)
+        assert store.fts_enabled
+        titles = lambda text: [r.title for r in store.search(text)]
+        assert titles("config") == ["Leaked config file", "Team page"]  # title hits rank first
+        assert titles("config*") == ["Leaked config file", "Configuration guide", "Team page"]
+        assert titles("intitle:config") == ["Leaked config file"]
+        assert titles("config -password") == ["Team page"]
+        assert titles("config* site:example.com -intitle:leaked") == ["Team page"]
+        assert titles("filetype:pdf") == ["Configuration guide"]  # no text terms: scanned, newest first
+        assert [r.title for r in store.search("config", category="People")] == ["Team page"]
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        tab = ResultsTab(findings_store=store)
+        assert tab.search_stored("password OR server") == 2
+        assert [r.title for r in tab.all_results] == ["Leaked config file", "Configuration guide"]
+        store.close()
+
+    print("  -> BM25 Ranking, Prefixes, Exclusions & Operator Post-Filters: PASSED")
+
+
+def test_url_canonical_dedup():
+    print("[TEST] URL Canonicalization & Hashed Ingest Dedup...")
+    from dork_tool.dedup import canonical_url
+    from dork_tool.ui.results_tab import ResultsTab
+
+    assert canonical_url("HTTPS://WWW.Example.COM:443/Docs/?utm_source=x&id=3&fbclid=y#top") == "https://www.example.com/Docs?id=3"
+    assert canonical_url("http://example.com:8080") == "http://example.com:8080/"
+    assert canonical_url("http://example.com/a/?gclid=1") == canonical_url("http://EXAMPLE.com:80/a")
+    assert canonical_url("No Link") == "No Link"
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tab = ResultsTab()
+    tab.set_results([], query="Target: example.com")
+    tab.append_results([
+        SearchResult(title="A", link="https://example.com/login/", snippet="", category="Logins", query="q"),
+        SearchResult(title="A", link="https://EXAMPLE.com/login?utm_medium=ad#form", snippet="", category="Logins", query="q"),
+        SearchResult(title="A", link="https://example.com/login", snippet="", category="Files", query="q"),
+    ])
+    tab.append_results([SearchResult(title="A", link="https://example.com:443/login", snippet="", category="Logins", query="q")])
+    assert [r.link for r in tab.all_results] == ["https://example.com/login/", "https://example.com/login"]
+    assert tab.category_counts == {"Logins": 1, "Files": 1}
+
+    print("  -> Host/Port/Fragment/Tracking Normalization & Near-Duplicate Rejection: PASSED")
+
+
+def test_near_duplicate_grouping():
+    print("[TEST] Near-Duplicate Clustering & Collapsible Groups...")
+    from dork_tool.near_dup import NearDuplicateClusterer
+    from dork_tool.ui.results_tab import ResultsTab
+
+    listing = "Name Last modified Size Description Parent Directory backup.sql 2023-01-01 dump.tar.gz config.bak"
+    def mirror(i, extra=""):
+        return SearchResult(title="Index of /files", link=f"https://m{i}.example.com/files/", snippet=listing + extra, category="Dirs", query="q")
+    texts = ["quarterly revenue figures broken down by sales region and product line",
+             "staff onboarding checklist with laptop setup steps and badge request form"]
+    def unique(i):
+        return SearchResult(title=f"Report {i}", link=f"https://u.com/{i}", snippet=texts[i], category="Files", query="q")
+
+    clusters = NearDuplicateClusterer()
+    rows = [mirror(0), unique(0), mirror(1, " readme.txt"), unique(1)]
+    clusters.add(rows)
+    assert [clusters.cluster_of(i) for i in range(len(rows))] == [0, 1, 0, 2] and clusters.sizes == [2, 1, 1]
+    assert NearDuplicateClusterer.signature("No Title") is None  # too little text to compare
+
+    # Borderline pair (about a third of the words shared): separate, and the same in every process.
+    import subprocess
+    probe = (
+        "from dork_tool.near_dup import NearDuplicateClusterer as C\n"
+        "from dork_tool.models import SearchResult as S\n"
+        "c = C()\n"
+        "c.add([S('Report 0', 'https://u.com/0', 'annual audit findings for the northern warehouse include "
+        "inventory gaps missing invoices and delayed shipments'),\n"
+        "       S('Report 1', 'https://u.com/1', 'annual audit findings for the northern warehouse cover "
+        "staff overtime payroll errors and unused vehicle leases')])\n"
+        "print(c.sizes)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for seed in ("1", "12", "4242"):
+        out = subprocess.run([sys.executable, "-c", probe], cwd=root, capture_output=True, text=True,
+                             env={**os.environ, "PYTHONHASHSEED": seed}, check=True).stdout
+        assert out.strip() == "[1, 1]", (seed, out)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tab = ResultsTab()
+    tab.set_results([mirror(0), unique(0), mirror(1)])
+    tab.group_similar_check.setChecked(True)
+    model = tab.model
+    labels = lambda: [model.data(model.index(r, 0)) for r in range(model.rowCount())]
+    assert labels() == ["1 [+1]", "2"] and tab.results_count_label.text() == "3 of 3 Results (2 groups)"
+
+    tab.append_results([mirror(2), unique(1)])  # streamed rows join their group or add one
+    assert labels() == ["1 [+2]", "2", "3"]
+    assert model.toggle_group(0) and labels() == ["1 [-2]", "   2", "   3", "4", "5"]
+    assert model.toggle_group(0) and labels() == ["1 [+2]", "2", "3"]
+    assert not model.toggle_group(1)
+    assert len(tab.filtered_results) == 5  # exports still see every row
+
+    tab.group_similar_check.setChecked(False)
+    assert model.rowCount() == 5
+
+    print("  -> MinHash/LSH Clusters, Streaming Appends & Expand/Collapse: PASSED")
+
+
+def test_compact_search_result():
+    print("[TEST] Compact Slotted SearchResult...")
+    a = SearchResult(title="A", link="https://a.com", snippet="", category="Files", query=json.loads('"site:a.com ext:pdf"'))
+    b = SearchResult(title="B", link="https://b.com", snippet="", category="Files", query=json.loads('"site:a.com ext:pdf"'))
+    assert not hasattr(a, "__dict__")
+    assert a.query is b.query  # interned: every result of a dork shares one string
+    assert isinstance(a.epoch, float) and re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", a.timestamp)
+
+    data = {"title": "T", "link": "https://t.com", "snippet": "s", "category": "Logins",
+            "query": "q", "timestamp": "2024-01-05 10:00:00"}
+    r = SearchResult.from_dict(data)
+    assert r.to_dict() == data and r == SearchResult.from_dict(dict(data)) and r != a
+    assert SearchResult.from_dict({"timestamp": ""}).timestamp  # missing time falls back to now
+    r.query = "changed"
+    assert r.query == "changed" and r.to_dict()["query"] == "changed"
+
+    print("  -> Slots, Interned Strings, Lazy Timestamps & Dict Round-Trip: PASSED")
+
+
+def test_columnar_result_container():
+    print("[TEST] Columnar ResultColumns Container...")
+    from dork_tool.columns import ResultColumns
+    from dork_tool.ui.results_tab import ResultsTab
+
+    items = [
+        SearchResult(title="Login", link="https://www.example.com/login", snippet="a", category="Logins", query="q1", timestamp="2024-01-05 10:00:00"),
+        SearchResult(title="Report", link="https://files.example.com/r.pdf", snippet="b", category="Files", query="q2", timestamp="2024-01-05 10:00:00"),
+        SearchResult(title="Other", link="http://notexample.com/", snippet="c", category="Files", query="q1", timestamp="2024-03-01 08:00:00"),
+    ]
+    cols = ResultColumns(items)
+    assert len(cols) == 3 and cols == items and cols[-1] == items[2] and list(cols) == items
+    assert cols.category_counts() == {"Files": 2, "Logins": 1}
+
+    assert [r.title for r in cols.where(category="Files")] == ["Report", "Other"]
+    assert [r.title for r in cols.where(host="example.com")] == ["Login", "Report"]  # subdomains, not lookalikes
+    assert [r.title for r in cols.where(category="Files", query=["q1", "q9"])] == ["Other"]
+    assert cols.mask(query="q1") == b"\x01\x00\x01"
+
+    page = cols[1:]  # a view over the same columns
+    assert len(page) == 2 and page[0] == items[1] and page.category_counts() == {"Files": 2}
+    assert [r.title for r in page.where(query="q1")] == ["Other"]
+    try:
+        page.append(items[0])
+        assert False, "views are read-only"
+    except TypeError:
+        pass
+    cols.append(SearchResult(title="New", link="https://n.com", snippet="", category="Logins", query="q3"))
+    assert len(cols) == 4 and len(page) == 2 and cols.category_counts()["Logins"] == 2
+
+    # Epoch timestamps are stored as floats and only formatted when a row or column is read.
+    from dork_tool import models
+    models._format_epoch.cache_clear()
+    fresh = ResultColumns([SearchResult(title="T", link="https://t.com", snippet="", timestamp=1700000000.5)])
+    assert models._format_epoch.cache_info().currsize == 0
+    assert fresh[0].stamp == 1700000000.5 and models._format_epoch.cache_info().currsize == 0
+    formatted = models.format_timestamp(1700000000.5)
+    assert fresh.row(0)[5] == fresh.column("timestamp")[0] == fresh[0].timestamp == formatted
+    assert cols.column("timestamp")[:3] == [r.timestamp for r in items]  # loaded strings kept as given
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    tab = ResultsTab()
+    tab.set_results(items)
+    assert isinstance(tab.all_results, ResultColumns) and tab.category_counts == {"Files": 2, "Logins": 1}
+    tab.select_category_chip("Files")
+    assert [r.title for r in tab.filtered_results] == ["Report", "Other"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.json")
+        assert ExportManager.export_json(path, tab.filtered_results)
+        with open(path, encoding="utf-8") as f:
+            assert [d["title"] for d in json.load(f)["results"]] == ["Report", "Other"]
+
+    print("  -> Dictionary-Encoded Columns, Lazy Epoch Timestamps, Code Masks, Views & Drop-In Use: PASSED")
+
+
 def main():
     print("==================================================")
     print(" Running PySide6 + Visual Form & Security Tests   ")
     print("==================================================")
     test_no_emojis()
     test_multi_target_detection_and_generation()
+    test_bulk_dork_generator()
     test_visual_form_builder()
     test_qss_stylesheets()
+    test_cli_dorks_and_search()
     test_exports_and_csv_injection()
+    test_streaming_exporters()
+    test_sweep_journal_resume()
+    test_key_pool_rotation()
+    test_rate_limiter_windows()
+    test_quota_ledger_merge()
+    test_retry_policy_backoff()
+    test_response_cache_expiry_and_eviction()
+    test_http_session_manager()
+    test_concurrent_page_fetching()
+    test_async_batch_worker()
+    test_results_tab_delta_streaming()
+    test_results_table_model()
+    test_result_search_index()
+    test_result_query_language()
+    test_local_dork_evaluator()
+    test_findings_store()
+    test_findings_full_text_search()
+    test_url_canonical_dedup()
+    test_near_duplicate_grouping()
+    test_compact_search_result()
+    test_columnar_result_container()
+    test_ndjson_roundtrip()
+    test_compressed_exports()
     print("==================================================")
     print(" ALL TESTS PASSED SUCCESSFULLY!                  ")
     print("==================================================")